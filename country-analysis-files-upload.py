@@ -1,12 +1,27 @@
 import os
+import re
 import sys
 import csv
+import datetime
+import json
+import time
 import argparse
+import bisect
+import hashlib
+import io
+import itertools
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import pymysql
 
+try:
+    import resource  # peak RSS; not available on Windows
+except ImportError:
+    resource = None
+
 # ---------------------- CONFIG ----------------------
 # Default DB connection values – override with CLI flags if needed
 DEFAULT_DB_HOST = "localhost"
@@ -57,6 +72,95 @@ MASTER_BASE_FILES = {
 
 ALLOWED_FILE_SUFFIXES = {".csv", ".ros"}
 
+# Type inference (--infer-types): rows sampled from the top of each file
+DEFAULT_TYPE_SAMPLE_ROWS = 5000
+INT_TYPES = [("SMALLINT", -(2**15), 2**15 - 1), ("INT", -(2**31), 2**31 - 1), ("BIGINT", -(2**63), 2**63 - 1)]
+INT_RE = re.compile(r"-?(0|[1-9][0-9]*)$")  # leading zeros (e.g. "007") stay strings
+DEC_RE = re.compile(r"-?([0-9]*)\.([0-9]+)$")
+DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})$")
+MAX_ROW_BYTES = 60000  # stay under InnoDB's 65,535 byte row limit
+# MySQL warnings that mean a value did not fit its column during LOAD DATA
+OVERFLOW_WARNINGS = {1264, 1265, 1292, 1366, 1406}
+
+# Key columns indexed after each load, using the same candidate names
+# country-main-analysis.py picks for joins / GROUP BYs (lowercased, as
+# normalize_column_name produces them).
+INDEX_KEY_CANDIDATES = [
+    ("player", ["playerid", "player_id", "retroid", "id"]),
+    ("game", ["gid", "game_id", "gameid"]),
+    ("year", ["yearid", "year", "season", "yr"]),
+    ("team", ["teamid", "team", "team_id"]),
+]
+TEXT_INDEX_PREFIX = 32  # prefix length for indexing TEXT columns
+
+# Optional table_index columns: name -> column definition
+TABLE_INDEX_EXTRA_COLUMNS = {
+    "source_csv": "VARCHAR(512) NULL",
+    "indexes": "VARCHAR(512) NULL",
+    "source_size": "BIGINT NULL",
+    "source_mtime": "DOUBLE NULL",
+    "source_hash": "VARCHAR(64) NULL",
+    "load_metrics": "TEXT NULL",
+    "last_loaded": "TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP",
+}
+
+HASH_CHUNK = 1 << 20
+
+# Full reloads build `__new__<table>` and swap it in with RENAME TABLE.
+# Prefixes (not suffixes) so the analysis side's `roster%`/`bio%`/`stg_%`
+# LIKE scans never pick up a shadow or a leftover from a crashed run.
+SHADOW_PREFIX = "__new__"
+OLD_PREFIX = "__old__"
+MAX_TABLE_NAME = 64
+
+# --roster-mode single: every roster file goes into one `<folder>-all` table
+ROSTER_FOLDERS = {"roster", "rosters"}
+ROSTER_TABLE_BASE = "all"
+ROSTER_COLUMNS = [
+    ("id", "VARCHAR(16)"),
+    ("lastname", "VARCHAR(64)"),
+    ("firstname", "VARCHAR(64)"),
+    ("bats", "CHAR(1)"),
+    ("throws", "CHAR(1)"),
+    ("ros_team", "VARCHAR(8)"),  # team column inside the file
+    ("pos", "VARCHAR(8)"),
+]
+# Header names (normalized) that map onto ROSTER_COLUMNS
+ROSTER_HEADER_ALIASES = {
+    "id": "id", "playerid": "id", "player_id": "id", "retroid": "id",
+    "lastname": "lastname", "last": "lastname", "last_name": "lastname",
+    "firstname": "firstname", "first": "firstname", "first_name": "firstname", "usename": "firstname",
+    "bats": "bats", "throws": "throws",
+    "team": "ros_team", "teamid": "ros_team", "team_id": "ros_team",
+    "pos": "pos", "position": "pos",
+}
+ROSTER_FILE_RE = re.compile(r"^([A-Za-z0-9]{3})_?(\d{4})$")  # BOS1916, nyy_2024
+ROSTER_BATCH_ROWS = 5000
+ROSTER_INDEXES = ["idx_team_year(team,year)", "idx_player(id)"]
+
+# Per-table load metrics (JSON lines) and live progress
+DEFAULT_METRICS_LOG = MAINFILES_DIR / "load_metrics.jsonl"
+BATCH_LATENCY_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 5000)
+PROGRESS_INTERVAL_TTY = 1.0
+PROGRESS_INTERVAL_LOG = 10.0
+
+# executemany batch sizing: start at INITIAL_BATCH_BYTES of row data per
+# statement, grow while batches return quickly, shrink when they are slow,
+# and never exceed half the server's max_allowed_packet.
+INITIAL_BATCH_BYTES = 1 << 20
+MIN_BATCH_BYTES = 64 << 10
+MAX_BATCH_BYTES = 32 << 20
+FAST_BATCH_SECONDS = 0.25
+SLOW_BATCH_SECONDS = 2.0
+MIN_BATCH_ROWS = 50
+MAX_BATCH_ROWS = 100_000
+DEFAULT_MAX_ALLOWED_PACKET = 4 << 20  # MySQL 5.7 default, if the server wasn't asked
+
+# --parse-procs: large files are split into byte ranges on line boundaries
+# and parsed by worker processes while one connection does the INSERTs.
+PARSE_CHUNK_BYTES = 16 << 20
+PARALLEL_PARSE_MIN_BYTES = 64 << 20
+
 
 # ---------------------- HELPERS ----------------------
 
@@ -77,7 +181,14 @@ def connect_db(args) -> pymysql.connections.Connection:
         database=args.database,
         charset="utf8mb4",
         autocommit=False,
+        # LOAD DATA LOCAL INFILE must be enabled on the client side too
+        local_infile=getattr(args, "bulk_load", False),
     )
+    # Batch sizing keeps INSERT statements under the server's packet limit
+    with conn.cursor() as cur:
+        cur.execute("SELECT @@max_allowed_packet")
+        conn.server_max_allowed_packet = int(cur.fetchone()[0])
+    conn.max_allowed_packet = max(conn.max_allowed_packet, conn.server_max_allowed_packet)
     return conn
 
 
@@ -101,7 +212,243 @@ def normalize_column_name(raw_name: str) -> str:
     return cleaned
 
 
-def build_table_schema(header: List[str]) -> List[Tuple[str, str]]:
+def is_date(v: str) -> bool:
+    """YYYY-MM-DD that is a real calendar date (strict mode rejects 2024-13-45)."""
+    m = DATE_RE.match(v)
+    if not m:
+        return False
+    try:
+        datetime.date(*(int(g) for g in m.groups()))
+    except ValueError:
+        return False
+    return True
+
+
+class ColumnProfile:
+    """Running summary of one CSV column, mapped to the narrowest SQL type.
+
+    kind moves one way only: None (all empty) -> int -> decimal -> str,
+    or None -> date -> str. Empty strings are ignored here and loaded
+    as NULL into typed columns.
+    """
+
+    def __init__(self) -> None:
+        self.kind: Optional[str] = None
+        self.lo = 0
+        self.hi = 0
+        self.int_digits = 0
+        self.scale = 0
+        self.min_len: Optional[int] = None
+        self.max_len = 0
+        self.sql_type = "VARCHAR(64)"
+        self._cap: Tuple = ()
+
+    @property
+    def typed(self) -> bool:
+        return self.kind in ("int", "decimal", "date")
+
+    def observe(self, v: str) -> None:
+        if not v:
+            return
+        n = len(v)
+        self.max_len = max(self.max_len, n)
+        self.min_len = n if self.min_len is None else min(self.min_len, n)
+        if self.kind == "str":
+            return
+        if INT_RE.match(v):
+            kind = "int"
+        elif DEC_RE.match(v):
+            kind = "decimal"
+        elif is_date(v):
+            kind = "date"
+        else:
+            kind = "str"
+
+        if self.kind is None or self.kind == kind:
+            merged = kind
+        elif {self.kind, kind} == {"int", "decimal"}:
+            merged = "decimal"
+        else:
+            merged = "str"
+
+        if kind == "int":
+            i = int(v)
+            self.lo, self.hi = min(self.lo, i), max(self.hi, i)
+            self.int_digits = max(self.int_digits, len(str(abs(i))))
+        elif kind == "decimal":
+            m = DEC_RE.match(v)
+            self.int_digits = max(self.int_digits, len(m.group(1).lstrip("0")) or 1)
+            self.scale = max(self.scale, len(m.group(2)))
+        self.kind = merged
+
+    def choose_type(self) -> str:
+        """Pick the SQL type for what has been observed and remember its limits."""
+        if self.kind == "int":
+            for name, lo, hi in INT_TYPES:
+                if lo <= self.lo and self.hi <= hi:
+                    self._set("int", name, (lo, hi))
+                    return self.sql_type
+            self.kind = "decimal"
+        if self.kind == "decimal":
+            precision = self.int_digits + self.scale
+            if precision <= 65 and self.scale <= 30:
+                self._set("decimal", f"DECIMAL({precision},{self.scale})", (self.int_digits, self.scale))
+                return self.sql_type
+            self.kind = "str"
+        if self.kind == "date":
+            self._set("date", "DATE", ())
+            return self.sql_type
+        if self.kind is None:
+            # Nothing but blanks in the sample; widen later if needed.
+            self._set(None, "VARCHAR(64)", (64,))
+            return self.sql_type
+        if self.max_len > 255:
+            self._set("str", "TEXT", (65535,))
+        elif self.min_len == self.max_len and self.max_len <= 32:
+            self._set("str", f"CHAR({self.max_len})", (self.max_len,))
+        else:
+            width = 16
+            while width < self.max_len:
+                width *= 2
+            width = min(width, 255)
+            self._set("str", f"VARCHAR({width})", (width,))
+        return self.sql_type
+
+    def _set(self, kind: Optional[str], sql_type: str, cap: Tuple) -> None:
+        self.kind = kind
+        self.sql_type = sql_type
+        self._cap = cap
+
+    def fits(self, v: str) -> bool:
+        """True if v can be stored in the current sql_type as-is ('' → NULL for typed columns)."""
+        if not v:
+            return True
+        if self.kind == "int":
+            return bool(INT_RE.match(v)) and self._cap[0] <= int(v) <= self._cap[1]
+        if self.kind == "decimal":
+            m = DEC_RE.match(v)
+            if m:
+                return len(m.group(1).lstrip("0")) <= self._cap[0] and len(m.group(2)) <= self._cap[1]
+            return bool(INT_RE.match(v)) and len(v.lstrip("-")) <= self._cap[0]
+        if self.kind == "date":
+            return is_date(v)
+        return len(v) <= self._cap[0]
+
+    def _hold_current(self) -> None:
+        """Fold the current type's limits into the observed stats.
+
+        Only sampled rows and misfits are observed, so rows loaded since
+        may use the whole range of the current type; widening from these
+        stats never produces a type narrower than the column already is.
+        """
+        if self.kind == "int":
+            lo, hi = self._cap
+            self.lo, self.hi = min(self.lo, lo), max(self.hi, hi)
+            self.int_digits = max(self.int_digits, len(str(hi)))
+            self.max_len = max(self.max_len, len(str(lo)))
+        elif self.kind == "decimal":
+            digits, scale = self._cap
+            self.int_digits, self.scale = max(self.int_digits, digits), max(self.scale, scale)
+            self.max_len = max(self.max_len, digits + scale + 2)  # sign and point
+        elif self.kind == "date":
+            self.max_len = max(self.max_len, 10)
+        elif self._cap:
+            self.max_len = max(self.max_len, self._cap[0])
+
+    def widen_for(self, v: str) -> str:
+        """Widen to a type that also holds v; returns the new sql_type."""
+        self._hold_current()
+        self.observe(v)
+        if self.kind is None:
+            self.kind = "str"
+        return self.choose_type()
+
+    def widen_blind(self) -> str:
+        """Step up one size when the offending value is unknown (LOAD DATA warnings)."""
+        if self.kind == "int":
+            names = [name for name, _, _ in INT_TYPES]
+            i = names.index(self.sql_type)
+            if i + 1 < len(INT_TYPES):
+                name, lo, hi = INT_TYPES[i + 1]
+                self._set("int", name, (lo, hi))
+                return self.sql_type
+        if self.sql_type in ("VARCHAR(255)", "TEXT"):
+            self._set("str", "TEXT", (65535,))
+        else:
+            self._set("str", "VARCHAR(255)", (255,))
+        return self.sql_type
+
+
+def profile_columns(rows: List[List[str]], num_cols: int) -> List[ColumnProfile]:
+    """Build one ColumnProfile per column from sampled rows."""
+    profiles = [ColumnProfile() for _ in range(num_cols)]
+    for row in rows:
+        for profile, v in zip(profiles, row):
+            profile.observe(v)
+    for profile in profiles:
+        profile.choose_type()
+    return profiles
+
+
+def profile_for_column_type(column_type: str) -> Optional[ColumnProfile]:
+    """ColumnProfile matching an existing column's type (SHOW COLUMNS), or None if unchecked.
+
+    Only the types ColumnProfile chooses are recognised; the profile's
+    limits are those of the type, so widen_for never narrows a column.
+    """
+    t = column_type.lower()
+    p = ColumnProfile()
+    m = re.match(r"(smallint|int|bigint)\b(\(\d+\))?$", t)
+    if m:
+        name = m.group(1).upper()
+        _, lo, hi = next(spec for spec in INT_TYPES if spec[0] == name)
+        p.lo, p.hi, p.int_digits = lo, hi, len(str(hi))
+        p._set("int", name, (lo, hi))
+        return p
+    m = re.match(r"decimal\((\d+),(\d+)\)$", t)
+    if m:
+        precision, scale = int(m.group(1)), int(m.group(2))
+        p.int_digits, p.scale = precision - scale, scale
+        p._set("decimal", f"DECIMAL({precision},{scale})", (p.int_digits, scale))
+        return p
+    if t == "date":
+        p.max_len = p.min_len = 10
+        p._set("date", "DATE", ())
+        return p
+    m = re.match(r"(var)?char\((\d+)\)$", t)
+    if m:
+        width = int(m.group(2))
+        p.max_len = width
+        p.min_len = 0 if m.group(1) else width
+        p._set("str", f"{'VAR' if m.group(1) else ''}CHAR({width})", (width,))
+        return p
+    return None
+
+
+def approx_type_bytes(sql_type: str) -> int:
+    """Rough in-row size of a column, for the InnoDB row size check."""
+    m = re.match(r"(VAR)?CHAR\((\d+)\)", sql_type)
+    if m:
+        return int(m.group(2)) * 4 + (2 if m.group(1) else 0)
+    if sql_type.startswith("DECIMAL"):
+        return 30
+    return {"SMALLINT": 2, "INT": 4, "BIGINT": 8, "DATE": 3}.get(sql_type, 20)
+
+
+def fit_row_size(profiles: List[ColumnProfile]) -> None:
+    """Move the widest string columns to TEXT until the row fits InnoDB's limit."""
+    total = sum(approx_type_bytes(p.sql_type) for p in profiles)
+    for p in sorted(profiles, key=lambda p: approx_type_bytes(p.sql_type), reverse=True):
+        if total <= MAX_ROW_BYTES:
+            break
+        if p.kind in ("str", None) and p.sql_type != "TEXT":
+            total -= approx_type_bytes(p.sql_type) - approx_type_bytes("TEXT")
+            p._set("str", "TEXT", (65535,))
+
+
+def build_table_schema(
+    header: List[str], profiles: Optional[List[ColumnProfile]] = None
+) -> List[Tuple[str, str]]:
     """Given CSV headers, build a list of (column_name, sql_type).
 
     By default we use VARCHAR(255), but if the file has many columns,
@@ -112,6 +459,9 @@ def build_table_schema(header: List[str]) -> List[Tuple[str, str]]:
 
     This keeps the loader generic and safe for wide Retrosheet CSVs
     like plays.csv.
+
+    With profiles (from profile_columns), each column gets its inferred
+    type instead.
     """
     seen = set()
     schema: List[Tuple[str, str]] = []
@@ -134,7 +484,10 @@ def build_table_schema(header: List[str]) -> List[Tuple[str, str]]:
             idx += 1
         seen.add(col)
 
-        col_type = "TEXT" if use_text else "VARCHAR(255)"
+        if profiles is not None:
+            col_type = profiles[len(schema)].sql_type
+        else:
+            col_type = "TEXT" if use_text else "VARCHAR(255)"
         schema.append((col, col_type))
 
     return schema
@@ -166,19 +519,498 @@ def ensure_table_index(cur) -> None:
         """
     )
 
+    # Columns added after the first version (or missing when
+    # country-main-analysis.py created the table); add them if needed.
+    cur.execute("SHOW COLUMNS FROM `table_index`")
+    existing = {row[0].lower() for row in cur.fetchall()}
+    for col, ddl in TABLE_INDEX_EXTRA_COLUMNS.items():
+        if col not in existing:
+            cur.execute(f"ALTER TABLE `table_index` ADD COLUMN {col} {ddl}")
+
+
+class FileFingerprint(NamedTuple):
+    size: int
+    mtime: float
+    digest: str
+    prefix_digest: Optional[str]  # hash of the first N bytes, when asked for
+
+
+class LoadResult(NamedTuple):
+    path: Path
+    table: str
+    rows: int  # rows now in the table
+    inserted: int  # rows written by this run
+    indexes: List[str]
+    fingerprint: FileFingerprint
+    action: str  # "full", "append", "unchanged" or "skipped"
+    metrics: Optional[Dict] = None  # LoadMetrics.summary() for loads that wrote rows
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process or its parse workers, in MB."""
+    if resource is None:
+        return None
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    unit = 1 if sys.platform == "darwin" else 1024  # bytes on macOS, KB on Linux
+    return round(max(own, children) * unit / 2**20, 1)
+
+
+class LoadMetrics:
+    """Throughput counters for loading one table.
+
+    Time between batches counts as parse time (reading, csv parsing,
+    coercion, or waiting on parse workers); time inside executemany /
+    LOAD DATA counts as insert time. Batch latencies go into a coarse
+    histogram keyed by BATCH_LATENCY_BUCKETS_MS upper bounds.
+    """
 
-def update_table_index(cur, table_name: str, csv_path: Path, row_count: int) -> None:
+    def __init__(self, table: str, source: Path, mode: str = "insert") -> None:
+        self.table = table
+        self.source = source
+        self.mode = mode
+        if source.is_dir():
+            self.total_bytes = sum(p.stat().st_size for p in iter_data_files(source))
+        else:
+            self.total_bytes = source.stat().st_size
+        self.bytes_read = 0
+        self.rows = 0
+        self.batches = 0
+        self.parse_s = 0.0
+        self.insert_s = 0.0
+        self.histogram = [0] * (len(BATCH_LATENCY_BUCKETS_MS) + 1)
+        self.started = time.perf_counter()
+        self._mark = self.started
+        self._last_progress = self.started
+        self._tty = sys.stderr.isatty()
+
+    def mark(self) -> None:
+        """Start the parse clock now (call after DDL so it isn't counted as parsing)."""
+        self._mark = time.perf_counter()
+
+    def executemany(self, cur, sql: str, rows: List[Tuple], bytes_read: Optional[int] = None) -> float:
+        """Run one batch, record its timing, and return its latency in seconds."""
+        t0 = time.perf_counter()
+        self.parse_s += t0 - self._mark
+        cur.executemany(sql, rows)
+        t1 = time.perf_counter()
+        self.record_batch(t1 - t0, len(rows), bytes_read)
+        self._mark = t1
+        return t1 - t0
+
+    def record_batch(self, seconds: float, rows: int, bytes_read: Optional[int] = None) -> None:
+        self.insert_s += seconds
+        self.batches += 1
+        self.rows += rows
+        self.histogram[bisect.bisect_left(BATCH_LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+        if bytes_read is not None:
+            self.bytes_read = bytes_read
+        self.progress()
+
+    def progress(self, final: bool = False) -> None:
+        now = time.perf_counter()
+        interval = PROGRESS_INTERVAL_TTY if self._tty else PROGRESS_INTERVAL_LOG
+        if not final and now - self._last_progress < interval:
+            return
+        self._last_progress = now
+        elapsed = max(now - self.started, 1e-9)
+        pct = f"{100.0 * self.bytes_read / self.total_bytes:5.1f}%" if self.total_bytes else "  n/a"
+        line = (
+            f"[PROGRESS] {self.table}: {pct} {self.rows:,} rows "
+            f"{self.rows / elapsed:,.0f} rows/s {self.bytes_read / elapsed / 2**20:.1f} MB/s"
+        )
+        if self._tty:
+            print("\r" + line, end="\n" if final else "", file=sys.stderr, flush=True)
+        elif not final:
+            print(line, file=sys.stderr, flush=True)
+
+    def summary(self) -> Dict:
+        elapsed = time.perf_counter() - self.started
+        labels = [f"<{b}ms" for b in BATCH_LATENCY_BUCKETS_MS] + [f">={BATCH_LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            "table": self.table,
+            "source": str(self.source),
+            "mode": self.mode,
+            "bytes": self.bytes_read,
+            "rows": self.rows,
+            "seconds": round(elapsed, 3),
+            "rows_per_sec": round(self.rows / elapsed, 1) if elapsed > 0 else None,
+            "mb_per_sec": round(self.bytes_read / elapsed / 2**20, 2) if elapsed > 0 else None,
+            "parse_seconds": round(self.parse_s, 3),
+            "insert_seconds": round(self.insert_s, 3),
+            "batches": self.batches,
+            "batch_latency_ms": dict(zip(labels, self.histogram)),
+            "peak_rss_mb": peak_rss_mb(),
+        }
+
+    def finish(self) -> Dict:
+        self.progress(final=True)
+        return self.summary()
+
+
+class BatchSizer:
+    """Pick executemany batch sizes by payload bytes instead of a fixed row count.
+
+    Rows per batch = target bytes / observed average row size. The byte
+    target doubles after fast round trips and halves after slow ones,
+    within MIN_BATCH_BYTES and half the server's max_allowed_packet.
+    apply() also sets the cursor's max_stmt_length, since pymysql splits
+    one executemany into multi-row INSERTs of at most that length.
     """
-    Upsert a record into table_index for the given table.
+
+    def __init__(self, cur, initial_rows: int = 1000) -> None:
+        packet = getattr(cur.connection, "server_max_allowed_packet", DEFAULT_MAX_ALLOWED_PACKET)
+        self.max_bytes = max(MIN_BATCH_BYTES, min(MAX_BATCH_BYTES, packet // 2))
+        self.target_bytes = min(INITIAL_BATCH_BYTES, self.max_bytes)
+        self.avg_row_bytes: Optional[float] = None
+        self.rows = initial_rows
+
+    @staticmethod
+    def row_bytes(row: Tuple) -> int:
+        # Rough escaped size in an INSERT: quotes + comma per value, plus parentheses
+        return sum(len(v) + 3 if isinstance(v, str) else 5 for v in row) + 3
+
+    def apply(self, cur) -> None:
+        cur.max_stmt_length = self.target_bytes
+
+    def record(self, batch: List[Tuple], seconds: float) -> None:
+        """Update the row-size estimate and byte target after one batch."""
+        if batch:
+            step = max(1, len(batch) // 32)
+            sample = batch[::step]
+            size = sum(self.row_bytes(r) for r in sample) / len(sample)
+            self.avg_row_bytes = size if self.avg_row_bytes is None else 0.7 * self.avg_row_bytes + 0.3 * size
+        if seconds < FAST_BATCH_SECONDS:
+            self.target_bytes = min(self.max_bytes, self.target_bytes * 2)
+        elif seconds > SLOW_BATCH_SECONDS:
+            self.target_bytes = max(MIN_BATCH_BYTES, self.target_bytes // 2)
+        if self.avg_row_bytes:
+            rows = int(self.target_bytes / self.avg_row_bytes)
+            self.rows = max(MIN_BATCH_ROWS, min(MAX_BATCH_ROWS, rows))
+
+    def run(self, metrics: LoadMetrics, cur, sql: str, batch: List[Tuple], bytes_read: Optional[int] = None) -> None:
+        """Send one batch through metrics and feed its latency back into the sizer."""
+        self.apply(cur)
+        self.record(batch, metrics.executemany(cur, sql, batch, bytes_read))
+
+
+_metrics_log_lock = threading.Lock()
+
+
+def append_metrics_log(path: Optional[Path], summary: Dict) -> None:
+    """Append one JSON line per loaded table (safe across --workers threads)."""
+    if path is None:
+        return
+    line = json.dumps(summary, sort_keys=True)
+    with _metrics_log_lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def fingerprint_file(path: Path, prefix_len: Optional[int] = None) -> FileFingerprint:
+    """Size, mtime and blake2b of a file; optionally also the hash of its first prefix_len bytes."""
+    st = path.stat()
+    h = hashlib.blake2b(digest_size=16)
+    prefix_digest = None
+    seen = 0
+    with path.open("rb") as f:
+        while True:
+            chunk = f.read(HASH_CHUNK)
+            if not chunk:
+                break
+            if prefix_len is not None and seen < prefix_len <= seen + len(chunk):
+                # Snapshot the running hash exactly at the prefix boundary
+                cut = prefix_len - seen
+                h.update(chunk[:cut])
+                prefix_digest = h.hexdigest()
+                h.update(chunk[cut:])
+            else:
+                h.update(chunk)
+            seen += len(chunk)
+    return FileFingerprint(st.st_size, st.st_mtime, h.hexdigest(), prefix_digest)
+
+
+def read_table_index(cur) -> Dict[str, Dict]:
+    """Previous load state per table: source path, row count, indexes and file fingerprint."""
+    cur.execute(
+        "SELECT table_name, source_csv, row_count, indexes, source_size, source_mtime, source_hash "
+        "FROM `table_index`"
+    )
+    keys = ("source_csv", "row_count", "indexes", "source_size", "source_mtime", "source_hash")
+    return {row[0]: dict(zip(keys, row[1:])) for row in cur.fetchall()}
+
+
+def update_table_index(cur, result: LoadResult) -> None:
     """
+    Upsert a record into table_index for the given load result.
+
+    Only the columns the load changed are written (ON DUPLICATE KEY
+    UPDATE, not REPLACE, which would null everything else): a touched
+    but unchanged file just refreshes source_mtime, and load_metrics is
+    kept unless this load produced new metrics.
+    """
+    fp = result.fingerprint
+    if result.action == "unchanged":
+        fields = {"source_mtime": fp.mtime}
+    else:
+        fields = {
+            "source_csv": str(result.path),
+            "row_count": int(result.rows),
+            "indexes": ", ".join(result.indexes) if result.indexes else None,
+            "source_size": fp.size,
+            "source_mtime": fp.mtime,
+            "source_hash": fp.digest,
+        }
+        if result.metrics:
+            fields["load_metrics"] = json.dumps(result.metrics, sort_keys=True)
+    names = ["table_name"] + list(fields)
+    updates = [f"{name} = VALUES({name})" for name in fields]
+    if result.action == "unchanged":
+        updates.append("last_loaded = last_loaded")  # nothing was loaded
     cur.execute(
-        """
-        REPLACE INTO `table_index` (table_name, source_csv, row_count)
-        VALUES (%s, %s, %s)
+        f"""
+        INSERT INTO `table_index` ({", ".join(names)})
+        VALUES ({", ".join(["%s"] * len(names))})
+        ON DUPLICATE KEY UPDATE {", ".join(updates)}
         """,
-        (table_name, str(csv_path), int(row_count)),
+        (result.table, *fields.values()),
+    )
+
+
+def record_load(cur, result: LoadResult) -> None:
+    """Write the table_index row for a load (skipped tables keep theirs)."""
+    if result.action != "skipped":
+        update_table_index(cur, result)
+
+
+def pick_column(columns: List[str], candidates: List[str]) -> Optional[str]:
+    lower_map = {c.lower(): c for c in columns}
+    for cand in candidates:
+        if cand.lower() in lower_map:
+            return lower_map[cand.lower()]
+    return None
+
+
+def add_key_indexes(cur, table_name: str) -> List[str]:
+    """Index the player/game/year/team key columns of a freshly loaded table.
+
+    All indexes go in a single ALTER TABLE so the table is rebuilt once.
+    player+year become one composite index (it also serves player-only
+    lookups). TEXT columns are indexed on a prefix.
+
+    Returns index descriptions like "idx_player_year(playerid,yearid)".
+    """
+    cur.execute(f"SHOW COLUMNS FROM `{table_name}`")
+    col_types = {row[0]: row[1].lower() for row in cur.fetchall()}
+    keys = {role: pick_column(list(col_types), cands) for role, cands in INDEX_KEY_CANDIDATES}
+
+    groups: List[Tuple[str, List[str]]] = []
+    if keys["player"] and keys["year"]:
+        groups.append(("player_year", [keys["player"], keys["year"]]))
+    elif keys["player"]:
+        groups.append(("player", [keys["player"]]))
+    for role in ("game", "year", "team"):
+        if keys[role]:
+            groups.append((role, [keys[role]]))
+    if not groups:
+        return []
+
+    def key_part(col: str) -> str:
+        if "text" in col_types[col] or "blob" in col_types[col]:
+            return f"`{col}`({TEXT_INDEX_PREFIX})"
+        return f"`{col}`"
+
+    clauses = [
+        f"ADD INDEX `idx_{name}` (" + ", ".join(key_part(c) for c in cols) + ")" for name, cols in groups
+    ]
+    debug(f"Indexing `{table_name}`: {', '.join(name for name, _ in groups)}")
+    cur.execute(f"ALTER TABLE `{table_name}` " + ", ".join(clauses))
+    return [f"idx_{name}(" + ",".join(cols) + ")" for name, cols in groups]
+
+
+def table_exists(cur, table_name: str) -> bool:
+    # Exact match: SHOW TABLES LIKE would treat the "_" in our names as a wildcard
+    cur.execute(
+        "SELECT 1 FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+        (table_name,),
+    )
+    return cur.fetchone() is not None
+
+
+def side_table_name(prefix: str, table_name: str) -> str:
+    """prefix + table_name, shortened with a hash if it would exceed MySQL's 64 characters."""
+    name = f"{prefix}{table_name}"
+    if len(name) <= MAX_TABLE_NAME:
+        return name
+    tag = hashlib.sha1(table_name.encode("utf-8")).hexdigest()[:8]
+    return f"{prefix}{table_name[: MAX_TABLE_NAME - len(prefix) - 9]}_{tag}"
+
+
+def shadow_table_name(table_name: str) -> str:
+    return side_table_name(SHADOW_PREFIX, table_name)
+
+
+def swap_in_shadow(cur, table_name: str) -> None:
+    """Atomically replace table_name with its freshly loaded shadow table."""
+    shadow = shadow_table_name(table_name)
+    old = side_table_name(OLD_PREFIX, table_name)
+    cur.execute(f"DROP TABLE IF EXISTS `{old}`")  # left over from an interrupted run
+    if table_exists(cur, table_name):
+        debug(f"Swapping `{shadow}` into `{table_name}`")
+        cur.execute(f"RENAME TABLE `{table_name}` TO `{old}`, `{shadow}` TO `{table_name}`")
+        cur.execute(f"DROP TABLE `{old}`")
+    else:
+        cur.execute(f"RENAME TABLE `{shadow}` TO `{table_name}`")
+
+
+def load_tail(
+    cur,
+    data_path: Path,
+    table_name: str,
+    offset: int,
+    metrics: Optional[LoadMetrics] = None,
+) -> int:
+    """Append the rows that start at byte offset of data_path to an existing table.
+
+    Rows are padded/trimmed to the table's width; '' becomes NULL in
+    non-string columns. Columns too narrow for the new rows are widened
+    the same way a full load widens them, but all before the first
+    INSERT: ALTER TABLE commits implicitly, and a commit mid-append would
+    leave a partial tail behind if a later row failed.
+    Returns the number of rows inserted.
+    """
+    cur.execute(f"SHOW COLUMNS FROM `{table_name}`")
+    columns = [(row[0], row[1]) for row in cur.fetchall()]
+    col_names = [name for name, _ in columns]
+    profiles = [profile_for_column_type(t) for _, t in columns]
+    checked: List[Tuple[int, ColumnProfile]] = [(i, p) for i, p in enumerate(profiles) if p is not None]
+    insert_sql = (
+        f"INSERT INTO `{table_name}` (" + ",".join(f"`{c}`" for c in col_names) + ") "
+        f"VALUES ({','.join(['%s'] * len(col_names))})"
     )
 
+    def tail_rows(raw):
+        raw.seek(offset)
+        return csv.reader(io.TextIOWrapper(raw, encoding="utf-8", newline=""))
+
+    widened: Dict[int, str] = {}
+    with data_path.open("rb") as raw:
+        for row in tail_rows(raw):
+            _, misfits = coerce_row(row, len(col_names), checked)
+            for i, v in misfits:
+                if not profiles[i].fits(v):
+                    widened[i] = profiles[i].widen_for(v)
+    for i, sql_type in sorted(widened.items()):
+        widen_column(cur, table_name, col_names[i], sql_type)
+
+    metrics = metrics or LoadMetrics(table_name, data_path, mode="append")
+    sizer = BatchSizer(cur)
+    metrics.mark()
+    row_count = 0
+    batch: List[Tuple] = []
+    with data_path.open("rb") as raw:
+        for row in tail_rows(raw):
+            values, _ = coerce_row(row, len(col_names), checked)
+            batch.append(values)
+            row_count += 1
+            if len(batch) >= sizer.rows:
+                sizer.run(metrics, cur, insert_sql, batch, raw.tell())
+                batch.clear()
+        if batch:
+            sizer.run(metrics, cur, insert_sql, batch, raw.tell())
+    return row_count
+
+
+def ends_with_newline_at(path: Path, offset: int) -> bool:
+    """True if the byte just before offset is a newline (old content ended on a full line)."""
+    if offset <= 0:
+        return False
+    with path.open("rb") as f:
+        f.seek(offset - 1)
+        return f.read(1) == b"\n"
+
+
+def load_table(
+    cur,
+    data_path: Path,
+    table_name: str,
+    index: bool = True,
+    incremental: bool = False,
+    previous: Optional[Dict] = None,
+    metrics_log: Optional[Path] = None,
+    **load_opts,
+) -> LoadResult:
+    """Load one file and add its key indexes.
+
+    Each load that writes rows appends a LoadMetrics summary to
+    metrics_log (JSON lines) and returns it in LoadResult.metrics.
+
+    With incremental=True and a previous table_index entry for the same
+    source file, unchanged files are skipped and files that only grew
+    (the old bytes are an exact prefix) get just the new rows appended.
+    Anything else is a full reload.
+    """
+    prev = previous if incremental and previous and previous.get("source_csv") == str(data_path) else None
+    if data_path.is_dir():
+        # --roster-mode single: the whole folder is one table
+        fp = roster_folder_fingerprint(iter_data_files(data_path))
+        if prev and prev.get("source_hash") == fp.digest and table_exists(cur, table_name):
+            return LoadResult(
+                data_path, table_name, int(prev["row_count"] or 0), 0, ROSTER_INDEXES, fp, "skipped"
+            )
+        metrics = LoadMetrics(table_name, data_path, mode="roster")
+        rows = load_roster_folder(cur, data_path, table_name, metrics=metrics)
+        summary = metrics.finish()
+        append_metrics_log(metrics_log, summary)
+        return LoadResult(data_path, table_name, rows, rows, ROSTER_INDEXES, fp, "full", summary)
+
+    if prev and prev.get("source_hash") and table_exists(cur, table_name):
+        old_size = int(prev["source_size"] or 0)
+        prev_indexes = [i.strip() for i in (prev["indexes"] or "").split(", ") if i.strip()]
+        st = data_path.stat()
+        if st.st_size == old_size and st.st_mtime == prev["source_mtime"]:
+            fp = FileFingerprint(old_size, st.st_mtime, prev["source_hash"], None)
+            return LoadResult(data_path, table_name, int(prev["row_count"] or 0), 0, prev_indexes, fp, "skipped")
+
+        fp = fingerprint_file(data_path, prefix_len=old_size if st.st_size > old_size else None)
+        if fp.digest == prev["source_hash"]:
+            debug(f"`{data_path.name}` touched but unchanged; keeping `{table_name}`")
+            return LoadResult(
+                data_path, table_name, int(prev["row_count"] or 0), 0, prev_indexes, fp, "unchanged"
+            )
+        if fp.prefix_digest == prev["source_hash"] and ends_with_newline_at(data_path, old_size):
+            try:
+                metrics = LoadMetrics(table_name, data_path, mode="append")
+                added = load_tail(cur, data_path, table_name, old_size, metrics=metrics)
+                debug(f"Appended {added} new row(s) from `{data_path.name}` to `{table_name}`")
+                rows = int(prev["row_count"] or 0) + added
+                summary = metrics.finish()
+                append_metrics_log(metrics_log, summary)
+                return LoadResult(data_path, table_name, rows, added, prev_indexes, fp, "append", summary)
+            except (pymysql.MySQLError, UnicodeDecodeError) as e:
+                # Drop any rows appended before the failure; the reload replaces the table anyway.
+                cur.connection.rollback()
+                print(f"[WARN] Appending to `{table_name}` failed ({e}); doing a full reload.")
+    else:
+        fp = fingerprint_file(data_path)
+
+    # Full reloads go into a shadow table that replaces the live one in a
+    # single RENAME, so readers never see a missing or half-loaded table.
+    shadow = shadow_table_name(table_name)
+    metrics = LoadMetrics(table_name, data_path)
+    # A shadow left behind by a crashed run must not be mistaken for this load's.
+    cur.execute(f"DROP TABLE IF EXISTS `{shadow}`")
+    rows = load_csv_into_table(cur, data_path, shadow, metrics=metrics, **load_opts)
+    if not table_exists(cur, shadow):
+        # Empty file: nothing was created, leave the live table as it is.
+        return LoadResult(data_path, table_name, rows, rows, [], fp, "full")
+    indexes = add_key_indexes(cur, shadow) if index and rows else []
+    swap_in_shadow(cur, table_name)
+    summary = metrics.finish()
+    append_metrics_log(metrics_log, summary)
+    return LoadResult(data_path, table_name, rows, rows, indexes, fp, "full", summary)
+
 
 def create_table_from_schema(cur, table_name: str, schema: List[Tuple[str, str]]) -> None:
     """Drop existing table and create a new one with the given schema."""
@@ -194,12 +1026,281 @@ def create_table_from_schema(cur, table_name: str, schema: List[Tuple[str, str]]
     cur.execute(create_sql)
 
 
-def load_csv_into_table(cur, csv_path: Path, table_name: str) -> int:
+def detect_line_terminator(csv_path: Path) -> str:
+    """Return '\r\n' if the first line of the file ends in CRLF, else '\n'."""
+    with csv_path.open("rb") as f:
+        first_line = f.readline()
+    return "\r\n" if first_line.endswith(b"\r\n") else "\n"
+
+
+def bulk_load_csv(
+    cur,
+    csv_path: Path,
+    table_name: str,
+    col_names: List[str],
+    profiles: Optional[List[ColumnProfile]] = None,
+    metrics: Optional[LoadMetrics] = None,
+) -> int:
+    """Stream csv_path into table_name with LOAD DATA LOCAL INFILE.
+
+    Mirrors the executemany path: the header line is skipped, quoted
+    fields follow csv.reader rules ("" inside quotes, no backslash
+    escapes), short rows get NULL for the missing columns and extra
+    fields are dropped (MySQL reports both as warnings, not errors,
+    for LOCAL loads).
+
+    With profiles, typed columns go through user variables so '' loads
+    as NULL, and columns that overflowed (out of range / too long
+    warnings) are re-profiled over the whole file, widened once to a
+    type that holds every value, and the file is reloaded.
+
+    Returns the number of rows loaded.
+    """
+    terminator = detect_line_terminator(csv_path)
+    targets, sets = [], []
+    for i, c in enumerate(col_names):
+        if profiles is not None and profiles[i].typed:
+            targets.append(f"@v{i}")
+            sets.append(f"`{c}` = NULLIF(@v{i}, '')")
+        else:
+            targets.append(f"`{c}`")
+    set_sql = ("SET " + ", ".join(sets)) if sets else ""
+    load_sql = f"""
+        LOAD DATA LOCAL INFILE %s
+        INTO TABLE `{table_name}`
+        CHARACTER SET utf8mb4
+        FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"' ESCAPED BY ''
+        LINES TERMINATED BY %s
+        IGNORE 1 LINES
+        ({",".join(targets)})
+        {set_sql}
+    """
+
+    metrics = metrics or LoadMetrics(table_name, csv_path)
+    metrics.mode = "load_data"
+    for attempt in range(len(INT_TYPES) + 3):
+        t0 = time.perf_counter()
+        cur.execute(load_sql, (str(csv_path), terminator))
+        row_count = cur.rowcount
+        if attempt:
+            metrics.rows = 0  # a reload replaces the previous attempt's rows
+        metrics.record_batch(time.perf_counter() - t0, row_count, metrics.total_bytes)
+        if profiles is None:
+            return row_count
+        cur.execute("SHOW WARNINGS")
+        overflowed = set()
+        for _level, code, message in cur.fetchall():
+            m = re.search(r"column '([^']+)'", message)
+            if int(code) in OVERFLOW_WARNINGS and m and m.group(1) in col_names:
+                overflowed.add(m.group(1))
+        if not overflowed:
+            return row_count
+        # Re-profile the overflowed columns over the whole file so each jumps
+        # straight to a type that holds every value (e.g. INT -> DECIMAL),
+        # instead of stepping up one size per reload.
+        checked = [(col_names.index(c), profiles[col_names.index(c)]) for c in sorted(overflowed)]
+        before = [p.sql_type for _, p in checked]
+        reprofile_columns(csv_path, checked)
+        for (i, p), old_type in zip(checked, before):
+            if p.sql_type == old_type:
+                p.widen_blind()  # MySQL rejected a value csv.reader thinks fits; step up anyway
+            widen_column(cur, table_name, col_names[i], p.sql_type)
+        # SET/@var targets were fixed for the old types; widened typed columns keep NULLIF.
+        debug(f"Reloading `{table_name}` after widening {len(overflowed)} column(s)")
+        cur.execute(f"DELETE FROM `{table_name}`")
+    print(f"[WARN] `{table_name}` still reports overflow warnings after widening; some values may be clipped.")
+    return row_count
+
+
+def reprofile_columns(csv_path: Path, checked: List[Tuple[int, ColumnProfile]]) -> None:
+    """Widen each (column index, profile) in checked until it fits every value in csv_path."""
+    with csv_path.open("r", newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for row in reader:
+            for i, p in checked:
+                if i < len(row) and not p.fits(row[i]):
+                    p.widen_for(row[i])
+
+
+def widen_column(cur, table_name: str, column: str, sql_type: str) -> None:
+    """ALTER one column to a wider type (falls back to TEXT if the row gets too large)."""
+    debug(f"Widening `{table_name}`.`{column}` to {sql_type}")
+    try:
+        cur.execute(f"ALTER TABLE `{table_name}` MODIFY `{column}` {sql_type}")
+    except pymysql.MySQLError as e:
+        if e.args and e.args[0] == 1118 and sql_type != "TEXT":  # Row size too large
+            cur.execute(f"ALTER TABLE `{table_name}` MODIFY `{column}` TEXT")
+        else:
+            raise
+
+
+def coerce_row(
+    row: List[Optional[str]],
+    width: int,
+    checked: List[Tuple[int, ColumnProfile]],
+    null_blanks: bool = True,
+) -> Tuple[Tuple, List[Tuple[int, str]]]:
+    """Pad/trim a parsed row to width and map '' to NULL in typed columns.
+
+    Returns the row and the (column index, value) pairs that do not fit
+    their column's current type, so the caller can widen it first. With
+    null_blanks=False blanks are left for the caller to map.
+    """
+    if len(row) < width:
+        row = row + [None] * (width - len(row))
+    elif len(row) > width:
+        row = row[:width]
+    misfits: List[Tuple[int, str]] = []
+    for i, p in checked:
+        v = row[i]
+        if v is None:
+            continue
+        if not p.fits(v):
+            misfits.append((i, v))
+        if v == "" and null_blanks and p.typed:
+            row[i] = None
+    return tuple(row), misfits
+
+
+def split_line_chunks(path: Path, start: int, chunk_bytes: Optional[int] = None) -> List[Tuple[int, int]]:
+    """Split [start, EOF) into byte ranges that each begin at the start of a line.
+
+    Assumes quoted fields do not contain newlines (true for the
+    Retrosheet/Lahman CSVs this loader handles).
+    """
+    chunk_bytes = chunk_bytes or PARSE_CHUNK_BYTES
+    size = path.stat().st_size
+    chunks: List[Tuple[int, int]] = []
+    with path.open("rb") as f:
+        pos = start
+        while pos < size:
+            target = pos + chunk_bytes
+            if target >= size:
+                chunks.append((pos, size))
+                break
+            f.seek(target)
+            f.readline()  # move to the next line boundary
+            end = min(f.tell(), size)
+            chunks.append((pos, end))
+            pos = end
+    return chunks
+
+
+def parse_chunk(
+    path: str, start: int, end: int, width: int, checked: List[Tuple[int, ColumnProfile]]
+) -> Tuple[List[Tuple], List[Tuple[int, str]]]:
+    """Process-pool worker: parse the rows in one byte range of a CSV and find misfits.
+
+    Rows are padded/trimmed but blanks are kept: whether '' becomes NULL
+    depends on the column's type at that row, which only the parent knows
+    once it has widened for earlier misfits. Misfits are (row, column, value).
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    rows: List[Tuple] = []
+    misfits: List[Tuple[int, int, str]] = []
+    for n, row in enumerate(csv.reader(io.StringIO(data.decode("utf-8"), newline=""))):
+        values, bad = coerce_row(row, width, checked, null_blanks=False)
+        rows.append(values)
+        misfits.extend((n, i, v) for i, v in bad)
+    return rows, misfits
+
+
+def header_end_offset(csv_path: Path) -> int:
+    """Byte offset just past the header line."""
+    with csv_path.open("rb") as f:
+        f.readline()
+        return f.tell()
+
+
+def insert_rows_parallel(
+    cur,
+    csv_path: Path,
+    table_name: str,
+    col_names: List[str],
+    checked: List[Tuple[int, ColumnProfile]],
+    insert_sql: str,
+    procs: int,
+    sizer: BatchSizer,
+    metrics: Optional[LoadMetrics] = None,
+) -> int:
+    """Parse csv_path in worker processes and INSERT their rows in file order on cur."""
+    metrics = metrics or LoadMetrics(table_name, csv_path)
+    metrics.mode = "parallel_parse"
+    chunks = split_line_chunks(csv_path, header_end_offset(csv_path))
+    debug(f"Parsing `{csv_path.name}` in {len(chunks)} chunk(s) with {procs} processes")
+    by_index = dict(checked)
+    row_count = 0
+    with ProcessPoolExecutor(max_workers=procs) as ex:
+        # Keep a bounded window of chunks in flight so memory stays flat
+        pending = []
+        next_chunk = 0
+        while next_chunk < len(chunks) or pending:
+            while next_chunk < len(chunks) and len(pending) < procs * 2:
+                start, end = chunks[next_chunk]
+                pending.append(
+                    (end, ex.submit(parse_chunk, str(csv_path), start, end, len(col_names), checked))
+                )
+                next_chunk += 1
+            chunk_end, fut = pending.pop(0)
+            rows, misfits = fut.result()
+            # Widen in row order as the serial path does, noting where a typed
+            # column stops being typed: blanks before that row load as NULL,
+            # blanks after it stay '' (exactly what coerce_row would produce).
+            typed_until = {i: len(rows) for i, p in checked if p.typed}
+            for n, i, v in misfits:
+                p = by_index[i]
+                if not p.fits(v):
+                    widen_column(cur, table_name, col_names[i], p.widen_for(v))
+                    if i in typed_until and not p.typed:
+                        typed_until[i] = min(typed_until[i], n)
+            if typed_until:
+                cuts = list(typed_until.items())
+                for n, row in enumerate(rows):
+                    if "" in row:
+                        values = list(row)
+                        for i, cut in cuts:
+                            if n < cut and values[i] == "":
+                                values[i] = None
+                        rows[n] = tuple(values)
+            b = 0
+            while b < len(rows):
+                batch = rows[b : b + sizer.rows]
+                sizer.run(metrics, cur, insert_sql, batch, chunk_end)
+                b += len(batch)
+            row_count += len(rows)
+    return row_count
+
+
+def load_csv_into_table(
+    cur,
+    csv_path: Path,
+    table_name: str,
+    bulk: bool = False,
+    infer_types: bool = False,
+    sample_rows: int = DEFAULT_TYPE_SAMPLE_ROWS,
+    parse_procs: int = 1,
+    metrics: Optional[LoadMetrics] = None,
+) -> int:
     """Create table and load all rows from csv_path into it.
 
+    With bulk=True the rows are streamed by the server via
+    LOAD DATA LOCAL INFILE; if that fails (e.g. local_infile is
+    disabled on the server) we fall back to batched INSERTs.
+
+    With infer_types=True column types come from the first sample_rows
+    rows (INT/SMALLINT/DECIMAL/DATE/CHAR/VARCHAR) and are widened with
+    ALTER TABLE if a later value does not fit.
+
+    With parse_procs > 1, large files on the INSERT path are parsed in
+    byte-range chunks by worker processes; this connection only writes.
+
     Returns the number of rows inserted.
     """
     debug(f"Loading CSV `{csv_path.name}` into table `{table_name}`")
+    metrics = metrics or LoadMetrics(table_name, csv_path)
 
     with csv_path.open("r", newline="", encoding="utf-8-sig") as f:
         reader = csv.reader(f)
@@ -209,10 +1310,28 @@ def load_csv_into_table(cur, csv_path: Path, table_name: str) -> int:
             print(f"[WARN] CSV `{csv_path}` is empty; skipping.")
             return 0
 
-        schema = build_table_schema(header)
+        profiles = None
+        sample: List[List[str]] = []
+        if infer_types:
+            sample = list(itertools.islice(reader, sample_rows))
+            profiles = profile_columns(sample, len(header))
+            fit_row_size(profiles)
+
+        schema = build_table_schema(header, profiles)
         create_table_from_schema(cur, table_name, schema)
 
         col_names = [name for name, _ in schema]
+
+        if bulk:
+            try:
+                row_count = bulk_load_csv(cur, csv_path, table_name, col_names, profiles, metrics)
+                debug(f"Bulk-loaded {row_count} row(s) into `{table_name}`")
+                return row_count
+            except pymysql.MySQLError as e:
+                print(f"[WARN] LOAD DATA failed for `{csv_path.name}` ({e}); falling back to INSERT batches.")
+                cur.execute(f"DELETE FROM `{table_name}`")
+                metrics.mode, metrics.rows = "insert", 0
+
         placeholders = ",".join(["%s"] * len(col_names))
         insert_sql = (
             f"INSERT INTO `{table_name}` (" + ",".join(f"`{c}`" for c in col_names) + ") "
@@ -221,29 +1340,141 @@ def load_csv_into_table(cur, csv_path: Path, table_name: str) -> int:
 
         row_count = 0
         batch: List[Tuple[str, ...]] = []
-        batch_size = 1000
-
-        for row in reader:
-            # Pad or trim row length to match header length
-            if len(row) < len(col_names):
-                row = row + [None] * (len(col_names) - len(row))
-            elif len(row) > len(col_names):
-                row = row[: len(col_names)]
-
-            batch.append(tuple(row))
+        sizer = BatchSizer(cur)
+
+        # Only columns that can reject a value need checking per row
+        checked: List[Tuple[int, ColumnProfile]] = [
+            (i, p) for i, p in enumerate(profiles or []) if p.sql_type != "TEXT"
+        ]
+
+        if parse_procs > 1 and csv_path.stat().st_size >= PARALLEL_PARSE_MIN_BYTES:
+            row_count = insert_rows_parallel(
+                cur, csv_path, table_name, col_names, checked, insert_sql, parse_procs, sizer, metrics
+            )
+            debug(f"Inserted {row_count} row(s) into `{table_name}`")
+            return row_count
+
+        metrics.mark()
+        for row in itertools.chain(sample, reader):
+            # Pad or trim row length to match header length; widen columns
+            # whose current type can't hold a value before inserting it.
+            values, misfits = coerce_row(row, len(col_names), checked)
+            for i, v in misfits:
+                p = profiles[i]
+                if not p.fits(v):
+                    widen_column(cur, table_name, col_names[i], p.widen_for(v))
+
+            batch.append(values)
             row_count += 1
 
-            if len(batch) >= batch_size:
-                cur.executemany(insert_sql, batch)
+            if len(batch) >= sizer.rows:
+                sizer.run(metrics, cur, insert_sql, batch, f.buffer.tell())
                 batch.clear()
 
         if batch:
-            cur.executemany(insert_sql, batch)
+            sizer.run(metrics, cur, insert_sql, batch, f.buffer.tell())
 
     debug(f"Inserted {row_count} row(s) into `{table_name}`")
     return row_count
 
 
+def roster_team_year(path: Path) -> Tuple[Optional[str], Optional[int]]:
+    """(team, year) from a roster file name like BOS1916.ROS, else (None, None)."""
+    m = ROSTER_FILE_RE.match(path.stem)
+    if not m:
+        return None, None
+    return m.group(1).upper(), int(m.group(2))
+
+
+def roster_column_map(first_row: List[str]) -> Optional[List[Optional[int]]]:
+    """If first_row is a header, return the source index for each ROSTER_COLUMNS entry.
+
+    Returns None for headerless files (Retrosheet .ROS files have no
+    header: id,last,first,bats,throws,team,pos).
+    """
+    names = [ROSTER_HEADER_ALIASES.get(normalize_column_name(v)) for v in first_row]
+    if "id" not in names:
+        return None
+    return [names.index(col) if col in names else None for col, _ in ROSTER_COLUMNS]
+
+
+def roster_folder_fingerprint(files: List[Path]) -> FileFingerprint:
+    """Cheap fingerprint of a whole roster folder from each file's name, size and mtime."""
+    h = hashlib.blake2b(digest_size=16)
+    total, newest = 0, 0.0
+    for p in files:
+        st = p.stat()
+        total += st.st_size
+        newest = max(newest, st.st_mtime)
+        h.update(f"{p.name}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return FileFingerprint(total, newest, h.hexdigest(), None)
+
+
+def load_roster_folder(cur, folder: Path, table_name: str, metrics: Optional[LoadMetrics] = None) -> int:
+    """Load every roster file in folder into one table with team/year from the file name.
+
+    The table is built as a shadow copy and swapped in. Rows go through
+    executemany, which pymysql turns into multi-row INSERT statements
+    (sized by BatchSizer).
+    Returns the number of rows loaded.
+    """
+    shadow = shadow_table_name(table_name)
+    cols = ROSTER_COLUMNS + [("team", "CHAR(3)"), ("year", "SMALLINT"), ("source_file", "VARCHAR(128)")]
+    debug(f"Loading roster folder `{folder.name}` into single table `{table_name}`")
+    cur.execute(f"DROP TABLE IF EXISTS `{shadow}`")
+    cols_sql = ",\n  ".join(f"`{name}` {col_type} NULL" for name, col_type in cols)
+    cur.execute(
+        f"""
+        CREATE TABLE `{shadow}` (
+          {cols_sql},
+          KEY `idx_team_year` (`team`, `year`),
+          KEY `idx_player` (`id`)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        """
+    )
+    insert_sql = (
+        f"INSERT INTO `{shadow}` (" + ",".join(f"`{c}`" for c, _ in cols) + ") "
+        f"VALUES ({','.join(['%s'] * len(cols))})"
+    )
+
+    metrics = metrics or LoadMetrics(table_name, folder, mode="roster")
+    sizer = BatchSizer(cur, initial_rows=ROSTER_BATCH_ROWS)
+    metrics.mark()
+    width = len(ROSTER_COLUMNS)
+    row_count = 0
+    bytes_done = 0
+    batch: List[Tuple] = []
+    for path in iter_data_files(folder):
+        team, year = roster_team_year(path)
+        with path.open("r", newline="", encoding="utf-8-sig", errors="replace") as f:
+            reader = csv.reader(f)
+            first = next(reader, None)
+            if first is None:
+                continue
+            colmap = roster_column_map(first)
+            rows = reader if colmap is not None else itertools.chain([first], reader)
+            for row in rows:
+                if not row:
+                    continue
+                if colmap is not None:
+                    values = [row[i] if i is not None and i < len(row) else None for i in colmap]
+                else:
+                    values = (row + [None] * width)[:width]
+                values = [v.strip() or None if isinstance(v, str) else v for v in values]
+                batch.append(tuple(values) + (team, year, path.name))
+                row_count += 1
+                if len(batch) >= sizer.rows:
+                    sizer.run(metrics, cur, insert_sql, batch, bytes_done)
+                    batch.clear()
+        bytes_done += path.stat().st_size
+    if batch:
+        sizer.run(metrics, cur, insert_sql, batch, bytes_done)
+
+    swap_in_shadow(cur, table_name)
+    debug(f"Inserted {row_count} roster row(s) into `{table_name}`")
+    return row_count
+
+
 # ---------------------- MAIN LOGIC ----------------------
 
 
@@ -258,9 +1489,194 @@ def parse_args(argv=None):
     parser.add_argument("--user", default=DEFAULT_DB_USER)
     parser.add_argument("--password", default=DEFAULT_DB_PASSWORD)
     parser.add_argument("--database", default=DEFAULT_DB_NAME)
+    parser.add_argument(
+        "--bulk-load",
+        action="store_true",
+        help="Load files with LOAD DATA LOCAL INFILE (needs local_infile=ON on the server); "
+        "falls back to batched INSERTs per file on failure.",
+    )
+    parser.add_argument(
+        "--infer-types",
+        action="store_true",
+        help="Infer INT/SMALLINT/DECIMAL/DATE/CHAR/VARCHAR column types from a sample "
+        "instead of creating every column as VARCHAR(255)/TEXT.",
+    )
+    parser.add_argument(
+        "--type-sample-rows",
+        type=int,
+        default=DEFAULT_TYPE_SAMPLE_ROWS,
+        help=f"Rows sampled per file for --infer-types (default: {DEFAULT_TYPE_SAMPLE_ROWS}).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Load files in parallel, one MySQL connection per worker (default: 1, serial).",
+    )
+    parser.add_argument(
+        "--parse-procs",
+        type=int,
+        default=1,
+        help="Worker processes that pre-parse large files for the INSERT path (default: 1, in-process).",
+    )
+    parser.add_argument(
+        "--metrics-log",
+        type=Path,
+        default=DEFAULT_METRICS_LOG,
+        help=f"Append per-table load metrics as JSON lines here (default: {DEFAULT_METRICS_LOG}).",
+    )
+    parser.add_argument("--no-metrics-log", action="store_true", help="Don't write the metrics log.")
+    parser.add_argument(
+        "--roster-mode",
+        choices=["tables", "single"],
+        default="tables",
+        help="tables: one table per roster file (default); single: every roster file in "
+        "one `<folder>-all` table with team/year columns and a (team, year) index.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip files whose size/mtime/hash match table_index and append only the new "
+        "tail of files that grew; everything else is reloaded.",
+    )
+    parser.add_argument(
+        "--no-indexes",
+        action="store_true",
+        help="Skip adding player/game/year/team indexes after each load.",
+    )
     return parser.parse_args(argv)
 
 
+def plan_load_jobs(roster_mode: str = "tables") -> List[Tuple[Path, str]]:
+    """List (file, table_name) for everything under mainfiles, in load order.
+
+    With roster_mode="single" a roster folder is one job (the folder itself).
+    """
+    jobs: List[Tuple[Path, str]] = []
+
+    for filename in TARGET_CSV_FILES:
+        csv_path = MAINFILES_DIR / filename
+        if not csv_path.exists():
+            print(f"[WARN] CSV file not found, skipping: {csv_path}")
+            continue
+
+        # Prefer our simple, explicit table names if configured
+        if filename in SIMPLE_TABLE_NAMES:
+            table_name = SIMPLE_TABLE_NAMES[filename]
+        else:
+            # Fallback: use file name without extension
+            table_name = os.path.splitext(filename)[0]
+        jobs.append((csv_path, f"main-{table_name}"))
+
+    # Now process subfolders inside mainfiles (allstar, biodata, postseason, tiebreakers,
+    # regular, basiccsv, roster, etc.)
+    for subdir in sorted(MAINFILES_DIR.iterdir()):
+        if not subdir.is_dir():
+            continue
+
+        folder_name = subdir.name
+
+        # Special handling for roster/rosters: one table per file (CSV or ROS),
+        # named "<folder>-<basename>".
+        if folder_name.lower() in ROSTER_FOLDERS:
+            if roster_mode == "single":
+                jobs.append((subdir, f"{folder_name}-{ROSTER_TABLE_BASE}"))
+                continue
+            for data_path in iter_data_files(subdir):
+                base = data_path.stem  # e.g., BOS1916, nyy_2024, etc.
+                jobs.append((data_path, f"{folder_name}-{base}"))
+            continue
+
+        # All other subfolders get tables named "<folder>-<base>_1899_2024" when the base
+        # is one of the main Retrosheet master files; otherwise "<folder>-<base>".
+        for data_path in iter_data_files(subdir):
+            base = data_path.stem  # e.g., allplayers, batting, fielding, etc.
+            if base in MASTER_BASE_FILES:
+                table_base = f"{base}_1899_2024"
+            else:
+                table_base = base
+            jobs.append((data_path, f"{folder_name}-{table_base}"))
+
+    return jobs
+
+
+def run_jobs_serial(
+    conn, jobs: List[Tuple[Path, str]], load_opts: Dict, previous: Dict[str, Dict]
+) -> List[LoadResult]:
+    """Load every job on one connection, committing per table.
+
+    Full reloads swap tables in with DDL, which commits implicitly, so a
+    run cannot be one rollback-able transaction. Instead each table's
+    table_index row is written and committed right after its load: a
+    failure leaves the earlier tables loaded and correctly indexed.
+    """
+    results: List[LoadResult] = []
+    with conn.cursor() as cur:
+        for data_path, table_name in jobs:
+            result = load_table(cur, data_path, table_name, previous=previous.get(table_name), **load_opts)
+            record_load(cur, result)
+            conn.commit()
+            results.append(result)
+    return results
+
+
+def run_jobs_parallel(
+    args, jobs: List[Tuple[Path, str]], load_opts: Dict, previous: Dict[str, Dict], workers: int
+) -> List[LoadResult]:
+    """Load jobs on a thread pool, one connection per worker, committing per table.
+
+    Largest files are submitted first so a big file like plays.csv starts
+    immediately instead of becoming the tail of the run.
+    """
+    local = threading.local()
+    opened = []
+    lock = threading.Lock()
+
+    def worker_conn():
+        if getattr(local, "conn", None) is None:
+            local.conn = connect_db(args)
+            with lock:
+                opened.append(local.conn)
+        return local.conn
+
+    def run(data_path: Path, table_name: str) -> LoadResult:
+        conn = worker_conn()
+        try:
+            with conn.cursor() as cur:
+                result = load_table(cur, data_path, table_name, previous=previous.get(table_name), **load_opts)
+                record_load(cur, result)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return result
+
+    def job_size(path: Path) -> int:
+        if path.is_dir():
+            return sum(p.stat().st_size for p in iter_data_files(path))
+        return path.stat().st_size
+
+    ordered = sorted(jobs, key=lambda job: job_size(job[0]), reverse=True)
+    results: List[LoadResult] = []
+    ex = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = {ex.submit(run, data_path, table_name): table_name for data_path, table_name in ordered}
+        for fut in as_completed(futures):
+            results.append(fut.result())
+            print(f"[INFO] Loaded `{futures[fut]}` ({len(results)}/{len(ordered)})")
+    except Exception:
+        ex.shutdown(wait=True, cancel_futures=True)
+        raise
+    finally:
+        ex.shutdown(wait=True)
+        for conn in opened:
+            conn.close()
+    # Report results in the same order as a serial run
+    position = {table_name: i for i, (_, table_name) in enumerate(jobs)}
+    results.sort(key=lambda r: position[r.table])
+    return results
+
+
 def main(argv=None) -> None:
     args = parse_args(argv)
 
@@ -275,67 +1691,36 @@ def main(argv=None) -> None:
         with conn.cursor() as cur:
             # Make sure our index table exists
             ensure_table_index(cur)
-
-            total_rows_across_files = 0
-            total_tables_created = 0
-
-            for filename in TARGET_CSV_FILES:
-                csv_path = MAINFILES_DIR / filename
-                if not csv_path.exists():
-                    print(f"[WARN] CSV file not found, skipping: {csv_path}")
-                    continue
-
-                # Prefer our simple, explicit table names if configured
-                if filename in SIMPLE_TABLE_NAMES:
-                    table_name = SIMPLE_TABLE_NAMES[filename]
-                else:
-                    # Fallback: use file name without extension
-                    table_name = os.path.splitext(filename)[0]
-                prefixed_table_name = f"main-{table_name}"
-                rows = load_csv_into_table(cur, csv_path, prefixed_table_name)
-                update_table_index(cur, prefixed_table_name, csv_path, rows)
-                total_rows_across_files += rows
-                total_tables_created += 1
-
-            # Now process subfolders inside mainfiles (allstar, biodata, postseason, tiebreakers,
-            # regular, basiccsv, roster, etc.)
-            for subdir in sorted(MAINFILES_DIR.iterdir()):
-                if not subdir.is_dir():
-                    continue
-
-                folder_name = subdir.name
-
-                # Special handling for roster/rosters: one table per file (CSV or ROS),
-                # named "<folder>-<basename>".
-                if folder_name.lower() in {"roster", "rosters"}:
-                    for data_path in iter_data_files(subdir):
-                        base = data_path.stem  # e.g., BOS1916, nyy_2024, etc.
-                        table_name = f"{folder_name}-{base}"
-                        rows = load_csv_into_table(cur, data_path, table_name)
-                        update_table_index(cur, table_name, data_path, rows)
-                        total_rows_across_files += rows
-                        total_tables_created += 1
-                    continue
-
-                # All other subfolders get tables named "<folder>-<base>_1899_2024" when the base
-                # is one of the main Retrosheet master files; otherwise "<folder>-<base>".
-                for data_path in iter_data_files(subdir):
-                    base = data_path.stem  # e.g., allplayers, batting, fielding, etc.
-                    if base in MASTER_BASE_FILES:
-                        table_base = f"{base}_1899_2024"
-                    else:
-                        table_base = base
-
-                    table_name = f"{folder_name}-{table_base}"
-                    rows = load_csv_into_table(cur, data_path, table_name)
-                    update_table_index(cur, table_name, data_path, rows)
-                    total_rows_across_files += rows
-                    total_tables_created += 1
-
-            conn.commit()
-            print("[INFO] All CSVs processed.")
-            print(f"       Total tables created/updated: {total_tables_created}")
-            print(f"       Total rows inserted across files: {total_rows_across_files}")
+            previous = read_table_index(cur) if args.incremental else {}
+
+        load_opts = dict(
+            bulk=args.bulk_load,
+            infer_types=args.infer_types,
+            sample_rows=args.type_sample_rows,
+            index=not args.no_indexes,
+            incremental=args.incremental,
+            parse_procs=args.parse_procs,
+            metrics_log=None if args.no_metrics_log else args.metrics_log,
+        )
+        jobs = plan_load_jobs(args.roster_mode)
+        if args.workers > 1:
+            print(f"[INFO] Loading {len(jobs)} file(s) with {args.workers} workers")
+            results = run_jobs_parallel(args, jobs, load_opts, previous, args.workers)
+        else:
+            results = run_jobs_serial(conn, jobs, load_opts, previous)
+
+        actions = {a: sum(1 for r in results if r.action == a) for a in ("full", "append", "unchanged", "skipped")}
+        total_rows_across_files = sum(r.inserted for r in results)
+        print("[INFO] All CSVs processed.")
+        print(f"       Total tables created/updated: {actions['full'] + actions['append']}")
+        if args.incremental:
+            print(
+                f"       Full reloads: {actions['full']}, appended: {actions['append']}, "
+                f"unchanged: {actions['unchanged'] + actions['skipped']}"
+            )
+        print(f"       Total rows inserted across files: {total_rows_across_files}")
+        if load_opts["metrics_log"]:
+            print(f"       Per-table load metrics: {load_opts['metrics_log']}")
 
     except Exception as e:
         conn.rollback()
@@ -7,7 +7,8 @@ This script is designed to be robust to small schema differences across your
 CSV imports. It:
 
 1) Detects key columns in each <prefix>-allplayers_1899_2024 (birthCountry, birthYear,
-   firstGame/debut, playerID, etc.) and builds a clean staging view per prefix.
+   firstGame/debut, playerID, etc.) and builds a clean staging view per prefix
+   (or, with --materialize-players, an indexed table refreshed only when its source changes).
 2) Computes country distributions overall, by birth decade, and by debut decade per prefix.
 3) Computes foreign-vs-US batting/pitching performance summaries by decade per prefix.
 
@@ -21,14 +22,25 @@ You can extend this with more subparts later without breaking existing tables.
 Run:
   python3 country-main-analysis.py --db mlb_impact --user root --password '...'
 
+Independent steps (e.g. batting/pitching/fielding by year, the country % tables, other
+prefixes) can run concurrently on separate connections with --jobs N; see plan_steps().
+With --incremental the foreign_vs_us_*_year tables only recompute seasons whose source rows
+changed (per-season checksums are kept in season_checksums).
+
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
 import sys
 import re
-from typing import Dict, List, Optional, Tuple
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
 import pymysql
 
@@ -45,6 +57,32 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--charset", default="utf8mb4")
     p.add_argument("--rebuild", action="store_true", help="Drop/recreate summary tables")
     p.add_argument("--debug", action="store_true")
+    p.add_argument(
+        "--materialize-players",
+        action="store_true",
+        help="Build <prefix>_players_clean as an indexed table (refreshed only when its source changes) instead of a view",
+    )
+    p.add_argument(
+        "--schema-cache",
+        type=Path,
+        default=None,
+        help=(
+            "JSON file caching table columns between runs (default: .schema_cache.<db>.json next to this script); "
+            "delete it after altering table columns outside this script"
+        ),
+    )
+    p.add_argument("--no-schema-cache", action="store_true", help="Don't read or write the schema cache file")
+    p.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only recompute the foreign_vs_us_*_year seasons whose source rows changed since the last incremental run",
+    )
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Run independent compute steps concurrently on this many connections (default: 1, serial)",
+    )
     p.add_argument(
         "--prefixes",
         default="main",
@@ -91,9 +129,11 @@ def ensure_regular_postseason_comparison_tables(cur, rebuild: bool = False, debu
     if table_exists(cur, bat_reg) and table_exists(cur, bat_post):
         target = "regular_vs_postseason_foreign_vs_us_batting_year"
         if rebuild:
-            cur.execute(f"DROP TABLE IF EXISTS {target}")
+            drop_table(cur, target)
 
-        cur.execute(
+        execute_ddl(
+            cur,
+            target,
             f"""
             CREATE TABLE IF NOT EXISTS {target} (
                 year INT NOT NULL,
@@ -126,7 +166,7 @@ def ensure_regular_postseason_comparison_tables(cur, rebuild: bool = False, debu
                 diff_so_rate DOUBLE NULL,
                 PRIMARY KEY (year, group_type)
             ) ENGINE=InnoDB;
-            """
+            """,
         )
 
         cur.execute(f"TRUNCATE TABLE {target}")
@@ -179,9 +219,11 @@ def ensure_regular_postseason_comparison_tables(cur, rebuild: bool = False, debu
     if table_exists(cur, pit_reg) and table_exists(cur, pit_post):
         target = "regular_vs_postseason_foreign_vs_us_pitching_year"
         if rebuild:
-            cur.execute(f"DROP TABLE IF EXISTS {target}")
+            drop_table(cur, target)
 
-        cur.execute(
+        execute_ddl(
+            cur,
+            target,
             f"""
             CREATE TABLE IF NOT EXISTS {target} (
                 year INT NOT NULL,
@@ -214,7 +256,7 @@ def ensure_regular_postseason_comparison_tables(cur, rebuild: bool = False, debu
                 diff_so9 DOUBLE NULL,
                 PRIMARY KEY (year, group_type)
             ) ENGINE=InnoDB;
-            """
+            """,
         )
 
         cur.execute(f"TRUNCATE TABLE {target}")
@@ -277,20 +319,209 @@ def table_name(prefix: str, base: str) -> str:
 
 # ----------------------------- Schema Helpers ------------------------------
 
-def get_columns(cur, table_name: str) -> List[str]:
+# Column lists are re-fetched in one query for tables whose IN-list stays under this size;
+# past it the whole schema is read instead.
+SCHEMA_STALE_IN_LIMIT = 500
+
+
+class SchemaCatalog:
+    """Per-run snapshot of INFORMATION_SCHEMA for the current database.
+
+    load() reads TABLES once and COLUMNS at most once. Column lists are also
+    persisted to a JSON file between runs, keyed by each table's
+    CREATE_TIME/UPDATE_TIME, so unchanged tables don't hit COLUMNS at all
+    (views have no timestamps and are always re-read). MySQL 8 caches those
+    timestamps for information_schema_stats_expiry seconds (24h by default),
+    so load() turns that cache off for its session. An in-place ALTER TABLE
+    (e.g. ADD COLUMN ... ALGORITHM=INSTANT) need not change either timestamp:
+    after changing a table's columns outside this script, delete the cache
+    file or run once with --no-schema-cache.
+
+    Lookups that miss the snapshot fall through to a live query, so tables we
+    create during the run are still found. DDL goes through execute_ddl() or
+    drop_table(), which forget() the table so stale columns aren't served;
+    get_columns(expect=...) also re-reads a cached table that lacks a column
+    the caller relies on.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = cache_path
+        self.columns: Dict[str, List[str]] = {}
+        self.stamps: Dict[str, str] = {}
+        self.database: Optional[str] = None
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _stamp(row: Dict) -> Optional[str]:
+        if row.get("CREATE_TIME") is None:
+            return None
+        return f"{row['CREATE_TIME']}|{row.get('UPDATE_TIME')}"
+
+    def _read_cache(self) -> Dict[str, Dict]:
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if data.get("database") != self.database:
+            return {}
+        return data.get("tables", {})
+
+    def load(self, cur, debug: bool = False):
+        cur.execute("SELECT DATABASE() AS db")
+        self.database = cur.fetchone()["db"]
+        try:
+            # Read CREATE_TIME/UPDATE_TIME from the storage engine, not MySQL 8's stats cache
+            cur.execute("SET SESSION information_schema_stats_expiry = 0")
+        except pymysql.MySQLError:
+            pass  # MySQL 5.7 / MariaDB: no cache, nothing to turn off
+        cur.execute(
+            """
+            SELECT TABLE_NAME, CREATE_TIME, UPDATE_TIME
+            FROM INFORMATION_SCHEMA.TABLES
+            WHERE TABLE_SCHEMA = DATABASE()
+            """
+        )
+        stamps = {r["TABLE_NAME"]: self._stamp(r) for r in cur.fetchall()}
+        saved = self._read_cache()
+
+        columns: Dict[str, List[str]] = {}
+        stale = set()
+        for name, stamp in stamps.items():
+            entry = saved.get(name)
+            if stamp is not None and entry and entry.get("stamp") == stamp:
+                columns[name] = list(entry["columns"])
+            else:
+                stale.add(name)
+
+        if stale:
+            sql = "SELECT TABLE_NAME, COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS WHERE TABLE_SCHEMA = DATABASE()"
+            params: Tuple = ()
+            if len(stale) < len(stamps) and len(stale) <= SCHEMA_STALE_IN_LIMIT:
+                sql += " AND TABLE_NAME IN (" + ", ".join(["%s"] * len(stale)) + ")"
+                params = tuple(sorted(stale))
+            cur.execute(sql + " ORDER BY TABLE_NAME, ORDINAL_POSITION", params)
+            for r in cur.fetchall():
+                if r["TABLE_NAME"] in stale:
+                    columns.setdefault(r["TABLE_NAME"], []).append(r["COLUMN_NAME"])
+
+        with self.lock:
+            self.columns = columns
+            self.stamps = {name: stamp for name, stamp in stamps.items() if stamp is not None}
+        if debug:
+            print(f"[DEBUG] Schema catalog: {len(stamps)} table(s), {len(stale)} re-read from INFORMATION_SCHEMA")
+
+    def save(self):
+        if self.cache_path is None:
+            return
+        with self.lock:
+            tables = {
+                name: {"stamp": self.stamps[name], "columns": cols}
+                for name, cols in self.columns.items()
+                if name in self.stamps
+            }
+        payload = {"database": self.database, "tables": tables}
+        tmp = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, self.cache_path)
+
+    def get(self, name: str) -> Optional[List[str]]:
+        with self.lock:
+            cols = self.columns.get(name)
+        return list(cols) if cols is not None else None
+
+    def learn(self, name: str, cols: List[str]):
+        # Learned mid-run: no stamp, so it is served this run but not persisted.
+        if cols:
+            with self.lock:
+                self.columns[name] = list(cols)
+
+    def forget(self, name: str):
+        with self.lock:
+            self.columns.pop(name, None)
+            self.stamps.pop(name, None)
+
+    def like(self, like_pattern: str) -> List[str]:
+        """Tables matching a SQL LIKE pattern (case-insensitive, '\\' escapes)."""
+        regex = ""
+        chars = iter(like_pattern)
+        for ch in chars:
+            if ch == "\\":
+                regex += re.escape(next(chars, "\\"))
+            elif ch == "%":
+                regex += ".*"
+            elif ch == "_":
+                regex += "."
+            else:
+                regex += re.escape(ch)
+        rx = re.compile(regex, re.IGNORECASE | re.DOTALL)
+        with self.lock:
+            names = sorted(self.columns)
+        return [name for name in names if rx.fullmatch(name)]
+
+
+# Set by main(); the helpers below fall back to live INFORMATION_SCHEMA queries without it.
+SCHEMA: Optional[SchemaCatalog] = None
+
+
+def forget_table(name: str):
+    """Drop a table from the schema catalog after we DROP/ALTER/replace it."""
+    if SCHEMA is not None:
+        SCHEMA.forget(name)
+
+
+def execute_ddl(cur, name: str, sql: str, params: Optional[Tuple] = None):
+    """Run DDL that creates, alters, replaces or drops table `name`, then forget it in the catalog.
+
+    Every schema change goes through here (or drop_table) so the catalog
+    never serves columns from before it.
+    """
+    cur.execute(sql, params)
+    forget_table(name)
+
+
+def drop_table(cur, name: str):
+    """DROP TABLE IF EXISTS and forget it in the schema catalog."""
+    execute_ddl(cur, name, f"DROP TABLE IF EXISTS `{name}`")
+
+
+def get_columns(cur, table_name: str, expect: Tuple[str, ...] = ()) -> List[str]:
+    """Column names of table_name, from the schema catalog when it has them.
+
+    A cached list missing any column named in expect (case-insensitive) is
+    treated as stale and re-read live, in case the table changed under us.
+    """
+    if SCHEMA is not None:
+        cols = SCHEMA.get(table_name)
+        if cols is not None:
+            have = {c.lower() for c in cols}
+            if all(c.lower() in have for c in expect):
+                return cols
+            SCHEMA.forget(table_name)
     cur.execute(
         """
         SELECT COLUMN_NAME
         FROM INFORMATION_SCHEMA.COLUMNS
         WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        ORDER BY ORDINAL_POSITION
         """,
         (table_name,),
     )
-    return [r["COLUMN_NAME"] for r in cur.fetchall()]
+    cols = [r["COLUMN_NAME"] for r in cur.fetchall()]
+    if SCHEMA is not None:
+        SCHEMA.learn(table_name, cols)
+    return cols
 
 # ---------------------- Table Listing Helpers -----------------------
 
 def list_tables(cur, like_pattern: str) -> List[str]:
+    # As with table_exists, an empty answer from the catalog may mean the
+    # tables were created since load(), so ask the server.
+    if SCHEMA is not None:
+        names = SCHEMA.like(like_pattern)
+        if names:
+            return names
     cur.execute(
         """
         SELECT TABLE_NAME
@@ -303,6 +534,9 @@ def list_tables(cur, like_pattern: str) -> List[str]:
 
 
 def table_exists(cur, name: str) -> bool:
+    # Only positive answers are cached; a miss may be a table created since load().
+    if SCHEMA is not None and SCHEMA.get(name) is not None:
+        return True
     cur.execute(
         """
         SELECT 1
@@ -315,6 +549,21 @@ def table_exists(cur, name: str) -> bool:
     return cur.fetchone() is not None
 
 
+def _blank_to_null(col: str) -> str:
+    # NULLIF(col, '') on a numeric column (--infer-types) compares 0 = '' as
+    # true and turns real zeros into NULL; comparing the text form only maps
+    # empty strings, whatever the column type.
+    return f"NULLIF(CAST({col} AS CHAR), '')"
+
+
+def _year_or_null(expr: str) -> str:
+    # Anything but a four-digit year ("?", "c1870", blanks) becomes NULL, so a
+    # junk value can't fail the strict INSERT that materializes players_clean.
+    if expr == "NULL":
+        return "CAST(NULL AS UNSIGNED)"
+    return f"CASE WHEN {expr} REGEXP '^[0-9]{{4}}$' THEN CAST({expr} AS UNSIGNED) END"
+
+
 def pick_first_table(cur, patterns: List[str]) -> Optional[str]:
     for pat in patterns:
         tbls = list_tables(cur, pat)
@@ -411,7 +660,7 @@ def ensure_bio_view(cur, prefix: str, rebuild: bool = False, debug: bool = False
             if not col or col not in cols:
                 return "NULL"
             if cast:
-                return f"CAST(NULLIF({col}, '') AS {cast})"
+                return f"CAST({_blank_to_null(col)} AS {cast})"
             return f"NULLIF(TRIM({col}), '')"
 
         if debug:
@@ -436,18 +685,20 @@ def ensure_bio_view(cur, prefix: str, rebuild: bool = False, debug: bool = False
     # Always ensure we can create the view name:
     # - Drop any TABLE with this name (from older runs).
     # - Use CREATE OR REPLACE VIEW so existing views are overwritten cleanly.
-    cur.execute(f"DROP TABLE IF EXISTS `{view_name}`")
+    drop_table(cur, view_name)
 
     union_sql = "\nUNION ALL\n".join(selects)
-    cur.execute(f"CREATE OR REPLACE VIEW {view_name} AS\n{union_sql};")
+    execute_ddl(cur, view_name, f"CREATE OR REPLACE VIEW {view_name} AS\n{union_sql};")
     return view_name
 
 
 def ensure_bio_summary_table(cur, prefix: str, rebuild: bool = False):
     if rebuild:
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_foreign_vs_us_bio_overall")
+        drop_table(cur, f"{prefix}_foreign_vs_us_bio_overall")
 
-    cur.execute(
+    execute_ddl(
+        cur,
+        f"{prefix}_foreign_vs_us_bio_overall",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_foreign_vs_us_bio_overall (
             source_table VARCHAR(128) NOT NULL DEFAULT 'ALL',
@@ -462,7 +713,7 @@ def ensure_bio_summary_table(cur, prefix: str, rebuild: bool = False):
             throws_R_pct DOUBLE NULL,
             PRIMARY KEY (source_table, group_type)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
 
@@ -484,7 +735,7 @@ def compute_foreign_vs_us_bio_overall(cur, prefix: str, bio_view: str, debug: bo
         WITH joined AS (
             SELECT
                 p.player_id,
-                {_country_group_expr('p.birth_country')} AS group_type,
+                p.group_type,
                 b.bats,
                 b.throws_hand,
                 b.height,
@@ -493,7 +744,7 @@ def compute_foreign_vs_us_bio_overall(cur, prefix: str, bio_view: str, debug: bo
             FROM {players_view} p
             LEFT JOIN {bio_view} b
               ON p.player_id = b.player_id
-            WHERE {_country_group_expr('p.birth_country')} IS NOT NULL
+            WHERE p.group_type IS NOT NULL
         )
         SELECT
             source_table,
@@ -521,7 +772,7 @@ def compute_foreign_vs_us_bio_overall(cur, prefix: str, bio_view: str, debug: bo
         WITH joined AS (
             SELECT
                 p.player_id,
-                {_country_group_expr('p.birth_country')} AS group_type,
+                p.group_type,
                 b.bats,
                 b.throws_hand,
                 b.height,
@@ -529,7 +780,7 @@ def compute_foreign_vs_us_bio_overall(cur, prefix: str, bio_view: str, debug: bo
             FROM {players_view} p
             LEFT JOIN {bio_view} b
               ON p.player_id = b.player_id
-            WHERE {_country_group_expr('p.birth_country')} IS NOT NULL
+            WHERE p.group_type IS NOT NULL
         )
         SELECT
             'ALL' AS source_table,
@@ -557,33 +808,40 @@ def pick_column(columns: List[str], candidates: List[str]) -> Optional[str]:
 
 
 def ensure_index_table(cur, rebuild: bool = False):
+    # Always read table_index's columns live; the ALTERs below depend on them.
+    forget_table("table_index")
     if rebuild:
-        cur.execute("DROP TABLE IF EXISTS table_index")
+        drop_table(cur, "table_index")
 
     # Create a minimal version if it does not exist yet.
-    cur.execute(
+    execute_ddl(
+        cur,
+        "table_index",
         """
         CREATE TABLE IF NOT EXISTS table_index (
             table_name VARCHAR(128) PRIMARY KEY,
             row_count BIGINT NULL
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
     # Make sure optional columns exist without assuming an exact prior schema.
     cols = get_columns(cur, "table_index")
 
     if "source_folder" not in cols:
-        cur.execute("ALTER TABLE table_index ADD COLUMN source_folder VARCHAR(64) NULL")
+        execute_ddl(cur, "table_index", "ALTER TABLE table_index ADD COLUMN source_folder VARCHAR(64) NULL")
 
     if "source_file" not in cols:
-        cur.execute("ALTER TABLE table_index ADD COLUMN source_file VARCHAR(128) NULL")
+        execute_ddl(cur, "table_index", "ALTER TABLE table_index ADD COLUMN source_file VARCHAR(128) NULL")
 
     if "notes" not in cols:
-        cur.execute("ALTER TABLE table_index ADD COLUMN notes TEXT NULL")
+        execute_ddl(cur, "table_index", "ALTER TABLE table_index ADD COLUMN notes TEXT NULL")
 
     if "created_at" not in cols:
-        cur.execute("ALTER TABLE table_index ADD COLUMN created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP")
+        execute_ddl(cur, "table_index", "ALTER TABLE table_index ADD COLUMN created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP")
+
+    if "source_fingerprint" not in cols:
+        execute_ddl(cur, "table_index", "ALTER TABLE table_index ADD COLUMN source_fingerprint VARCHAR(64) NULL")
 
 
 def upsert_table_index(cur, table_name: str, source_folder: str = None, source_file: str = None, notes: str = None):
@@ -603,16 +861,17 @@ def upsert_table_index(cur, table_name: str, source_folder: str = None, source_f
 
 # --------------------------- Staging / Cleaning ----------------------------
 
-def ensure_players_view(cur, prefix: str, rebuild: bool = False, debug: bool = False):
-    """Create a VIEW <prefix>_players_clean over <prefix>-allplayers_1899_2024.
+def players_clean_select(cur, prefix: str, debug: bool = False) -> Tuple[str, str]:
+    """Return (base_table, SELECT sql) standardizing <prefix>-allplayers_1899_2024.
 
     We standardize:
       - player_id
       - birth_country
       - birth_year
       - debut_year (derived from firstGame / debut / first_game)
+      - group_type ('US' / 'FOREIGN' / NULL, see _country_group_expr)
 
-    The view uses COALESCE over detected columns so it survives schema drift.
+    The SELECT uses COALESCE over detected columns so it survives schema drift.
     """
 
     base = table_name(prefix, "allplayers_1899_2024")
@@ -646,63 +905,194 @@ def ensure_players_view(cur, prefix: str, rebuild: bool = False, debug: bool = F
 
     birth_year_expr = "NULL"
     if birth_year and birth_year in cols:
-        birth_year_expr = f"NULLIF({birth_year}, '')"
+        birth_year_expr = _blank_to_null(birth_year)
+
+    select_sql = f"""
+        SELECT
+            {player_id} AS player_id,
+            {birth_country_expr} AS birth_country,
+            {_year_or_null(birth_year_expr)} AS birth_year,
+            {_year_or_null(debut_expr)} AS debut_year,
+            {_country_group_expr(birth_country_expr)} AS group_type
+        FROM `{base}`
+    """
+    return base, select_sql
+
 
+def ensure_players_view(cur, prefix: str, rebuild: bool = False, debug: bool = False):
+    """Create a VIEW <prefix>_players_clean over <prefix>-allplayers_1899_2024."""
+
+    _, select_sql = players_clean_select(cur, prefix, debug=debug)
     view_name = f"{prefix}_players_clean"
 
     # Always ensure the name can be used for a view
-    cur.execute(f"DROP TABLE IF EXISTS `{view_name}`")
+    drop_table(cur, view_name)
     # (No need to drop existing view because CREATE OR REPLACE handles it)
 
+    execute_ddl(cur, view_name, f"CREATE OR REPLACE VIEW {view_name} AS {select_sql};")
+
+
+def players_source_fingerprint(cur, base: str, select_sql: str) -> str:
+    """Fingerprint of the players source table plus the SELECT that cleans it.
+
+    Prefers the table_index row the uploader writes (source_hash + row_count);
+    tables loaded some other way fall back to information_schema timestamps
+    and an exact row count. The SELECT is folded in so a change in detected
+    columns also forces a refresh.
+    """
+    source = None
+    if "source_hash" in get_columns(cur, "table_index", expect=("source_hash",)):
+        cur.execute("SELECT row_count, source_hash FROM table_index WHERE table_name = %s", (base,))
+        row = cur.fetchone()
+        if row and row.get("source_hash"):
+            source = f"index:{row['source_hash']}:{row['row_count']}"
+    if source is None:
+        cur.execute(
+            """
+            SELECT CREATE_TIME, UPDATE_TIME
+            FROM INFORMATION_SCHEMA.TABLES
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+            """,
+            (base,),
+        )
+        row = cur.fetchone() or {}
+        cur.execute(f"SELECT COUNT(*) AS n FROM `{base}`")
+        source = f"schema:{row.get('CREATE_TIME')}:{row.get('UPDATE_TIME')}:{cur.fetchone()['n']}"
+    return hashlib.sha1(f"{source}\n{' '.join(select_sql.split())}".encode("utf-8")).hexdigest()
+
+
+def table_type(cur, name: str) -> Optional[str]:
+    """'BASE TABLE', 'VIEW' or None if nothing by that name exists."""
+    cur.execute(
+        """
+        SELECT TABLE_TYPE
+        FROM INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        """,
+        (name,),
+    )
+    row = cur.fetchone()
+    return row["TABLE_TYPE"] if row else None
+
+
+def ensure_players_table(cur, prefix: str, rebuild: bool = False, debug: bool = False):
+    """Materialize <prefix>_players_clean as a typed, indexed TABLE.
+
+    Same columns as the view, but player_id is the primary key and group_type is
+    stored, so the compute_* joins hit an index instead of re-running TRIM /
+    SUBSTRING / CAST per query. The table is rebuilt only when the fingerprint of
+    <prefix>-allplayers_1899_2024 (see players_source_fingerprint) differs from
+    the one recorded in table_index.source_fingerprint, or with --rebuild.
+    """
+
+    base, select_sql = players_clean_select(cur, prefix, debug=debug)
+    name = f"{prefix}_players_clean"
+    fingerprint = players_source_fingerprint(cur, base, select_sql)
+
+    if not rebuild and table_type(cur, name) == "BASE TABLE":
+        cur.execute("SELECT source_fingerprint FROM table_index WHERE table_name = %s", (name,))
+        row = cur.fetchone()
+        if row and row["source_fingerprint"] == fingerprint:
+            if debug:
+                print(f"[INFO] {name} is up to date with {base}; not rebuilding")
+            return
+
+    if debug:
+        print(f"[STEP] Materializing {name} from {base}")
+
+    new_name = f"{name}__new"
+    drop_table(cur, new_name)
+    execute_ddl(
+        cur,
+        new_name,
+        f"""
+        CREATE TABLE `{new_name}` (
+            player_id VARCHAR(64) NOT NULL,
+            birth_country VARCHAR(64) NULL,
+            birth_year SMALLINT UNSIGNED NULL,
+            debut_year SMALLINT UNSIGNED NULL,
+            group_type ENUM('US','FOREIGN') NULL,
+            PRIMARY KEY (player_id),
+            KEY idx_group_type (group_type),
+            KEY idx_birth_country (birth_country)
+        ) ENGINE=InnoDB;
+        """,
+    )
+    # A player id listed more than once collapses to one row: the smallest
+    # non-NULL value per column, with group_type derived from the chosen
+    # birth_country so the two always agree. A plain INSERT (no IGNORE) makes
+    # values that don't fit the typed columns fail the build instead of
+    # being silently truncated or clamped.
     cur.execute(
         f"""
-        CREATE OR REPLACE VIEW {view_name} AS
+        INSERT INTO `{new_name}` (player_id, birth_country, birth_year, debut_year, group_type)
         SELECT
-            {player_id} AS player_id,
-            {birth_country_expr} AS birth_country,
-            CAST({birth_year_expr} AS UNSIGNED) AS birth_year,
-            CAST({debut_expr} AS UNSIGNED) AS debut_year
-        FROM `{base}`;
+            src.player_id,
+            MIN(src.birth_country),
+            MIN(src.birth_year),
+            MIN(src.debut_year),
+            {_country_group_expr("MIN(src.birth_country)")}
+        FROM ({select_sql}) src
+        WHERE src.player_id IS NOT NULL AND src.player_id <> ''
+        GROUP BY src.player_id;
         """
     )
 
+    # Swap in the new table; a leftover view of the same name is just dropped.
+    if table_type(cur, name) == "VIEW":
+        execute_ddl(cur, name, f"DROP VIEW `{name}`")
+    if table_exists(cur, name):
+        old_name = f"{name}__old"
+        drop_table(cur, old_name)
+        execute_ddl(cur, name, f"RENAME TABLE `{name}` TO `{old_name}`, `{new_name}` TO `{name}`")
+        drop_table(cur, old_name)
+    else:
+        execute_ddl(cur, name, f"RENAME TABLE `{new_name}` TO `{name}`")
+
+    upsert_table_index(cur, name, source_folder="derived", notes=f"Materialized players_clean from {base}")
+    cur.execute("UPDATE table_index SET source_fingerprint = %s WHERE table_name = %s", (fingerprint, name))
+
 
 # --------------------------- Summary Table DDL -----------------------------
 
 def ensure_summary_tables_for_prefix(cur, prefix: str, rebuild: bool = False):
     # % tables
     if rebuild:
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_country_overall_pct")
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_country_birth_year_pct")
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_country_debut_year_pct")
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_foreign_vs_us_batting_year")
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_foreign_vs_us_pitching_year")
+        drop_table(cur, f"{prefix}_country_overall_pct")
+        drop_table(cur, f"{prefix}_country_birth_year_pct")
+        drop_table(cur, f"{prefix}_country_debut_year_pct")
+        drop_table(cur, f"{prefix}_foreign_vs_us_batting_year")
+        drop_table(cur, f"{prefix}_foreign_vs_us_pitching_year")
         # Clean up old decade tables if present
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_country_birth_decade_pct")
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_country_debut_decade_pct")
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_foreign_vs_us_batting_decade")
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_foreign_vs_us_pitching_decade")
+        drop_table(cur, f"{prefix}_country_birth_decade_pct")
+        drop_table(cur, f"{prefix}_country_debut_decade_pct")
+        drop_table(cur, f"{prefix}_foreign_vs_us_batting_decade")
+        drop_table(cur, f"{prefix}_foreign_vs_us_pitching_decade")
         # Drop new summary/career/top-player tables if present
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_player_career_batting")
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_player_career_pitching")
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_country_batting_career_summary")
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_country_pitching_career_summary")
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_country_batting_top_players")
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_country_pitching_top_players")
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_player_career_span")
-        cur.execute(f"DROP TABLE IF EXISTS {prefix}_country_primary_position")
-
-    cur.execute(
+        drop_table(cur, f"{prefix}_player_career_batting")
+        drop_table(cur, f"{prefix}_player_career_pitching")
+        drop_table(cur, f"{prefix}_country_batting_career_summary")
+        drop_table(cur, f"{prefix}_country_pitching_career_summary")
+        drop_table(cur, f"{prefix}_country_batting_top_players")
+        drop_table(cur, f"{prefix}_country_pitching_top_players")
+        drop_table(cur, f"{prefix}_player_career_span")
+        drop_table(cur, f"{prefix}_country_primary_position")
+
+    execute_ddl(
+        cur,
+        f"{prefix}_country_overall_pct",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_country_overall_pct (
             birth_country VARCHAR(64) PRIMARY KEY,
             player_count BIGINT NOT NULL,
             pct_of_total DOUBLE NOT NULL
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
-    cur.execute(
+    execute_ddl(
+        cur,
+        f"{prefix}_country_birth_year_pct",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_country_birth_year_pct (
             birth_country VARCHAR(64) NOT NULL,
@@ -711,10 +1101,12 @@ def ensure_summary_tables_for_prefix(cur, prefix: str, rebuild: bool = False):
             pct_of_year DOUBLE NOT NULL,
             PRIMARY KEY (birth_country, year)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
-    cur.execute(
+    execute_ddl(
+        cur,
+        f"{prefix}_country_debut_year_pct",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_country_debut_year_pct (
             birth_country VARCHAR(64) NOT NULL,
@@ -723,11 +1115,13 @@ def ensure_summary_tables_for_prefix(cur, prefix: str, rebuild: bool = False):
             pct_of_year DOUBLE NOT NULL,
             PRIMARY KEY (birth_country, year)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
     # performance comparison tables
-    cur.execute(
+    execute_ddl(
+        cur,
+        f"{prefix}_foreign_vs_us_batting_year",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_foreign_vs_us_batting_year (
             year INT NOT NULL,
@@ -745,10 +1139,12 @@ def ensure_summary_tables_for_prefix(cur, prefix: str, rebuild: bool = False):
             so_rate DOUBLE NULL,
             PRIMARY KEY (year, group_type)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
-    cur.execute(
+    execute_ddl(
+        cur,
+        f"{prefix}_foreign_vs_us_pitching_year",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_foreign_vs_us_pitching_year (
             year INT NOT NULL,
@@ -766,11 +1162,13 @@ def ensure_summary_tables_for_prefix(cur, prefix: str, rebuild: bool = False):
             so9 DOUBLE NULL,
             PRIMARY KEY (year, group_type)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
     # New summary/career/top-player tables
-    cur.execute(
+    execute_ddl(
+        cur,
+        f"{prefix}_country_birth_decade_pct",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_country_birth_decade_pct (
             birth_country VARCHAR(64) NOT NULL,
@@ -779,10 +1177,12 @@ def ensure_summary_tables_for_prefix(cur, prefix: str, rebuild: bool = False):
             pct_of_decade DOUBLE NOT NULL,
             PRIMARY KEY (birth_country, decade)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
-    cur.execute(
+    execute_ddl(
+        cur,
+        f"{prefix}_country_debut_decade_pct",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_country_debut_decade_pct (
             birth_country VARCHAR(64) NOT NULL,
@@ -791,10 +1191,12 @@ def ensure_summary_tables_for_prefix(cur, prefix: str, rebuild: bool = False):
             pct_of_decade DOUBLE NOT NULL,
             PRIMARY KEY (birth_country, decade)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
-    cur.execute(
+    execute_ddl(
+        cur,
+        f"{prefix}_player_career_batting",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_player_career_batting (
             player_id VARCHAR(32) NOT NULL,
@@ -813,10 +1215,12 @@ def ensure_summary_tables_for_prefix(cur, prefix: str, rebuild: bool = False):
             so_rate DOUBLE NULL,
             PRIMARY KEY (player_id)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
-    cur.execute(
+    execute_ddl(
+        cur,
+        f"{prefix}_player_career_pitching",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_player_career_pitching (
             player_id VARCHAR(32) NOT NULL,
@@ -835,10 +1239,12 @@ def ensure_summary_tables_for_prefix(cur, prefix: str, rebuild: bool = False):
             so9 DOUBLE NULL,
             PRIMARY KEY (player_id)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
-    cur.execute(
+    execute_ddl(
+        cur,
+        f"{prefix}_country_batting_career_summary",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_country_batting_career_summary (
             birth_country VARCHAR(64) NOT NULL,
@@ -855,10 +1261,12 @@ def ensure_summary_tables_for_prefix(cur, prefix: str, rebuild: bool = False):
             avg_career_hr_rate DOUBLE NULL,
             PRIMARY KEY (birth_country, group_type)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
-    cur.execute(
+    execute_ddl(
+        cur,
+        f"{prefix}_country_pitching_career_summary",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_country_pitching_career_summary (
             birth_country VARCHAR(64) NOT NULL,
@@ -875,10 +1283,12 @@ def ensure_summary_tables_for_prefix(cur, prefix: str, rebuild: bool = False):
             avg_career_so9 DOUBLE NULL,
             PRIMARY KEY (birth_country, group_type)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
-    cur.execute(
+    execute_ddl(
+        cur,
+        f"{prefix}_country_batting_top_players",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_country_batting_top_players (
             birth_country VARCHAR(64) NOT NULL,
@@ -896,10 +1306,12 @@ def ensure_summary_tables_for_prefix(cur, prefix: str, rebuild: bool = False):
             career_hr_rate DOUBLE NULL,
             PRIMARY KEY (birth_country, group_type, rank_in_country, player_id)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
-    cur.execute(
+    execute_ddl(
+        cur,
+        f"{prefix}_country_pitching_top_players",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_country_pitching_top_players (
             birth_country VARCHAR(64) NOT NULL,
@@ -917,10 +1329,12 @@ def ensure_summary_tables_for_prefix(cur, prefix: str, rebuild: bool = False):
             career_so9 DOUBLE NULL,
             PRIMARY KEY (birth_country, group_type, rank_in_country, player_id)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
-    cur.execute(
+    execute_ddl(
+        cur,
+        f"{prefix}_player_career_span",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_player_career_span (
             player_id VARCHAR(32) NOT NULL,
@@ -932,10 +1346,12 @@ def ensure_summary_tables_for_prefix(cur, prefix: str, rebuild: bool = False):
             span_years INT NULL,
             PRIMARY KEY (player_id)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
-    cur.execute(
+    execute_ddl(
+        cur,
+        f"{prefix}_country_primary_position",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_country_primary_position (
             birth_country VARCHAR(64) NOT NULL,
@@ -944,7 +1360,7 @@ def ensure_summary_tables_for_prefix(cur, prefix: str, rebuild: bool = False):
             pct_of_country DOUBLE NULL,
             PRIMARY KEY (birth_country, primary_pos)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
     # Biodata summary table
@@ -953,185 +1369,232 @@ def ensure_summary_tables_for_prefix(cur, prefix: str, rebuild: bool = False):
 
 # ------------------------ Country % Computations ---------------------------
 
-def compute_overall_country_pct(cur, prefix: str, debug: bool = False):
-    view = f"{prefix}_players_clean"
-    target = f"{prefix}_country_overall_pct"
-    if debug:
-        print(f"[STEP] Computing overall country percentages from {view}")
+# (target suffix, count column, pct column) for each output of compute_country_pct_tables.
+COUNTRY_PCT_TABLES = {
+    "overall": ("country_overall_pct", None, "pct_of_total"),
+    "birth_year": ("country_birth_year_pct", "year", "pct_of_year"),
+    "debut_year": ("country_debut_year_pct", "year", "pct_of_year"),
+    "birth_decade": ("country_birth_decade_pct", "decade", "pct_of_decade"),
+    "debut_decade": ("country_debut_decade_pct", "decade", "pct_of_decade"),
+}
 
-    cur.execute(f"TRUNCATE TABLE {target}")
-    cur.execute(
-        f"""
-        INSERT INTO {target} (birth_country, player_count, pct_of_total)
-        SELECT
-            birth_country,
-            COUNT(DISTINCT player_id) AS player_count,
-            COUNT(DISTINCT player_id) / total.total_players AS pct_of_total
-        FROM {view}
-        JOIN (SELECT COUNT(DISTINCT player_id) AS total_players FROM {view} WHERE birth_country IS NOT NULL) total
-        WHERE birth_country IS NOT NULL
-        GROUP BY birth_country, total.total_players;
-        """
-    )
 
+def _country_pct_rows(groups: Dict[Tuple, Set[bytes]], names: Dict[bytes, str]) -> List[Tuple]:
+    """(country, [period,] count, pct) rows from per-group player sets.
 
-def compute_birth_year_country_pct(cur, prefix: str, debug: bool = False):
+    pct is relative to the distinct players of the period (or overall), so
+    a player listed under two countries counts once in the total, as with
+    COUNT(DISTINCT player_id) in SQL.
+    """
+    totals: Dict[Tuple, Set[bytes]] = {}
+    for key, players in groups.items():
+        totals.setdefault(key[1:], set()).update(players)
+    return [
+        (names[key[0]],) + key[1:] + (len(players), len(players) / len(totals[key[1:]]))
+        for key, players in sorted(groups.items(), key=lambda kv: kv[0][1:])
+    ]
+
+
+def compute_country_pct_tables(cur, prefix: str, debug: bool = False, fetch_rows: int = 10000):
+    """Fill all five <prefix>_country_*_pct tables from a single scan of <prefix>_players_clean.
+
+    Counts match the old per-table GROUP BY birth_country[, period] with
+    COUNT(DISTINCT player_id): rows are grouped on WEIGHT_STRING() of
+    birth_country and player_id, i.e. by equality under the columns'
+    collation, and a player_id the source repeats is counted once in
+    every group it appears in.
+    """
     view = f"{prefix}_players_clean"
-    target = f"{prefix}_country_birth_year_pct"
     if debug:
-        print(f"[STEP] Computing birth-year country percentages for {prefix}")
+        print(f"[STEP] Computing country percentages (overall, birth/debut year and decade) from {view}")
 
-    cur.execute(f"TRUNCATE TABLE {target}")
-    cur.execute(
-        f"""
-        INSERT INTO {target} (birth_country, year, player_count, pct_of_year)
-        WITH births AS (
-            SELECT
-                birth_country,
-                birth_year AS year,
-                player_id
+    names: Dict[bytes, str] = {}  # collation key -> first spelling seen, as GROUP BY returns one
+    groups: Dict[str, Dict[Tuple, Set[bytes]]] = {key: {} for key in COUNTRY_PCT_TABLES}
+    with cur.connection.cursor(pymysql.cursors.SSCursor) as scan:
+        scan.execute(
+            f"""
+            SELECT WEIGHT_STRING(player_id), birth_country, WEIGHT_STRING(birth_country), birth_year, debut_year
             FROM {view}
-            WHERE birth_country IS NOT NULL AND birth_year IS NOT NULL
-        ), year_totals AS (
-            SELECT year, COUNT(DISTINCT player_id) AS total_players
-            FROM births
-            GROUP BY year
+            WHERE birth_country IS NOT NULL AND player_id IS NOT NULL
+            """
         )
-        SELECT
-            b.birth_country,
-            b.year,
-            COUNT(DISTINCT b.player_id) AS player_count,
-            COUNT(DISTINCT b.player_id) / yt.total_players AS pct_of_year
-        FROM births b
-        JOIN year_totals yt USING (year)
-        GROUP BY b.birth_country, b.year, yt.total_players
-        ORDER BY b.year, player_count DESC;
-        """
-    )
+        while True:
+            rows = scan.fetchmany(fetch_rows)
+            if not rows:
+                break
+            for player, country, country_key, birth_year, debut_year in rows:
+                names.setdefault(country_key, country)
+                groups["overall"].setdefault((country_key,), set()).add(player)
+                for kind, year in (("birth", birth_year), ("debut", debut_year)):
+                    if year is None:
+                        continue
+                    year = int(year)
+                    groups[f"{kind}_year"].setdefault((country_key, year), set()).add(player)
+                    groups[f"{kind}_decade"].setdefault((country_key, (year // 10) * 10), set()).add(player)
+
+    for key, (suffix, period_col, pct_col) in COUNTRY_PCT_TABLES.items():
+        target = f"{prefix}_{suffix}"
+        cols = ["birth_country"] + ([period_col] if period_col else []) + ["player_count", pct_col]
+        cur.execute(f"TRUNCATE TABLE {target}")
+        cur.executemany(
+            f"INSERT INTO {target} ({', '.join(cols)}) VALUES ({', '.join(['%s'] * len(cols))})",
+            _country_pct_rows(groups[key], names),
+        )
+        if debug:
+            print(f"[DEBUG] {target}: {len(groups[key])} row(s)")
 
 
-def compute_debut_year_country_pct(cur, prefix: str, debug: bool = False):
-    view = f"{prefix}_players_clean"
-    target = f"{prefix}_country_debut_year_pct"
-    if debug:
-        print(f"[STEP] Computing debut-year country percentages for {prefix}")
+# ------------------ Foreign vs US Performance Summaries --------------------
 
-    cur.execute(f"TRUNCATE TABLE {target}")
-    cur.execute(
+# Per-season source checksums behind --incremental, one row per (target, season).
+SEASON_STATE_TABLE = "season_checksums"
+# Serializes SEASON_STATE_TABLE writes across --jobs workers (see write_season_state).
+SEASON_STATE_LOCK = threading.Lock()
+
+
+class SeasonRefresh(NamedTuple):
+    seasons: Optional[List[str]]  # seasons to replace; None means all of them
+    checksums: Dict[str, Tuple[int, int]]  # season -> (row count, checksum) of the source now
+    players: str  # checksum of players_clean (player_id -> group_type)
+
+
+def ensure_season_state_table(cur, rebuild: bool = False):
+    if rebuild:
+        drop_table(cur, SEASON_STATE_TABLE)
+    execute_ddl(
+        cur,
+        SEASON_STATE_TABLE,
         f"""
-        INSERT INTO {target} (birth_country, year, player_count, pct_of_year)
-        WITH debuts AS (
-            SELECT
-                birth_country,
-                debut_year AS year,
-                player_id
-            FROM {view}
-            WHERE birth_country IS NOT NULL AND debut_year IS NOT NULL
-        ), year_totals AS (
-            SELECT year, COUNT(DISTINCT player_id) AS total_players
-            FROM debuts
-            GROUP BY year
-        )
-        SELECT
-            d.birth_country,
-            d.year,
-            COUNT(DISTINCT d.player_id) AS player_count,
-            COUNT(DISTINCT d.player_id) / yt.total_players AS pct_of_year
-        FROM debuts d
-        JOIN year_totals yt USING (year)
-        GROUP BY d.birth_country, d.year, yt.total_players
-        ORDER BY d.year, player_count DESC;
-        """
+        CREATE TABLE IF NOT EXISTS {SEASON_STATE_TABLE} (
+            target VARCHAR(128) NOT NULL,
+            season VARCHAR(16) NOT NULL,
+            row_count BIGINT NOT NULL,
+            checksum BIGINT UNSIGNED NOT NULL,
+            players_checksum VARCHAR(64) NOT NULL,
+            PRIMARY KEY (target, season)
+        ) ENGINE=InnoDB;
+        """,
     )
 
 
-def compute_birth_decade_country_pct(cur, prefix: str, debug: bool = False):
-    view = f"{prefix}_players_clean"
-    target = f"{prefix}_country_birth_decade_pct"
-    if debug:
-        print(f"[STEP] Computing birth-decade country percentages for {prefix}")
+def _row_checksum_expr(cols: List[str]) -> str:
+    parts = ", ".join(f"IFNULL(`{c}`, '\\\\N')" for c in cols)
+    return f"CRC32(CONCAT_WS('|', {parts}))"
 
-    cur.execute(f"TRUNCATE TABLE {target}")
+
+def season_checksums(cur, base: str, year_col: str, cols: List[str]) -> Dict[str, Tuple[int, int]]:
+    """(row count, SUM of per-row CRC32) for every season in `base`, over the columns we read."""
     cur.execute(
         f"""
-        INSERT INTO {target} (birth_country, decade, player_count, pct_of_decade)
-        WITH births AS (
-            SELECT
-                birth_country,
-                birth_year,
-                player_id
-            FROM {view}
-            WHERE birth_country IS NOT NULL AND birth_year IS NOT NULL
-        ), births_decade AS (
-            SELECT
-                birth_country,
-                (birth_year DIV 10) * 10 AS decade,
-                player_id
-            FROM births
-        ), decade_totals AS (
-            SELECT
-                decade,
-                COUNT(DISTINCT player_id) AS total_players
-            FROM births_decade
-            GROUP BY decade
-        )
-        SELECT
-            b.birth_country,
-            b.decade,
-            COUNT(DISTINCT b.player_id) AS player_count,
-            COUNT(DISTINCT b.player_id) / dt.total_players AS pct_of_decade
-        FROM births_decade b
-        JOIN decade_totals dt USING (decade)
-        GROUP BY b.birth_country, b.decade, dt.total_players
-        ORDER BY b.decade, player_count DESC;
+        SELECT `{year_col}` AS season, COUNT(*) AS n, SUM({_row_checksum_expr(cols)}) AS crc
+        FROM `{base}`
+        WHERE `{year_col}` IS NOT NULL
+        GROUP BY `{year_col}`
         """
     )
+    return {str(r["season"]): (int(r["n"]), int(r["crc"] or 0)) for r in cur.fetchall()}
 
 
-def compute_debut_decade_country_pct(cur, prefix: str, debug: bool = False):
-    view = f"{prefix}_players_clean"
-    target = f"{prefix}_country_debut_decade_pct"
-    if debug:
-        print(f"[STEP] Computing debut-decade country percentages for {prefix}")
+def players_checksum(cur, players_view: str) -> str:
+    cur.execute(
+        f"SELECT COUNT(*) AS n, SUM({_row_checksum_expr(['player_id', 'group_type'])}) AS crc FROM {players_view}"
+    )
+    row = cur.fetchone()
+    return f"{row['n']}:{row['crc'] or 0}"
+
+
+def plan_season_refresh(
+    cur, target: str, base: str, year_col: str, cols: List[str], players_view: str, debug: bool = False
+) -> SeasonRefresh:
+    """Work out which seasons of `target` need recomputing since the last incremental run.
+
+    A season is stale when its source row count or checksum changed, or it
+    disappeared from the source. Everything is stale when players_clean
+    changed (group_type may have moved), when there is no saved state, or when
+    the target is empty (e.g. after --rebuild).
+    """
+    checksums = season_checksums(cur, base, year_col, [c for c in cols if c])
+    players = players_checksum(cur, players_view)
 
-    cur.execute(f"TRUNCATE TABLE {target}")
     cur.execute(
-        f"""
-        INSERT INTO {target} (birth_country, decade, player_count, pct_of_decade)
-        WITH debuts AS (
-            SELECT
-                birth_country,
-                debut_year,
-                player_id
-            FROM {view}
-            WHERE birth_country IS NOT NULL AND debut_year IS NOT NULL
-        ), debuts_decade AS (
-            SELECT
-                birth_country,
-                (debut_year DIV 10) * 10 AS decade,
-                player_id
-            FROM debuts
-        ), decade_totals AS (
-            SELECT
-                decade,
-                COUNT(DISTINCT player_id) AS total_players
-            FROM debuts_decade
-            GROUP BY decade
-        )
-        SELECT
-            d.birth_country,
-            d.decade,
-            COUNT(DISTINCT d.player_id) AS player_count,
-            COUNT(DISTINCT d.player_id) / dt.total_players AS pct_of_decade
-        FROM debuts_decade d
-        JOIN decade_totals dt USING (decade)
-        GROUP BY d.birth_country, d.decade, dt.total_players
-        ORDER BY d.decade, player_count DESC;
-        """
+        f"SELECT season, row_count, checksum, players_checksum FROM {SEASON_STATE_TABLE} WHERE target = %s",
+        (target,),
     )
+    saved = {r["season"]: r for r in cur.fetchall()}
+    cur.execute(f"SELECT 1 FROM {target} LIMIT 1")
+    target_empty = cur.fetchone() is None
 
+    if not saved or target_empty or any(r["players_checksum"] != players for r in saved.values()):
+        if debug:
+            print(f"[INFO] {target}: recomputing every season")
+        return SeasonRefresh(None, checksums, players)
+
+    seasons = sorted(
+        season
+        for season in set(checksums) | set(saved)
+        if season not in saved
+        or season not in checksums
+        or (int(saved[season]["row_count"]), int(saved[season]["checksum"])) != checksums[season]
+    )
+    if debug:
+        print(f"[INFO] {target}: {len(seasons)} changed season(s){': ' + ', '.join(seasons) if seasons else ''}")
+    return SeasonRefresh(seasons, checksums, players)
+
+
+def clear_seasons(cur, target: str, year_expr: str, refresh: Optional[SeasonRefresh]) -> Tuple[str, Tuple]:
+    """Remove the rows about to be recomputed; return the matching WHERE fragment and params for the INSERT.
+
+    Without --incremental this is the old TRUNCATE. Incremental runs use DELETE
+    instead, so readers keep seeing the previous rows until the step commits.
+    """
+    if refresh is None:
+        cur.execute(f"TRUNCATE TABLE {target}")
+        # A full recompute outdates any saved incremental state for this target.
+        if table_exists(cur, SEASON_STATE_TABLE):
+            write_season_state(cur, target, [])
+        return "", ()
+    if refresh.seasons is None:
+        cur.execute(f"DELETE FROM {target}")
+        return "", ()
+    placeholders = ", ".join(["%s"] * len(refresh.seasons))
+    cur.execute(f"DELETE FROM {target} WHERE year IN ({placeholders})", tuple(refresh.seasons))
+    return f" AND {year_expr} IN ({placeholders})", tuple(refresh.seasons)
+
+
+def record_seasons(cur, target: str, refresh: SeasonRefresh):
+    write_season_state(
+        cur,
+        target,
+        [(target, season, n, crc, refresh.players) for season, (n, crc) in sorted(refresh.checksums.items())],
+    )
+
+
+def write_season_state(cur, target: str, rows: List[Tuple]):
+    """Replace target's SEASON_STATE_TABLE rows in a short transaction of its own.
+
+    The DELETE takes next-key locks around target's key range; held until a
+    long step commits, they can deadlock against another --jobs worker doing
+    the same for its target. So the step's work so far is committed first
+    (saved state never describes uncommitted data) and the state
+    write runs and commits under SEASON_STATE_LOCK.
+    """
+    cur.connection.commit()
+    with SEASON_STATE_LOCK:
+        try:
+            cur.execute(f"DELETE FROM {SEASON_STATE_TABLE} WHERE target = %s", (target,))
+            if rows:
+                cur.executemany(
+                    f"""
+                    INSERT INTO {SEASON_STATE_TABLE} (target, season, row_count, checksum, players_checksum)
+                    VALUES (%s, %s, %s, %s, %s)
+                    """,
+                    rows,
+                )
+            cur.connection.commit()
+        except Exception:
+            cur.connection.rollback()
+            raise
 
-# ------------------ Foreign vs US Performance Summaries --------------------
 
 def _country_group_expr(country_col: str = "birth_country") -> str:
     # "USA" sometimes appears as "United States", "U.S.A.", etc. Normalize.
@@ -1143,7 +1606,7 @@ def _country_group_expr(country_col: str = "birth_country") -> str:
     )
 
 
-def compute_foreign_vs_us_batting_year(cur, prefix: str, debug: bool = False):
+def compute_foreign_vs_us_batting_year(cur, prefix: str, debug: bool = False, incremental: bool = False):
     """Summarize batting from <prefix>-batting_1899_2024 season-by-season."""
     base_bat = table_name(prefix, "batting_1899_2024")
     if not table_exists(cur, base_bat):
@@ -1176,7 +1639,14 @@ def compute_foreign_vs_us_batting_year(cur, prefix: str, debug: bool = False):
 
     target = f"{prefix}_foreign_vs_us_batting_year"
     view = f"{prefix}_players_clean"
-    cur.execute(f"TRUNCATE TABLE {target}")
+    refresh = None
+    if incremental:
+        refresh = plan_season_refresh(
+            cur, target, base_bat, year_col, [pid, year_col, g_col, ab_col, h_col, hr_col, bb_col, so_col], view, debug
+        )
+        if refresh.seasons == []:
+            return
+    season_sql, season_params = clear_seasons(cur, target, f"b.{year_col}", refresh)
 
     def safe(col: Optional[str], default: str = "0") -> str:
         return col if col else default
@@ -1188,6 +1658,7 @@ def compute_foreign_vs_us_batting_year(cur, prefix: str, debug: bool = False):
             SELECT
                 p.player_id,
                 p.birth_country,
+                p.group_type,
                 b.{year_col} AS season_year,
                 {safe(g_col)} AS G,
                 {safe(ab_col)} AS AB,
@@ -1198,11 +1669,11 @@ def compute_foreign_vs_us_batting_year(cur, prefix: str, debug: bool = False):
             FROM `{base_bat}` b
             JOIN {view} p
               ON b.{pid} = p.player_id
-            WHERE b.{year_col} IS NOT NULL
+            WHERE b.{year_col} IS NOT NULL{season_sql}
         ), year_joined AS (
             SELECT
                 season_year AS year,
-                {_country_group_expr('birth_country')} AS group_type,
+                group_type,
                 player_id,
                 SUM(G) AS games,
                 SUM(AB) AS ab,
@@ -1211,7 +1682,7 @@ def compute_foreign_vs_us_batting_year(cur, prefix: str, debug: bool = False):
                 SUM(BB) AS bb,
                 SUM(SO) AS so
             FROM joined
-            WHERE {_country_group_expr('birth_country')} IS NOT NULL
+            WHERE group_type IS NOT NULL
             GROUP BY year, group_type, player_id
         )
         SELECT
@@ -1233,10 +1704,12 @@ def compute_foreign_vs_us_batting_year(cur, prefix: str, debug: bool = False):
         ORDER BY year, group_type;
     """
 
-    cur.execute(insert_sql)
+    cur.execute(insert_sql, season_params or None)
+    if refresh is not None:
+        record_seasons(cur, target, refresh)
 
 
-def compute_foreign_vs_us_pitching_year(cur, prefix: str, debug: bool = False):
+def compute_foreign_vs_us_pitching_year(cur, prefix: str, debug: bool = False, incremental: bool = False):
     """Summarize pitching from <prefix>-pitching_1899_2024 season-by-season."""
     base_pit = table_name(prefix, "pitching_1899_2024")
     if not table_exists(cur, base_pit):
@@ -1270,7 +1743,15 @@ def compute_foreign_vs_us_pitching_year(cur, prefix: str, debug: bool = False):
 
     target = f"{prefix}_foreign_vs_us_pitching_year"
     view = f"{prefix}_players_clean"
-    cur.execute(f"TRUNCATE TABLE {target}")
+    refresh = None
+    if incremental:
+        refresh = plan_season_refresh(
+            cur, target, base_pit, year_col,
+            [pid, year_col, g_col, ipouts_col, h_col, hr_col, bb_col, so_col, er_col], view, debug,
+        )
+        if refresh.seasons == []:
+            return
+    season_sql, season_params = clear_seasons(cur, target, f"pit.{year_col}", refresh)
 
     def safe(col: Optional[str], default: str = "0") -> str:
         return col if col else default
@@ -1282,6 +1763,7 @@ def compute_foreign_vs_us_pitching_year(cur, prefix: str, debug: bool = False):
             SELECT
                 p.player_id,
                 p.birth_country,
+                p.group_type,
                 pit.{year_col} AS season_year,
                 {safe(g_col)} AS G,
                 {safe(ipouts_col)} AS IPouts,
@@ -1293,11 +1775,11 @@ def compute_foreign_vs_us_pitching_year(cur, prefix: str, debug: bool = False):
             FROM `{base_pit}` pit
             JOIN {view} p
               ON pit.{pid} = p.player_id
-            WHERE pit.{year_col} IS NOT NULL
+            WHERE pit.{year_col} IS NOT NULL{season_sql}
         ), year_joined AS (
             SELECT
                 season_year AS year,
-                {_country_group_expr('birth_country')} AS group_type,
+                group_type,
                 player_id,
                 SUM(G) AS games,
                 SUM(IPouts) AS ip_outs,
@@ -1307,7 +1789,7 @@ def compute_foreign_vs_us_pitching_year(cur, prefix: str, debug: bool = False):
                 SUM(SO) AS so,
                 SUM(ER) AS er
             FROM joined
-            WHERE {_country_group_expr('birth_country')} IS NOT NULL
+            WHERE group_type IS NOT NULL
             GROUP BY year, group_type, player_id
         )
         SELECT
@@ -1329,13 +1811,15 @@ def compute_foreign_vs_us_pitching_year(cur, prefix: str, debug: bool = False):
         ORDER BY year, group_type;
     """
 
-    cur.execute(insert_sql)
+    cur.execute(insert_sql, season_params or None)
+    if refresh is not None:
+        record_seasons(cur, target, refresh)
 
 
 #
 # ------------------- Foreign vs US Fielding Summary (optional) --------------------
 
-def compute_foreign_vs_us_fielding_year(cur, prefix: str, debug: bool = False):
+def compute_foreign_vs_us_fielding_year(cur, prefix: str, debug: bool = False, incremental: bool = False):
     """Summarize fielding from `<prefix>-fielding_1899_2024` season-by-season.
 
     Works with either Retrosheet-style or Lahman-style column names.
@@ -1373,7 +1857,9 @@ def compute_foreign_vs_us_fielding_year(cur, prefix: str, debug: bool = False):
                                         "A": a_col, "E": e_col})
 
     # Ensure table exists
-    cur.execute(
+    execute_ddl(
+        cur,
+        f"{prefix}_foreign_vs_us_fielding_year",
         f"""
         CREATE TABLE IF NOT EXISTS {prefix}_foreign_vs_us_fielding_year (
             year INT NOT NULL,
@@ -1388,10 +1874,19 @@ def compute_foreign_vs_us_fielding_year(cur, prefix: str, debug: bool = False):
             errors_per_game DOUBLE NULL,
             PRIMARY KEY (year, group_type)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
-    cur.execute(f"TRUNCATE TABLE {prefix}_foreign_vs_us_fielding_year")
+    target = f"{prefix}_foreign_vs_us_fielding_year"
+    refresh = None
+    if incremental:
+        refresh = plan_season_refresh(
+            cur, target, base_fld, year_col, [pid, year_col, g_col, inn_col, po_col, a_col, e_col],
+            f"{prefix}_players_clean", debug,
+        )
+        if refresh.seasons == []:
+            return
+    season_sql, season_params = clear_seasons(cur, target, f"f.{year_col}", refresh)
 
     def safe(col: Optional[str], default: str = "0") -> str:
         return col if col else default
@@ -1403,6 +1898,7 @@ def compute_foreign_vs_us_fielding_year(cur, prefix: str, debug: bool = False):
             SELECT
                 p.player_id,
                 p.birth_country,
+                p.group_type,
                 f.{year_col} AS season_year,
                 {safe(g_col)} AS G,
                 {safe(inn_col)} AS InnOuts,
@@ -1412,11 +1908,11 @@ def compute_foreign_vs_us_fielding_year(cur, prefix: str, debug: bool = False):
             FROM `{base_fld}` f
             JOIN {prefix}_players_clean p
               ON f.{pid} = p.player_id
-            WHERE f.{year_col} IS NOT NULL
+            WHERE f.{year_col} IS NOT NULL{season_sql}
         ), year_joined AS (
             SELECT
                 season_year AS year,
-                {_country_group_expr('birth_country')} AS group_type,
+                group_type,
                 player_id,
                 SUM(G) AS games,
                 SUM(InnOuts) AS inn_outs,
@@ -1424,7 +1920,7 @@ def compute_foreign_vs_us_fielding_year(cur, prefix: str, debug: bool = False):
                 SUM(A) AS assists,
                 SUM(E) AS errors
             FROM joined
-            WHERE {_country_group_expr('birth_country')} IS NOT NULL
+            WHERE group_type IS NOT NULL
             GROUP BY year, group_type, player_id
         )
         SELECT
@@ -1445,7 +1941,9 @@ def compute_foreign_vs_us_fielding_year(cur, prefix: str, debug: bool = False):
         ORDER BY year, group_type;
     """
 
-    cur.execute(insert_sql)
+    cur.execute(insert_sql, season_params or None)
+    if refresh is not None:
+        record_seasons(cur, target, refresh)
 
 
 def compute_player_career_batting(cur, prefix: str, debug: bool = False):
@@ -1494,7 +1992,7 @@ def compute_player_career_batting(cur, prefix: str, debug: bool = False):
             SELECT
                 p.player_id,
                 p.birth_country,
-                {_country_group_expr('p.birth_country')} AS group_type,
+                p.group_type,
                 b.{year_col} AS season_year,
                 {safe(g_col)} AS G,
                 {safe(ab_col)} AS AB,
@@ -1591,7 +2089,7 @@ def compute_player_career_pitching(cur, prefix: str, debug: bool = False):
             SELECT
                 p.player_id,
                 p.birth_country,
-                {_country_group_expr('p.birth_country')} AS group_type,
+                p.group_type,
                 pit.{year_col} AS season_year,
                 {safe(g_col)} AS G,
                 {safe(ipouts_col)} AS IPouts,
@@ -1867,7 +2365,7 @@ def compute_player_career_span(cur, prefix: str, debug: bool = False):
             SELECT
                 p.player_id,
                 p.birth_country,
-                {_country_group_expr('p.birth_country')} AS group_type,
+                p.group_type,
                 p.debut_year,
                 per.last_year_data
             FROM {view} p
@@ -1943,7 +2441,7 @@ def compute_country_primary_position(cur, prefix: str, debug: bool = False):
             SELECT
                 p.player_id,
                 p.birth_country,
-                {_country_group_expr('p.birth_country')} AS group_type,
+                p.group_type,
                 f.{pos_col} AS pos,
                 {safe(g_col)} AS G
             FROM `{base_fld}` f
@@ -2002,12 +2500,14 @@ def compute_country_primary_position(cur, prefix: str, debug: bool = False):
 
 def ensure_global_summary_tables(cur, rebuild: bool = False):
     if rebuild:
-        cur.execute("DROP TABLE IF EXISTS global_foreign_vs_us_war_year")
-        cur.execute("DROP TABLE IF EXISTS global_foreign_vs_us_awards_year")
-        cur.execute("DROP TABLE IF EXISTS global_foreign_vs_us_allstar_year")
-        cur.execute("DROP TABLE IF EXISTS global_foreign_vs_us_salaries_year")
-
-    cur.execute(
+        drop_table(cur, "global_foreign_vs_us_war_year")
+        drop_table(cur, "global_foreign_vs_us_awards_year")
+        drop_table(cur, "global_foreign_vs_us_allstar_year")
+        drop_table(cur, "global_foreign_vs_us_salaries_year")
+
+    execute_ddl(
+        cur,
+        "global_foreign_vs_us_war_year",
         """
         CREATE TABLE IF NOT EXISTS global_foreign_vs_us_war_year (
             year INT NOT NULL,
@@ -2017,10 +2517,12 @@ def ensure_global_summary_tables(cur, rebuild: bool = False):
             war_per_player DOUBLE NULL,
             PRIMARY KEY (year, group_type)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
-    cur.execute(
+    execute_ddl(
+        cur,
+        "global_foreign_vs_us_awards_year",
         """
         CREATE TABLE IF NOT EXISTS global_foreign_vs_us_awards_year (
             year INT NOT NULL,
@@ -2030,10 +2532,12 @@ def ensure_global_summary_tables(cur, rebuild: bool = False):
             awards_per_player DOUBLE NULL,
             PRIMARY KEY (year, group_type)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
-    cur.execute(
+    execute_ddl(
+        cur,
+        "global_foreign_vs_us_allstar_year",
         """
         CREATE TABLE IF NOT EXISTS global_foreign_vs_us_allstar_year (
             year INT NOT NULL,
@@ -2043,10 +2547,12 @@ def ensure_global_summary_tables(cur, rebuild: bool = False):
             selections_per_player DOUBLE NULL,
             PRIMARY KEY (year, group_type)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
-    cur.execute(
+    execute_ddl(
+        cur,
+        "global_foreign_vs_us_salaries_year",
         """
         CREATE TABLE IF NOT EXISTS global_foreign_vs_us_salaries_year (
             year INT NOT NULL,
@@ -2056,7 +2562,7 @@ def ensure_global_summary_tables(cur, rebuild: bool = False):
             salary_avg DOUBLE NULL,
             PRIMARY KEY (year, group_type)
         ) ENGINE=InnoDB;
-        """
+        """,
     )
 
 
@@ -2092,7 +2598,7 @@ def compute_global_war_year(cur, players_view: str = "main_players_clean", debug
                 print(f"[WARN] No WAR column detected in {t}; skipping this WAR table")
             continue
         selects.append(
-            f"SELECT {pid} AS player_id, {year_col} AS year, CAST(NULLIF({war_col},'') AS DOUBLE) AS war FROM `{t}`"
+            f"SELECT {pid} AS player_id, {year_col} AS year, CAST({_blank_to_null(war_col)} AS DOUBLE) AS war FROM `{t}`"
         )
 
     if not selects:
@@ -2108,12 +2614,12 @@ def compute_global_war_year(cur, players_view: str = "main_players_clean", debug
         ), joined AS (
             SELECT
                 w.year,
-                {_country_group_expr('p.birth_country')} AS group_type,
+                p.group_type,
                 w.player_id,
                 w.war
             FROM war_rows w
             JOIN {players_view} p ON p.player_id = w.player_id
-            WHERE w.year IS NOT NULL AND {_country_group_expr('p.birth_country')} IS NOT NULL
+            WHERE w.year IS NOT NULL AND p.group_type IS NOT NULL
         )
         SELECT
             year,
@@ -2156,11 +2662,11 @@ def compute_global_awards_year(cur, players_view: str = "main_players_clean", de
         WITH joined AS (
             SELECT
                 a.{year_col} AS year,
-                {_country_group_expr('p.birth_country')} AS group_type,
+                p.group_type,
                 a.{pid} AS player_id
             FROM `{awards_tbl}` a
             JOIN {players_view} p ON p.player_id = a.{pid}
-            WHERE a.{year_col} IS NOT NULL AND {_country_group_expr('p.birth_country')} IS NOT NULL
+            WHERE a.{year_col} IS NOT NULL AND p.group_type IS NOT NULL
         )
         SELECT
             year,
@@ -2203,11 +2709,11 @@ def compute_global_allstar_year(cur, players_view: str = "main_players_clean", d
         WITH joined AS (
             SELECT
                 a.{year_col} AS year,
-                {_country_group_expr('p.birth_country')} AS group_type,
+                p.group_type,
                 a.{pid} AS player_id
             FROM `{allstar_tbl}` a
             JOIN {players_view} p ON p.player_id = a.{pid}
-            WHERE a.{year_col} IS NOT NULL AND {_country_group_expr('p.birth_country')} IS NOT NULL
+            WHERE a.{year_col} IS NOT NULL AND p.group_type IS NOT NULL
         )
         SELECT
             year,
@@ -2255,12 +2761,12 @@ def compute_global_salaries_year(cur, players_view: str = "main_players_clean",
         WITH joined AS (
             SELECT
                 s.{year_col} AS year,
-                {_country_group_expr('p.birth_country')} AS group_type,
+                p.group_type,
                 s.{pid} AS player_id,
-                CAST(NULLIF(s.{sal_col},'') AS SIGNED) AS salary
+                CAST({_blank_to_null('s.' + sal_col)} AS SIGNED) AS salary
             FROM `{sal_tbl}` s
             JOIN {players_view} p ON p.player_id = s.{pid}
-            WHERE s.{year_col} IS NOT NULL AND {_country_group_expr('p.birth_country')} IS NOT NULL
+            WHERE s.{year_col} IS NOT NULL AND p.group_type IS NOT NULL
         )
         SELECT
             year,
@@ -2275,6 +2781,16 @@ def compute_global_salaries_year(cur, players_view: str = "main_players_clean",
     )
 
 
+# Default names of the stg_* tables the global analyses read (see compute_global_*)
+GLOBAL_STG_TABLES = (
+    "stg_bref_war_daily_bat",
+    "stg_bref_war_daily_pitch",
+    "stg_lahman_awards_players",
+    "stg_lahman_allstarfull",
+    "stg_lahman_salaries",
+)
+
+
 def run_global_analyses(cur, rebuild: bool = False, debug: bool = False):
     """Run optional analyses over global stg_* tables if present."""
     ensure_global_summary_tables(cur, rebuild=rebuild)
@@ -2284,202 +2800,301 @@ def run_global_analyses(cur, rebuild: bool = False, debug: bool = False):
         if debug:
             print("[WARN] main_players_clean does not exist yet; skipping stg_* analyses")
         return
+    if "group_type" not in get_columns(cur, players_view, expect=("group_type",)):
+        if debug:
+            print("[WARN] main_players_clean predates the group_type column; rerun with prefix main to refresh it")
+        return
 
     compute_global_war_year(cur, players_view=players_view, debug=debug)
     compute_global_awards_year(cur, players_view=players_view, debug=debug)
     compute_global_allstar_year(cur, players_view=players_view, debug=debug)
     compute_global_salaries_year(cur, players_view=players_view, debug=debug)
 
-# --------------------------------- Main ------------------------------------
+# ------------------------------- Step Graph --------------------------------
 
-def main() -> int:
-    args = parse_args()
-    conn = connect_db(args)
+class Step(NamedTuple):
+    """One unit of work in a run.
 
-    prefixes = [p.strip() for p in args.prefixes.split(",") if p.strip()]
+    inputs/outputs are table (or view) names and only drive scheduling: a step
+    becomes ready once every input produced by another step in the plan has
+    finished. Inputs nobody in the plan produces (loaded CSV tables, stg_*)
+    are assumed to exist already. After the step, each (table, notes) pair in
+    `index` is upserted into table_index unless run() returned False; with
+    index_if_exists, only the tables that actually exist are.
+    """
 
-    try:
-        with conn.cursor() as cur:
-            # Make sure the lightweight table index exists and has all optional columns.
-            ensure_index_table(cur, rebuild=args.rebuild)
+    name: str
+    run: Callable[..., Optional[bool]]
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    index: Tuple[Tuple[str, str], ...] = ()
+    index_if_exists: bool = False
 
-            for prefix in prefixes:
-                if args.debug:
-                    print(f"[STEP] Running country/foreign-born analysis for prefix={prefix}")
 
-                # 1) Core players view (prefix-allplayers_1899_2024)
-                ensure_players_view(cur, prefix, rebuild=args.rebuild, debug=args.debug)
+def prefix_steps(prefix: str, args: argparse.Namespace) -> List[Step]:
+    """Steps for one prefix, in the order a serial run executes them."""
+    rebuild, debug = args.rebuild, args.debug
+    players = f"{prefix}_players_clean"
+    base_players = table_name(prefix, "allplayers_1899_2024")
+    base_bat = table_name(prefix, "batting_1899_2024")
+    base_pit = table_name(prefix, "pitching_1899_2024")
+    base_fld = table_name(prefix, "fielding_1899_2024")
+
+    def prepare(cur):
+        # 1) Core players view or table (prefix-allplayers_1899_2024)
+        if args.materialize_players:
+            ensure_players_table(cur, prefix, rebuild=rebuild, debug=debug)
+        else:
+            ensure_players_view(cur, prefix, rebuild=rebuild, debug=debug)
+        # 2) Summary tables for this prefix (country %, foreign-vs-US by year, careers, etc.)
+        ensure_summary_tables_for_prefix(cur, prefix, rebuild=rebuild)
+
+    def bio(cur):
+        # Biodata (height/weight/bats/throws) summaries if we can build a bio view
+        bio_view = ensure_bio_view(cur, prefix, rebuild=rebuild, debug=debug)
+        if bio_view is None:
+            return False
+        compute_foreign_vs_us_bio_overall(cur, prefix, bio_view=bio_view, debug=debug)
+
+    def compute(fn, target: str, inputs: Tuple[str, ...], notes: str, if_exists: bool = False, **kwargs) -> Step:
+        return Step(
+            name=target,
+            run=lambda cur: fn(cur, prefix, debug=debug, **kwargs),
+            inputs=(players,) + inputs,
+            outputs=(target,),
+            index=((target, notes),),
+            index_if_exists=if_exists,
+        )
 
-                # 2) Summary tables for this prefix (country %, foreign-vs-US by year, careers, etc.)
-                ensure_summary_tables_for_prefix(cur, prefix, rebuild=args.rebuild)
+    return [
+        Step(f"{prefix}:prepare", prepare, inputs=(base_players,), outputs=(players,)),
+        # 3) Country distribution tables, all five from one scan of players_clean
+        Step(
+            f"{prefix}_country_pct",
+            lambda cur: compute_country_pct_tables(cur, prefix, debug=debug),
+            inputs=(players,),
+            outputs=tuple(f"{prefix}_{suffix}" for suffix, _, _ in COUNTRY_PCT_TABLES.values()),
+            index=(
+                (f"{prefix}_country_overall_pct", f"Overall country distribution from {prefix}-allplayers_1899_2024"),
+                (f"{prefix}_country_birth_year_pct", "Birth-year country distribution"),
+                (f"{prefix}_country_debut_year_pct", "Debut-year country distribution using firstGame/debut"),
+                (f"{prefix}_country_birth_decade_pct", "Birth-decade country distribution"),
+                (f"{prefix}_country_debut_decade_pct", "Debut-decade country distribution"),
+            ),
+        ),
+        # 4) Foreign vs US by season (batting, pitching, fielding)
+        compute(compute_foreign_vs_us_batting_year, f"{prefix}_foreign_vs_us_batting_year", (base_bat,),
+                "Batting foreign vs US by season", incremental=args.incremental),
+        compute(compute_foreign_vs_us_pitching_year, f"{prefix}_foreign_vs_us_pitching_year", (base_pit,),
+                "Pitching foreign vs US by season", incremental=args.incremental),
+        compute(compute_foreign_vs_us_fielding_year, f"{prefix}_foreign_vs_us_fielding_year", (base_fld,),
+                "Fielding foreign vs US by season", if_exists=True, incremental=args.incremental),
+        # 5) Career / top player / span / primary-position summaries
+        compute(compute_player_career_batting, f"{prefix}_player_career_batting", (base_bat,),
+                "Career batting totals per player"),
+        compute(compute_player_career_pitching, f"{prefix}_player_career_pitching", (base_pit,),
+                "Career pitching totals per player"),
+        compute(compute_country_batting_career_summary, f"{prefix}_country_batting_career_summary",
+                (f"{prefix}_player_career_batting",), "Country-level batting career summary"),
+        compute(compute_country_pitching_career_summary, f"{prefix}_country_pitching_career_summary",
+                (f"{prefix}_player_career_pitching",), "Country-level pitching career summary"),
+        compute(compute_country_batting_top_players, f"{prefix}_country_batting_top_players",
+                (f"{prefix}_player_career_batting",), "Top batting players per country"),
+        compute(compute_country_pitching_top_players, f"{prefix}_country_pitching_top_players",
+                (f"{prefix}_player_career_pitching",), "Top pitching players per country"),
+        compute(compute_player_career_span, f"{prefix}_player_career_span", (base_bat, base_pit),
+                "Career span (debut to last year) per player"),
+        compute(compute_country_primary_position, f"{prefix}_country_primary_position", (base_fld,),
+                "Primary position distribution per country"),
+        # 6) Biodata summaries
+        Step(
+            f"{prefix}_foreign_vs_us_bio_overall",
+            bio,
+            inputs=(players,),
+            outputs=(f"{prefix}_bio_clean", f"{prefix}_foreign_vs_us_bio_overall"),
+            index=((f"{prefix}_foreign_vs_us_bio_overall",
+                    "Foreign vs US biodata summary (height/weight/bats/throws)"),),
+        ),
+    ]
+
+
+def plan_steps(prefixes: List[str], args: argparse.Namespace) -> List[Step]:
+    steps: List[Step] = []
+    for prefix in prefixes:
+        steps.extend(prefix_steps(prefix, args))
+
+    # 7) Optional global stg_* analyses (WAR, awards, all-star, salaries)
+    #    Uses main_players_clean as the canonical player-country map; that and
+    #    the stg_* tables (loaded outside this script) are all it reads.
+    steps.append(
+        Step(
+            "global",
+            lambda cur: run_global_analyses(cur, rebuild=args.rebuild, debug=args.debug),
+            inputs=("main_players_clean",) + GLOBAL_STG_TABLES,
+            outputs=(
+                "global_foreign_vs_us_war_year",
+                "global_foreign_vs_us_awards_year",
+                "global_foreign_vs_us_allstar_year",
+                "global_foreign_vs_us_salaries_year",
+            ),
+        )
+    )
 
-                # 3) Country distribution tables
-                compute_overall_country_pct(cur, prefix, debug=args.debug)
-                upsert_table_index(
-                    cur,
-                    f"{prefix}_country_overall_pct",
-                    source_folder="derived",
-                    notes=f"Overall country distribution from {prefix}-allplayers_1899_2024",
-                )
+    # 8) Optional regular vs postseason comparison tables, if those prefixes were requested
+    if "regular" in prefixes and "postseason" in prefixes:
+        steps.append(
+            Step(
+                "regular_vs_postseason",
+                lambda cur: ensure_regular_postseason_comparison_tables(cur, rebuild=args.rebuild, debug=args.debug),
+                inputs=tuple(
+                    f"{prefix}_foreign_vs_us_{kind}_year"
+                    for prefix in ("regular", "postseason")
+                    for kind in ("batting", "pitching")
+                ),
+                outputs=(
+                    "regular_vs_postseason_foreign_vs_us_batting_year",
+                    "regular_vs_postseason_foreign_vs_us_pitching_year",
+                ),
+                index=(
+                    ("regular_vs_postseason_foreign_vs_us_batting_year",
+                     "Regular vs postseason foreign vs US batting by season"),
+                    ("regular_vs_postseason_foreign_vs_us_pitching_year",
+                     "Regular vs postseason foreign vs US pitching by season"),
+                ),
+                index_if_exists=True,
+            )
+        )
+    return steps
 
-                compute_birth_year_country_pct(cur, prefix, debug=args.debug)
-                upsert_table_index(
-                    cur,
-                    f"{prefix}_country_birth_year_pct",
-                    source_folder="derived",
-                    notes="Birth-year country distribution",
-                )
 
-                compute_debut_year_country_pct(cur, prefix, debug=args.debug)
-                upsert_table_index(
-                    cur,
-                    f"{prefix}_country_debut_year_pct",
-                    source_folder="derived",
-                    notes="Debut-year country distribution using firstGame/debut",
-                )
+def index_step(cur, step: Step):
+    for table, notes in step.index:
+        if not step.index_if_exists or table_exists(cur, table):
+            upsert_table_index(cur, table, source_folder="derived", notes=notes)
 
-                compute_birth_decade_country_pct(cur, prefix, debug=args.debug)
-                upsert_table_index(
-                    cur,
-                    f"{prefix}_country_birth_decade_pct",
-                    source_folder="derived",
-                    notes="Birth-decade country distribution",
-                )
 
-                compute_debut_decade_country_pct(cur, prefix, debug=args.debug)
-                upsert_table_index(
-                    cur,
-                    f"{prefix}_country_debut_decade_pct",
-                    source_folder="derived",
-                    notes="Debut-decade country distribution",
-                )
+def run_steps_serial(conn, steps: List[Step], debug: bool = False):
+    """Run every step in plan order on one connection (the original behaviour).
 
-                # 4) Foreign vs US by season (batting, pitching, fielding)
-                compute_foreign_vs_us_batting_year(cur, prefix, debug=args.debug)
-                upsert_table_index(
-                    cur,
-                    f"{prefix}_foreign_vs_us_batting_year",
-                    source_folder="derived",
-                    notes="Batting foreign vs US by season",
-                )
+    Work is committed at the end, except that DDL (TRUNCATE, CREATE) commits
+    implicitly and season state writes commit on their own.
+    """
+    with conn.cursor() as cur:
+        for step in steps:
+            if debug:
+                print(f"[STEP] {step.name}")
+            if step.run(cur) is not False:
+                index_step(cur, step)
 
-                compute_foreign_vs_us_pitching_year(cur, prefix, debug=args.debug)
-                upsert_table_index(
-                    cur,
-                    f"{prefix}_foreign_vs_us_pitching_year",
-                    source_folder="derived",
-                    notes="Pitching foreign vs US by season",
-                )
 
-                # Optional: fielding summary only if the fielding table exists
-                compute_foreign_vs_us_fielding_year(cur, prefix, debug=args.debug)
-                if table_exists(cur, f"{prefix}_foreign_vs_us_fielding_year"):
-                    upsert_table_index(
-                        cur,
-                        f"{prefix}_foreign_vs_us_fielding_year",
-                        source_folder="derived",
-                        notes="Fielding foreign vs US by season",
-                    )
-
-                # 5) Career / top player / span / primary-position summaries
-                compute_player_career_batting(cur, prefix, debug=args.debug)
-                upsert_table_index(
-                    cur,
-                    f"{prefix}_player_career_batting",
-                    source_folder="derived",
-                    notes="Career batting totals per player",
-                )
+def run_steps_parallel(args: argparse.Namespace, steps: List[Step], jobs: int):
+    """Run steps on a thread pool as soon as their inputs are ready.
 
-                compute_player_career_pitching(cur, prefix, debug=args.debug)
-                upsert_table_index(
-                    cur,
-                    f"{prefix}_player_career_pitching",
-                    source_folder="derived",
-                    notes="Career pitching totals per player",
-                )
+    Each worker thread keeps its own connection and commits after every step,
+    so a downstream step on another connection sees the finished table.
+    table_index writes are serialized to keep concurrent upserts from
+    deadlocking on that small table.
+    """
+    producers: Dict[str, str] = {}
+    for step in steps:
+        for out in step.outputs:
+            producers[out] = step.name
+    waits_on = {
+        step.name: {producers[t] for t in step.inputs if t in producers and producers[t] != step.name}
+        for step in steps
+    }
 
-                compute_country_batting_career_summary(cur, prefix, debug=args.debug)
-                upsert_table_index(
-                    cur,
-                    f"{prefix}_country_batting_career_summary",
-                    source_folder="derived",
-                    notes="Country-level batting career summary",
-                )
+    local = threading.local()
+    opened = []
+    lock = threading.Lock()
+    index_lock = threading.Lock()
+
+    def worker_conn():
+        if getattr(local, "conn", None) is None:
+            local.conn = connect_db(args)
+            with lock:
+                opened.append(local.conn)
+        return local.conn
+
+    def run(step: Step):
+        conn = worker_conn()
+        try:
+            with conn.cursor() as cur:
+                if args.debug:
+                    print(f"[STEP] {step.name}")
+                produced = step.run(cur)
+                conn.commit()
+                if produced is not False and step.index:
+                    with index_lock:
+                        index_step(cur, step)
+                        conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    pending = list(steps)
+    done = set()
+    running = {}
+    ex = ThreadPoolExecutor(max_workers=jobs)
+    try:
+        while pending or running:
+            for step in [s for s in pending if waits_on[s.name] <= done]:
+                pending.remove(step)
+                running[ex.submit(run, step)] = step.name
+            if not running:
+                raise RuntimeError(f"Unsatisfiable step dependencies: {[s.name for s in pending]}")
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                name = running.pop(fut)
+                fut.result()
+                done.add(name)
+                print(f"[INFO] Finished {name} ({len(done)}/{len(steps)})")
+    except Exception:
+        ex.shutdown(wait=True, cancel_futures=True)
+        raise
+    finally:
+        ex.shutdown(wait=True)
+        for conn in opened:
+            conn.close()
 
-                compute_country_pitching_career_summary(cur, prefix, debug=args.debug)
-                upsert_table_index(
-                    cur,
-                    f"{prefix}_country_pitching_career_summary",
-                    source_folder="derived",
-                    notes="Country-level pitching career summary",
-                )
 
-                compute_country_batting_top_players(cur, prefix, debug=args.debug)
-                upsert_table_index(
-                    cur,
-                    f"{prefix}_country_batting_top_players",
-                    source_folder="derived",
-                    notes="Top batting players per country",
-                )
+# --------------------------------- Main ------------------------------------
 
-                compute_country_pitching_top_players(cur, prefix, debug=args.debug)
-                upsert_table_index(
-                    cur,
-                    f"{prefix}_country_pitching_top_players",
-                    source_folder="derived",
-                    notes="Top pitching players per country",
-                )
+def main() -> int:
+    global SCHEMA
 
-                compute_player_career_span(cur, prefix, debug=args.debug)
-                upsert_table_index(
-                    cur,
-                    f"{prefix}_player_career_span",
-                    source_folder="derived",
-                    notes="Career span (debut to last year) per player",
-                )
+    args = parse_args()
+    conn = connect_db(args)
 
-                compute_country_primary_position(cur, prefix, debug=args.debug)
-                upsert_table_index(
-                    cur,
-                    f"{prefix}_country_primary_position",
-                    source_folder="derived",
-                    notes="Primary position distribution per country",
-                )
+    prefixes = [p.strip() for p in args.prefixes.split(",") if p.strip()]
 
-                # 6) Biodata (height/weight/bats/throws) summaries if we can build a bio view
-                bio_view = ensure_bio_view(cur, prefix, rebuild=args.rebuild, debug=args.debug)
-                if bio_view is not None:
-                    compute_foreign_vs_us_bio_overall(cur, prefix, bio_view=bio_view, debug=args.debug)
-                    upsert_table_index(
-                        cur,
-                        f"{prefix}_foreign_vs_us_bio_overall",
-                        source_folder="derived",
-                        notes="Foreign vs US biodata summary (height/weight/bats/throws)",
-                    )
-
-            # 7) Optional global stg_* analyses (WAR, awards, all-star, salaries)
-            #    Uses main_players_clean as the canonical player-country map.
-            run_global_analyses(cur, rebuild=args.rebuild, debug=args.debug)
-
-            # 8) Optional regular vs postseason comparison tables, if those prefixes were requested
-            if "regular" in prefixes and "postseason" in prefixes:
-                ensure_regular_postseason_comparison_tables(cur, rebuild=args.rebuild, debug=args.debug)
-                if table_exists(cur, "regular_vs_postseason_foreign_vs_us_batting_year"):
-                    upsert_table_index(
-                        cur,
-                        "regular_vs_postseason_foreign_vs_us_batting_year",
-                        source_folder="derived",
-                        notes="Regular vs postseason foreign vs US batting by season",
-                    )
-                if table_exists(cur, "regular_vs_postseason_foreign_vs_us_pitching_year"):
-                    upsert_table_index(
-                        cur,
-                        "regular_vs_postseason_foreign_vs_us_pitching_year",
-                        source_folder="derived",
-                        notes="Regular vs postseason foreign vs US pitching by season",
-                    )
+    cache_path = None
+    if not args.no_schema_cache:
+        cache_path = args.schema_cache or Path(__file__).resolve().parent / f".schema_cache.{args.db}.json"
+
+    try:
+        with conn.cursor() as cur:
+            # One bulk INFORMATION_SCHEMA read up front; get_columns/table_exists/list_tables use it.
+            SCHEMA = SchemaCatalog(cache_path)
+            SCHEMA.load(cur, debug=args.debug)
+
+            # Make sure the lightweight table index exists and has all optional columns.
+            ensure_index_table(cur, rebuild=args.rebuild)
+            if args.incremental:
+                ensure_season_state_table(cur, rebuild=args.rebuild)
 
+        steps = plan_steps(prefixes, args)
+        if args.jobs > 1:
             conn.commit()
+            run_steps_parallel(args, steps, args.jobs)
+        else:
+            run_steps_serial(conn, steps, debug=args.debug)
+
+        conn.commit()
+        try:
+            SCHEMA.save()
+        except OSError as exc:
+            print(f"[WARN] Could not write schema cache {cache_path}: {exc}")
     except Exception as exc:  # noqa: BLE001
         conn.rollback()
         print(f"[ERROR] country-main-analysis failed: {exc}", file=sys.stderr)
@@ -6,18 +6,46 @@ extracts them into clean subfolders, and (optionally) purges ZIPs
 and non-usable files for SQL analytics.
 
 Features:
-- Checksum skip logic for downloads (.md5 sidecars)
-- Extraction markers to avoid re-unzipping the same archive
+- Checksum skip logic for downloads (data/catalog.sqlite: path, size,
+  mtime, BLAKE2/xxhash, source URL; re-hashed only when size/mtime move)
+- HTTP revalidation (If-None-Match / If-Modified-Since from stored
+  ETag/Last-Modified) and Range resume of interrupted downloads
+- Streaming downloads (chunked to a temp file, hashed on the fly,
+  atomically renamed) and extraction straight from the on-disk ZIP
+- Per-archive member manifests (CRC32/size/mtime) so a changed ZIP only
+  rewrites the members that changed; data/changed_files.json lists them
 - Clean folder separation:
   data/retrosheet/{csv,gamelogs,events,boxscores,rosters}
   data/bref_war
   data/lahman
 - Optional --purge-zips to delete archives after extraction
+- Declarative source registry run as a small task graph: --jobs N runs
+  independent archives concurrently, --only events,2010s targets a subset
+- Optional --events-parquet stage: event files → Parquet plays dataset
+  partitioned by season/team (see retrosheet_parquet.py)
+- Optional --gamelogs-parquet stage: 161-field gamelogs → typed Parquet
+- One pooled HTTP session for all fetchers: keep-alive, per-host
+  concurrency cap, bounded retries with jittered exponential backoff
 """
 
-import os, sys, io, argparse, hashlib, zipfile
+import os, sys, argparse, hashlib, json, random, shutil, sqlite3, threading, time, zipfile
+from urllib.parse import urlsplit
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import xxhash  # optional: faster than BLAKE2 when available
+except ImportError:
+    xxhash = None
+
+# ---------- Sources ----------
+# Overridable so a local stand-in server can replace the real hosts.
+RETRO_BASE_URL = os.getenv("RETROSHEET_BASE_URL", "https://www.retrosheet.org").rstrip("/")
+BREF_BASE_URL = os.getenv("BREF_BASE_URL", "https://www.baseball-reference.com").rstrip("/")
 
 # ---------- Paths ----------
 ROOT = Path(__file__).resolve().parents[1]
@@ -39,84 +67,394 @@ for d in (
     d.mkdir(parents=True, exist_ok=True)
 
 # ---------- Helpers ----------
-def http_get(url: str) -> bytes:
-    print(f"🌐 GET {url}")
-    r = requests.get(url, timeout=180, allow_redirects=True)
-    r.raise_for_status()
-    return r.content
+CHUNK = 1 << 20  # 1 MiB read/write/hash granularity
+EXTRACT_WORKERS = min(4, os.cpu_count() or 1)  # threads per archive extraction
 
-def md5_bytes(b: bytes) -> str:
-    return hashlib.md5(b).hexdigest()
+def part_path(dest: Path) -> Path:
+    # Dot-prefixed so prune_non_usable never touches an in-flight download.
+    return dest.with_name(f".{dest.name}.part")
 
-def md5_file(path: Path) -> str:
-    h = hashlib.md5()
+def validators_path(dest: Path) -> Path:
+    # ETag/Last-Modified of the last complete download; dot-prefixed so it
+    # survives --purge-zips and pruning (the extracted files still match it).
+    return dest.with_name(f".{dest.name}.http.json")
+
+def load_json(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+def save_validators(path: Path, r: requests.Response):
+    v = {k: r.headers[h] for k, h in (("etag", "ETag"), ("last_modified", "Last-Modified")) if h in r.headers}
+    if v:
+        path.write_text(json.dumps(v))
+    else:
+        path.unlink(missing_ok=True)
+
+# ---------- HTTP session ----------
+# One pooled Session shared by every fetcher (keep-alive across the ~30
+# retrosheet.org requests), a per-host cap on concurrent requests, and
+# bounded retries with full-jitter exponential backoff.
+HTTP_RETRIES = 4
+HTTP_BACKOFF = 1.0       # seconds; attempt k sleeps uniform(0, HTTP_BACKOFF * 2**k)
+HTTP_PER_HOST = 4        # concurrent requests per host
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_session: requests.Session | None = None
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_http_lock = threading.Lock()
+
+class RetryableStatus(requests.HTTPError):
+    pass
+
+def http_session() -> requests.Session:
+    global _session
+    with _http_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_PER_HOST, max_retries=0)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+def host_slot(url: str) -> threading.BoundedSemaphore:
+    host = urlsplit(url).netloc
+    with _http_lock:
+        if host not in _host_slots:
+            _host_slots[host] = threading.BoundedSemaphore(HTTP_PER_HOST)
+        return _host_slots[host]
+
+def http_download(url: str, dest: Path, conditional: bool = False) -> str | None:
+    """
+    Stream url into dest and return its content hash (None on 304).
+    Chunks go straight to a temp file while being hashed, and the temp
+    file is renamed over dest only once the body is complete, so memory
+    stays flat and a crash never leaves a truncated dest behind.
+
+    - conditional: send If-None-Match / If-Modified-Since from the stored
+      validators of the previous download (only when the caller still has
+      that content locally).
+    - A leftover .part from an interrupted run is resumed with a Range
+      request guarded by If-Range; a 200 instead of 206 means the remote
+      changed (or ignores ranges) and the download restarts from zero.
+    - Connection errors, timeouts and 429/5xx are retried up to
+      HTTP_RETRIES times; a retry after a mid-body failure resumes from
+      the bytes already on disk.
+    """
+    for attempt in range(HTTP_RETRIES + 1):
+        try:
+            with host_slot(url):
+                return _http_download_once(url, dest, conditional)
+        except (requests.ConnectionError, requests.Timeout,
+                requests.exceptions.ChunkedEncodingError, RetryableStatus) as e:
+            if attempt == HTTP_RETRIES:
+                raise
+            delay = random.uniform(0, HTTP_BACKOFF * 2 ** attempt)
+            retry_after = getattr(getattr(e, "response", None), "headers", {}).get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            print(f"  ↻ {dest.name}: {e.__class__.__name__}; retry {attempt + 1}/{HTTP_RETRIES} in {delay:.1f}s")
+            time.sleep(delay)
+
+def content_range(r: requests.Response) -> tuple[int | None, int | None]:
+    """(first byte, complete length) from Content-Range; None for '*' or a missing/bad header."""
+    unit, _, spec = r.headers.get("Content-Range", "").partition(" ")
+    if unit.lower() != "bytes" or "/" not in spec:
+        return None, None
+    rng, _, total = spec.partition("/")
+    first = rng.split("-", 1)[0]
+    return (int(first) if first.isdigit() else None), (int(total) if total.isdigit() else None)
+
+def _http_download_once(url: str, dest: Path, conditional: bool) -> str | None:
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = part_path(dest)
+    tmp_val = validators_path(tmp)
+    headers = {}
+    offset = tmp.stat().st_size if tmp.exists() else 0
+    part_v = load_json(tmp_val) if offset else {}
+    if offset and (part_v.get("etag") or part_v.get("last_modified")):
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = part_v.get("etag") or part_v["last_modified"]
+    else:
+        offset = 0
+        if conditional:
+            v = load_json(validators_path(dest))
+            if v.get("etag"):
+                headers["If-None-Match"] = v["etag"]
+            if v.get("last_modified"):
+                headers["If-Modified-Since"] = v["last_modified"]
+
+    def restart() -> str | None:
+        tmp.unlink(missing_ok=True)
+        tmp_val.unlink(missing_ok=True)
+        return _http_download_once(url, dest, conditional)
+
+    def hash_partial():
+        with tmp.open("rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK), b""):
+                h.update(chunk)
+
+    print(f"🌐 GET {url}" + (f" (resume @ {offset} B)" if offset else ""))
+    h = new_hasher()
+    n = 0
+    t0 = time.monotonic()
+    with http_session().get(url, headers=headers, timeout=180, allow_redirects=True, stream=True) as r:
+        if r.status_code == 304:
+            print(f"  • {dest.name} (not modified)")
+            return None
+        if r.status_code == 416:
+            if not offset or content_range(r)[1] != offset:
+                # Our partial is not a prefix of what the server has; start over.
+                return restart()
+            # The partial already holds the whole body (we died before the
+            # rename); finish it with the validators saved when it started.
+            hash_partial()
+            os.replace(tmp, dest)
+            os.replace(tmp_val, validators_path(dest))
+        else:
+            if r.status_code in RETRY_STATUSES:
+                raise RetryableStatus(f"{r.status_code} for {url}", response=r)
+            r.raise_for_status()
+            if r.status_code == 206:
+                if content_range(r)[0] != offset:
+                    # Not the range we asked for; appending it would corrupt the file.
+                    return restart()
+                hash_partial()
+                mode = "ab"
+            else:
+                offset = 0
+                save_validators(tmp_val, r)
+                mode = "wb"
+            with tmp.open(mode) as f:
+                for chunk in r.iter_content(chunk_size=CHUNK):
+                    f.write(chunk)
+                    h.update(chunk)
+                    n += len(chunk)
+            os.replace(tmp, dest)
+            save_validators(validators_path(dest), r)
+            tmp_val.unlink(missing_ok=True)
+    digest = h.hexdigest()
+    CATALOG.record(dest, digest, url=url)
+    print(f"✅ saved {dest.name} ({(offset + n)/1024:.1f} KB, {HASH_ALGO}={digest[:8]})")
+    report_throughput(dest.name, n, time.monotonic() - t0)
+    return digest
+
+def report_throughput(name: str, nbytes: int, seconds: float):
+    mb = nbytes / (1 << 20)
+    print(f"⏱️  {name}: {mb:.1f} MB in {seconds:.1f}s ({mb / max(seconds, 1e-6):.2f} MB/s)")
+
+# ---------- File catalog ----------
+# One SQLite table under data/ replaces the old per-file .md5 sidecars.
+# A file is re-hashed only when its size or mtime no longer match the row.
+HASH_ALGO = "xxh3_128" if xxhash else "blake2b"
+
+def new_hasher():
+    return xxhash.xxh3_128() if xxhash else hashlib.blake2b(digest_size=16)
+
+def hash_file(path: Path) -> str:
+    h = new_hasher()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1<<20), b""):
+        for chunk in iter(lambda: f.read(CHUNK), b""):
             h.update(chunk)
     return h.hexdigest()
 
-def ensure_sidecar_md5(path: Path) -> str | None:
-    if not path.exists():
-        return None
-    side = path.with_suffix(path.suffix + ".md5")
-    if side.exists():
-        return side.read_text().strip()
-    h = md5_file(path)
-    side.write_text(h)
-    return h
-
-def write_with_md5(path: Path, b: bytes) -> str:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(b)
-    h = md5_bytes(b)
-    (path.with_suffix(path.suffix + ".md5")).write_text(h)
-    print(f"✅ saved {path.name} ({len(b)/1024:.1f} KB, md5={h[:8]})")
-    return h
-
-def unzip_bytes_to(b: bytes, dest: Path, keep_suffixes: tuple[str, ...]) -> int:
+class Catalog:
+    def __init__(self, path: Path):
+        self.path = path
+        self._db = None
+        self._lock = threading.Lock()
+
+    def _conn(self) -> sqlite3.Connection:
+        if self._db is None:
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS files (
+                       path TEXT PRIMARY KEY,
+                       size INTEGER NOT NULL,
+                       mtime_ns INTEGER NOT NULL,
+                       hash TEXT NOT NULL,
+                       algo TEXT NOT NULL,
+                       url TEXT,
+                       updated_at TEXT DEFAULT CURRENT_TIMESTAMP)"""
+            )
+        return self._db
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return str(path.relative_to(DATA)) if path.is_relative_to(DATA) else str(path)
+
+    def record(self, path: Path, digest: str, url: str | None = None):
+        st = path.stat()
+        with self._lock:
+            db = self._conn()
+            db.execute(
+                """INSERT INTO files (path, size, mtime_ns, hash, algo, url) VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(path) DO UPDATE SET size=excluded.size, mtime_ns=excluded.mtime_ns,
+                       hash=excluded.hash, algo=excluded.algo, url=COALESCE(excluded.url, files.url),
+                       updated_at=CURRENT_TIMESTAMP""",
+                (self._key(path), st.st_size, st.st_mtime_ns, digest, HASH_ALGO, url),
+            )
+            db.commit()
+
+    def hash_of(self, path: Path) -> str | None:
+        """Cached hash of path; recomputed only if size/mtime/algo changed."""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            row = self._conn().execute(
+                "SELECT size, mtime_ns, hash, algo FROM files WHERE path = ?", (self._key(path),)
+            ).fetchone()
+        if row and row[0] == st.st_size and row[1] == st.st_mtime_ns and row[3] == HASH_ALGO:
+            return row[2]
+        digest = hash_file(path)
+        self.record(path, digest)
+        return digest
+
+    def forget(self, path: Path):
+        with self._lock:
+            db = self._conn()
+            db.execute("DELETE FROM files WHERE path = ?", (self._key(path),))
+            db.commit()
+
+CATALOG = Catalog(DATA / "catalog.sqlite")
+
+def _extract_members(zip_path: Path, members: list[tuple[str, Path]]):
+    # Each worker opens its own handle: ZipFile objects are not safe to
+    # share across threads, but independent handles on one file are.
+    with zipfile.ZipFile(zip_path) as z:
+        for name, out in members:
+            with z.open(name) as src, out.open("wb") as dst:
+                shutil.copyfileobj(src, dst, CHUNK)
+
+def unzip_file_to(zip_path: Path, dest: Path, keep_suffixes: tuple[str, ...],
+                  workers: int | None = None, previous: dict | None = None) -> dict:
+    """
+    Extract the kept members of zip_path into dest (flattened) and return
+    the member manifest {basename: {name, crc, size, mtime}} built from the
+    ZIP central directory. With a previous manifest, members whose CRC32
+    and size are unchanged (and whose output is still on disk) are not
+    rewritten; everything that is written is reported via record_changed.
+    """
     keep = tuple(s.lower() for s in keep_suffixes)
-    kept = 0
-    with zipfile.ZipFile(io.BytesIO(b)) as z:
-        for name in z.namelist():
-            base = Path(name).name
-            if not base:
+    previous = previous or {}
+    manifest: dict[str, dict] = {}
+    targets: dict[Path, str] = {}
+    with zipfile.ZipFile(zip_path) as z:
+        for info in z.infolist():
+            base = Path(info.filename).name
+            if not base or info.is_dir():
                 continue
             lower = base.lower()
             if keep and not any(lower.endswith(s) for s in keep):
                 continue
-            out = dest / base
-            out.parent.mkdir(parents=True, exist_ok=True)
-            out.write_bytes(z.read(name))
-            kept += 1
-    print(f"📂 extracted {kept} files → {dest}")
-    return kept
+            # Members are flattened; on a basename clash the last one wins.
+            manifest[base] = {
+                "name": info.filename,
+                "crc": info.CRC,
+                "size": info.file_size,
+                "mtime": "%04d-%02d-%02dT%02d:%02d:%02d" % info.date_time,
+            }
+            targets[dest / base] = info.filename
+    dest.mkdir(parents=True, exist_ok=True)
+    members = []
+    for out, name in targets.items():
+        old, new = previous.get(out.name), manifest[out.name]
+        if (old and old.get("crc") == new["crc"] and old.get("size") == new["size"]
+                and out.exists() and out.stat().st_size == new["size"]):
+            continue
+        members.append((name, out))
+    workers = max(1, min(workers or EXTRACT_WORKERS, len(members) or 1))
+    if workers == 1:
+        _extract_members(zip_path, members)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for fut in [ex.submit(_extract_members, zip_path, members[i::workers]) for i in range(workers)]:
+                fut.result()
+    record_changed(out for _, out in members)
+    print(f"📂 extracted {len(members)}/{len(manifest)} changed files → {dest}")
+    return manifest
+
+# ---------- Extraction manifests ----------
+# One .unzipped.<zip>.json per archive: the archive hash plus the manifest
+# returned by unzip_file_to. Older runs left a bare .unzipped.<zip>.md5.
+CHANGED_FILES: list[Path] = []
+_changed_lock = threading.Lock()
+
+def record_changed(paths):
+    with _changed_lock:
+        CHANGED_FILES.extend(paths)
+
+def write_changed_list(path: Path) -> int:
+    """Write this run's changed files (relative to DATA) for downstream loaders."""
+    with _changed_lock:
+        files = sorted({str(p.relative_to(DATA)) if p.is_relative_to(DATA) else str(p) for p in CHANGED_FILES})
+    path.write_text(json.dumps({"generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "files": files}, indent=1))
+    return len(files)
+
+def manifest_path(zip_basename: str, outdir: Path) -> Path:
+    return outdir / f".unzipped.{zip_basename}.json"
 
 def already_processed(zip_basename: str, outdir: Path) -> bool:
     # A prior successful extraction leaves this marker even if ZIP was purged.
-    marker = outdir / f".unzipped.{zip_basename}.md5"
-    return marker.exists()
+    return (manifest_path(zip_basename, outdir).exists()
+            or (outdir / f".unzipped.{zip_basename}.md5").exists())
+
+def read_manifest(zip_basename: str, outdir: Path) -> dict:
+    return load_json(manifest_path(zip_basename, outdir)).get("members", {})
 
-def mark_processed(zip_basename: str, outdir: Path, zip_md5: str):
-    (outdir / f".unzipped.{zip_basename}.md5").write_text(zip_md5)
+def mark_processed(zip_basename: str, outdir: Path, zip_hash: str, members: dict):
+    manifest_path(zip_basename, outdir).write_text(json.dumps({"zip_hash": zip_hash, "members": members}))
+    (outdir / f".unzipped.{zip_basename}.md5").unlink(missing_ok=True)
+
+def remove_dropped_members(zip_basename: str, outdir: Path, old: dict, new: dict) -> int:
+    """
+    Delete extracted files whose member is gone from the new archive,
+    unless another archive's manifest in the same folder still lists the
+    same basename (members are flattened, so they can share a name).
+    """
+    dropped = set(old) - set(new)
+    if not dropped:
+        return 0
+    own = manifest_path(zip_basename, outdir).name
+    for other in outdir.glob(".unzipped.*.json"):
+        if other.name != own:
+            dropped -= set(load_json(other).get("members", {}))
+    for base in dropped:
+        (outdir / base).unlink(missing_ok=True)
+    if dropped:
+        print(f"🗑️  removed {len(dropped)} files no longer in {zip_basename}")
+    return len(dropped)
+
+# Archives of one group share a dest folder; extraction into a folder is
+# serialised so members with the same basename can't interleave.
+_dest_locks: dict[Path, threading.Lock] = {}
+_dest_locks_lock = threading.Lock()
+
+def dest_lock(dest: Path) -> threading.Lock:
+    with _dest_locks_lock:
+        return _dest_locks.setdefault(dest.resolve(), threading.Lock())
 
 def purge_zip(zip_path: Path):
-    md5_side = zip_path.with_suffix(zip_path.suffix + ".md5")
-    if zip_path.exists():
-        zip_path.unlink(missing_ok=True)
-    if md5_side.exists():
-        md5_side.unlink(missing_ok=True)
+    zip_path.unlink(missing_ok=True)
+    CATALOG.forget(zip_path)
 
 def prune_non_usable(outdir: Path, allowed_suffixes: tuple[str, ...]):
+    # scandir gives us name + type from the directory entry itself, so a
+    # no-op pass does not stat every file.
     allowed = tuple(s.lower() for s in allowed_suffixes)
     removed = 0
-    for p in outdir.iterdir():
-        if p.is_dir() or p.name.startswith("."):
-            continue
-        if not any(p.name.lower().endswith(s) for s in allowed):
-            p.unlink(missing_ok=True)
-            md5 = p.with_suffix(p.suffix + ".md5")
-            md5.unlink(missing_ok=True)
-            removed += 1
+    with os.scandir(outdir) as it:
+        for e in it:
+            if e.name.startswith(".") or e.is_dir():
+                continue
+            if not e.name.lower().endswith(allowed):
+                p = Path(e.path)
+                p.unlink(missing_ok=True)
+                CATALOG.forget(p)
+                removed += 1
     if removed:
         print(f"🧹 pruned {removed} non-usable files in {outdir}")
 
@@ -127,212 +465,267 @@ def note_lahman_manual():
 def note_rosters_manual():
     print("🗂️  Your manual rosters live in data/retrosheet/rosters/ (kept as-is)")
 
-# ---------- NEW: Retrosheet master CSV bundle ----------
-def fetch_retrosheet_master_csv(force: bool, purge_zips: bool):
+# ---------- Source registry ----------
+@dataclass(frozen=True)
+class Source:
+    group: str                 # selectable with --only (events, gamelogs, …)
+    url: str
+    dest: Path                 # directory the file/extracted members land in
+    keep: tuple[str, ...]      # suffixes kept on extraction and by pruning
+    archive: bool = True       # ZIP to extract vs. plain file
+
+    @property
+    def name(self) -> str:
+        return self.url.rsplit("/", 1)[-1]
+
+GROUP_LABELS = {
+    "csv": "Retrosheet master CSVs",
+    "gamelogs": "Retrosheet gamelogs (regular+postseason)",
+    "events": "Retrosheet events",
+    "boxscores": "Retrosheet boxscores",
+    "war": "Baseball-Reference WAR daily",
+}
+
+def build_sources() -> list[Source]:
+    retro, bref = RETRO_BASE_URL, BREF_BASE_URL
+    ev_keep = (".evn", ".eva", ".ev", ".txt", ".csv")
+    box_keep = (".box", ".txt", ".csv")
+    return [
+        Source("csv", f"{retro}/downloads/csvdownloads.zip", RETRO_CSV_DIR, (".csv",)),
+        *(Source("gamelogs", f"{retro}/gamelogs/{f}", RETRO_GAMELOGS_DIR, (".txt", ".csv"))
+          for f in ("gl1871_2024.zip", "glws.zip", "glas.zip", "glwc.zip", "gldv.zip", "gllc.zip")),
+        # Event files start in the 1910s, boxscores in the 1900s.
+        *(Source("events", f"{retro}/events/{d}seve.zip", RETRO_EVENTS_DIR, ev_keep)
+          for d in range(1910, 2030, 10)),
+        *(Source("boxscores", f"{retro}/events/{d}sbox.zip", RETRO_BOXSCORES_DIR, box_keep)
+          for d in range(1900, 2030, 10)),
+        *(Source("war", f"{bref}/data/{f}", BREF_DIR, (".txt", ".csv"), archive=False)
+          for f in ("war_daily_bat.txt", "war_daily_pitch.txt")),
+    ]
+
+def select_sources(sources: list[Source], only: str | None) -> list[Source]:
     """
-    https://www.retrosheet.org/downloads/csvdownloads.zip
-    Extracts into data/retrosheet/csv/ and keeps only .csv files.
+    --only takes comma-separated tokens. Tokens naming a group restrict
+    the groups; any other token must appear in the file name, e.g.
+    "events,2010s" → 2010seve.zip, "gamelogs" → every gamelog archive.
     """
-    print("📦 Retrosheet Master CSV bundle…")
-    url = "https://www.retrosheet.org/downloads/csvdownloads.zip"
-    fname = url.rsplit("/", 1)[-1]
-    zip_path = RETRO_CSV_DIR / fname
-    keep = (".csv",)
+    tokens = [t.strip().lower() for t in (only or "").split(",") if t.strip()]
+    groups = {t for t in tokens if t in GROUP_LABELS}
+    names = [t for t in tokens if t not in GROUP_LABELS]
+    return [
+        s for s in sources
+        if (not groups or s.group in groups)
+        and (not names or any(t in s.name.lower() for t in names))
+    ]
 
-    if already_processed(fname, RETRO_CSV_DIR) and not force:
+def fetch_archive(src: Source, force: bool, purge_zips: bool) -> bool:
+    """Download (or revalidate) one ZIP and extract it. True if anything changed."""
+    fname = src.name
+    zip_path = src.dest / fname
+    processed = already_processed(fname, src.dest) and not force
+    if processed and not validators_path(zip_path).exists():
         print(f"  • {fname} (skip: already processed)")
-        return
+        return False
 
-    # Download (or reuse)
-    if zip_path.exists() and not force:
+    if zip_path.exists() and not force and not processed:
         print(f"  • {fname} (using existing ZIP)")
-        zbytes = zip_path.read_bytes()
-        zmd5 = ensure_sidecar_md5(zip_path) or md5_bytes(zbytes)
+        zhash = CATALOG.hash_of(zip_path)
     else:
+        # Already extracted: only re-fetch if the remote copy changed.
         try:
-            zbytes = http_get(url)
-            zmd5 = write_with_md5(zip_path, zbytes)
+            zhash = http_download(src.url, zip_path, conditional=processed)
         except Exception as e:
             print(f"  ⚠️ {fname} download failed: {e}")
-            return
+            return False
+        if zhash is None:
+            return False
 
-    # Extract only CSVs
     try:
-        unzip_bytes_to(zbytes, RETRO_CSV_DIR, keep_suffixes=keep)
-        mark_processed(fname, RETRO_CSV_DIR, zmd5)
+        with dest_lock(src.dest):
+            previous = read_manifest(fname, src.dest)
+            members = unzip_file_to(zip_path, src.dest, keep_suffixes=src.keep,
+                                    previous=None if force else previous)
+            if not members:
+                print(f"    ℹ️ {fname} had no {'/'.join(k.lstrip('.').upper() for k in src.keep)} (some decades may be sparse)")
+            mark_processed(fname, src.dest, zhash, members)
+            remove_dropped_members(fname, src.dest, previous, members)
         if purge_zips:
             purge_zip(zip_path)
     except Exception as e:
         print(f"  ⚠️ {fname} extract failed: {e}")
-
-    prune_non_usable(RETRO_CSV_DIR, allowed_suffixes=keep)
-    print(f"✅ Retrosheet CSVs → {RETRO_CSV_DIR}")
-
-# ---------- Retrosheet: Gamelogs ----------
-def fetch_retrosheet_gamelogs(force: bool, purge_zips: bool):
-    print("📦 Retrosheet Gamelogs (regular+postseason)…")
-    urls = [
-        "https://www.retrosheet.org/gamelogs/gl1871_2024.zip",
-        "https://www.retrosheet.org/gamelogs/glws.zip",
-        "https://www.retrosheet.org/gamelogs/glas.zip",
-        "https://www.retrosheet.org/gamelogs/glwc.zip",
-        "https://www.retrosheet.org/gamelogs/gldv.zip",
-        "https://www.retrosheet.org/gamelogs/gllc.zip",
-    ]
-    keep = (".txt", ".csv")
-
-    for u in urls:
-        fname = u.rsplit("/",1)[-1]
-        zip_path = RETRO_GAMELOGS_DIR / fname
-        if already_processed(fname, RETRO_GAMELOGS_DIR) and not force:
-            print(f"  • {fname} (skip: already processed)")
-            continue
-
-        if zip_path.exists() and not force:
-            print(f"  • {fname} (using existing ZIP)")
-            zbytes = zip_path.read_bytes()
-            zmd5 = ensure_sidecar_md5(zip_path) or md5_bytes(zbytes)
-        else:
-            try:
-                zbytes = http_get(u)
-                zmd5 = write_with_md5(zip_path, zbytes)
-            except Exception as e:
-                print(f"  ⚠️ {fname} download failed: {e}")
-                continue
-
-        try:
-            unzip_bytes_to(zbytes, RETRO_GAMELOGS_DIR, keep_suffixes=keep)
-            mark_processed(fname, RETRO_GAMELOGS_DIR, zmd5)
-            if purge_zips:
-                purge_zip(zip_path)
-        except Exception as e:
-            print(f"  ⚠️ {fname} extract failed: {e}")
-
-    prune_non_usable(RETRO_GAMELOGS_DIR, allowed_suffixes=keep)
-    print(f"✅ gamelogs → {RETRO_GAMELOGS_DIR}")
-
-# ---------- Retrosheet: Events & Boxscores ----------
-def fetch_retrosheet_events_and_box(force: bool, purge_zips: bool):
-    print("📦 Retrosheet Events + Boxscores by decade…")
-    events = [
-        "1910seve.zip","1920seve.zip","1930seve.zip","1940seve.zip",
-        "1950seve.zip","1960seve.zip","1970seve.zip","1980seve.zip",
-        "1990seve.zip","2000seve.zip","2010seve.zip","2020seve.zip",
-    ]
-    boxs = [
-        "1900sbox.zip","1910sbox.zip","1920sbox.zip","1930sbox.zip",
-        "1940sbox.zip","1950sbox.zip","1960sbox.zip","1970sbox.zip",
-        "1980sbox.zip","1990sbox.zip","2000sbox.zip","2010sbox.zip","2020sbox.zip",
-    ]
-    base = "https://www.retrosheet.org/events"
-
-    # Events
-    ev_keep = (".evn", ".eva", ".ev", ".txt", ".csv")
-    for fname in events:
-        url = f"{base}/{fname}"
-        zip_path = RETRO_EVENTS_DIR / fname
-        if already_processed(fname, RETRO_EVENTS_DIR) and not force:
-            print(f"  • {fname} (skip: already processed)")
-            continue
-        if zip_path.exists() and not force:
-            print(f"  • {fname} (using existing ZIP)")
-            zbytes = zip_path.read_bytes()
-            zmd5 = ensure_sidecar_md5(zip_path) or md5_bytes(zbytes)
-        else:
-            try:
-                zbytes = http_get(url)
-                zmd5 = write_with_md5(zip_path, zbytes)
-            except Exception as e:
-                print(f"  ⚠️ {fname} download failed: {e}")
-                continue
-        try:
-            unzip_bytes_to(zbytes, RETRO_EVENTS_DIR, keep_suffixes=ev_keep)
-            mark_processed(fname, RETRO_EVENTS_DIR, zmd5)
-            if purge_zips:
-                purge_zip(zip_path)
-        except Exception as e:
-            print(f"  ⚠️ {fname} extract failed: {e}")
-    prune_non_usable(RETRO_EVENTS_DIR, allowed_suffixes=ev_keep)
-    print(f"✅ events → {RETRO_EVENTS_DIR}")
-
-    # Boxscores
-    box_keep = (".box", ".txt", ".csv")
-    for fname in boxs:
-        url = f"{base}/{fname}"
-        zip_path = RETRO_BOXSCORES_DIR / fname
-        if already_processed(fname, RETRO_BOXSCORES_DIR) and not force:
-            print(f"  • {fname} (skip: already processed)")
-            continue
-        if zip_path.exists() and not force:
-            print(f"  • {fname} (using existing ZIP)")
-            zbytes = zip_path.read_bytes()
-            zmd5 = ensure_sidecar_md5(zip_path) or md5_bytes(zbytes)
-        else:
-            try:
-                zbytes = http_get(url)
-                zmd5 = write_with_md5(zip_path, zbytes)
-            except Exception as e:
-                print(f"  ⚠️ {fname} download failed: {e}")
-                continue
-        try:
-            extracted = unzip_bytes_to(zbytes, RETRO_BOXSCORES_DIR, keep_suffixes=box_keep)
-            if extracted == 0:
-                print("    ℹ️ archive had no .BOX/.TXT/.CSV (some decades may be sparse)")
-            mark_processed(fname, RETRO_BOXSCORES_DIR, zmd5)
-            if purge_zips:
-                purge_zip(zip_path)
-        except Exception as e:
-            print(f"  ⚠️ {fname} extract failed: {e}")
-    prune_non_usable(RETRO_BOXSCORES_DIR, allowed_suffixes=box_keep)
-    print(f"✅ boxscores → {RETRO_BOXSCORES_DIR}")
-
-# ---------- Baseball-Reference WAR ----------
-def fetch_bref_war(force: bool):
-    print("📦 Baseball-Reference WAR daily…")
-    urls = {
-        "war_daily_bat.txt":   "https://www.baseball-reference.com/data/war_daily_bat.txt",
-        "war_daily_pitch.txt": "https://www.baseball-reference.com/data/war_daily_pitch.txt",
-    }
-    keep = (".txt", ".csv")
-    for fname, url in urls.items():
-        dest = BREF_DIR / fname
-        if dest.exists() and not force:
-            print(f"  • {fname} (skip: exists)")
-            continue
-        try:
-            b = http_get(url)
-            write_with_md5(dest, b)
-            # .csv twin
+        return False
+    return True
+
+def fetch_file(src: Source, force: bool) -> bool:
+    """Download (or revalidate) a plain file, plus its .csv twin for .txt."""
+    dest = src.dest / src.name
+    # These change daily, so an existing copy is revalidated rather than
+    # skipped: a 304 costs one round-trip, a 200 replaces both twins.
+    try:
+        h = http_download(src.url, dest, conditional=dest.exists() and not force)
+        if h is None:
+            return False
+        changed = [dest]
+        if dest.suffix.lower() == ".txt":
             csvp = dest.with_suffix(".csv")
-            if not csvp.exists():
-                csvp.write_bytes(b)
-                (csvp.with_suffix(csvp.suffix + ".md5")).write_text(md5_bytes(b))
-        except Exception as e:
-            print(f"  ⚠️ {fname} failed: {e}")
-    prune_non_usable(BREF_DIR, allowed_suffixes=keep)
-    print(f"✅ WAR files → {BREF_DIR}")
+            shutil.copyfile(dest, csvp)
+            CATALOG.record(csvp, h, url=src.url)
+            changed.append(csvp)
+        record_changed(changed)
+    except Exception as e:
+        print(f"  ⚠️ {src.name} failed: {e}")
+        return False
+    return True
+
+def finish_group(group: str, dest: Path, keep: tuple[str, ...]) -> bool:
+    prune_non_usable(dest, allowed_suffixes=keep)
+    print(f"✅ {GROUP_LABELS[group]} → {dest}")
+    return True
+
+# ---------- Task graph ----------
+def run_graph(tasks: dict[str, tuple[Callable[[], bool], list[str], bool]], jobs: int,
+              failures: dict[str, Exception] | None = None) -> dict[str, bool]:
+    """
+    Run a small DAG on a bounded thread pool.
+    tasks maps name -> (fn, deps, lazy); fn returns True if it changed
+    something. A task starts once all of its deps are done; a lazy task
+    is skipped (False) when it has deps and none of them changed anything.
+    Non-lazy tasks always run after their deps (they do their own
+    staleness checks). A task that raises counts as False and, if
+    failures is given, is recorded there.
+    """
+    for name, (_, deps, _lazy) in tasks.items():
+        missing = [d for d in deps if d not in tasks]
+        if missing:
+            raise ValueError(f"task {name} depends on unknown {missing}")
+    results: dict[str, bool] = {}
+    pending = dict(tasks)
+    running: dict = {}
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as ex:
+        while pending or running:
+            progressed = True
+            while progressed:
+                progressed = False
+                for name, (fn, deps, lazy) in list(pending.items()):
+                    if not all(d in results for d in deps):
+                        continue
+                    del pending[name]
+                    progressed = True
+                    if lazy and deps and not any(results[d] for d in deps):
+                        results[name] = False
+                    else:
+                        running[ex.submit(fn)] = name
+            if not running:
+                if pending:
+                    raise ValueError(f"dependency cycle among {sorted(pending)}")
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                name = running.pop(fut)
+                try:
+                    results[name] = bool(fut.result())
+                except Exception as e:
+                    print(f"  ⚠️ {name} failed: {e}")
+                    results[name] = False
+                    if failures is not None:
+                        failures[name] = e
+    return results
+
+def load_retrosheet_parquet():
+    # Sibling module, imported lazily so pyarrow is only needed when a
+    # Parquet stage runs. etl/ is not a package, so make sure this file's
+    # directory is importable however fetch_sources was started or imported.
+    here = str(Path(__file__).resolve().parent)
+    if here not in sys.path:
+        sys.path.insert(0, here)
+    import retrosheet_parquet
+    return retrosheet_parquet
+
+def events_parquet(procs: int | None) -> bool:
+    return load_retrosheet_parquet().events_to_parquet(RETRO_EVENTS_DIR, procs=procs) > 0
+
+def gamelogs_parquet(procs: int | None) -> bool:
+    return load_retrosheet_parquet().gamelogs_to_parquet(RETRO_GAMELOGS_DIR, procs=procs) > 0
+
+def build_tasks(sources: list[Source], force: bool, purge_zips: bool,
+                events_to_parquet: bool = False, gamelogs_to_parquet: bool = False,
+                parse_procs: int | None = None) -> dict:
+    tasks: dict[str, tuple[Callable[[], bool], list[str], bool]] = {}
+    by_group: dict[str, list[Source]] = {}
+    for src in sources:
+        by_group.setdefault(src.group, []).append(src)
+        if src.archive:
+            fn = lambda s=src: fetch_archive(s, force, purge_zips)
+        else:
+            fn = lambda s=src: fetch_file(s, force)
+        tasks[f"fetch:{src.name}"] = (fn, [], True)
+    for group, srcs in by_group.items():
+        # Not lazy: pruning must also run on no-op refreshes, as it always did,
+        # so stray files dropped into the folder between runs are cleaned up.
+        tasks[f"finish:{group}"] = (
+            lambda g=group, d=srcs[0].dest, k=srcs[0].keep: finish_group(g, d, k),
+            [f"fetch:{s.name}" for s in srcs],
+            False,
+        )
+    if events_to_parquet:
+        # Not lazy: the first run with the flag must convert files that were
+        # extracted long ago; the stage itself skips up-to-date outputs.
+        deps = ["finish:events"] if "finish:events" in tasks else []
+        tasks["parquet:events"] = (lambda: events_parquet(parse_procs), deps, False)
+    if gamelogs_to_parquet:
+        deps = ["finish:gamelogs"] if "finish:gamelogs" in tasks else []
+        tasks["parquet:gamelogs"] = (lambda: gamelogs_parquet(parse_procs), deps, False)
+    return tasks
 
 # ---------- Main ----------
 def main():
+    global EXTRACT_WORKERS, HTTP_RETRIES, HTTP_PER_HOST
     ap = argparse.ArgumentParser(description="Fetch MLB datasets w/ idempotent extraction & cleanup")
     ap.add_argument("--force", action="store_true", help="Re-download and re-extract everything")
     ap.add_argument("--purge-zips", action="store_true", help="Delete ZIP archives after extraction")
+    ap.add_argument("--jobs", type=int, default=4, help="Archives to fetch/extract concurrently (1 = serial)")
+    ap.add_argument("--extract-workers", type=int, default=EXTRACT_WORKERS,
+                    help="Threads used to extract the members of one archive")
+    ap.add_argument("--retries", type=int, default=HTTP_RETRIES, help="Retries per download on network/5xx errors")
+    ap.add_argument("--per-host", type=int, default=HTTP_PER_HOST, help="Max concurrent requests to one host")
+    ap.add_argument("--events-parquet", action="store_true",
+                    help="Also convert event files to a Parquet plays dataset (data/parquet/plays, needs pyarrow)")
+    ap.add_argument("--gamelogs-parquet", action="store_true",
+                    help="Also convert gamelogs to a typed Parquet dataset (data/parquet/gamelogs, needs pyarrow)")
+    ap.add_argument("--parse-procs", type=int, default=None, help="Processes for Parquet conversion (default: all CPUs)")
+    ap.add_argument("--only", help="Comma-separated groups and/or file-name fragments, e.g. events,2010s "
+                                   f"(groups: {', '.join(GROUP_LABELS)})")
     args = ap.parse_args()
+    EXTRACT_WORKERS = max(1, args.extract_workers)
+    HTTP_RETRIES = max(0, args.retries)
+    HTTP_PER_HOST = max(1, args.per_host)
+    t0 = time.monotonic()
 
     print("🚀 Starting MLB data fetch…")
     note_lahman_manual()   # you keep Lahman in data/lahman
     note_rosters_manual()  # you keep manual rosters in data/retrosheet/rosters
 
-    # NEW: Master CSV bundle first (core tables you'll query a lot)
-    fetch_retrosheet_master_csv(force=args.force, purge_zips=args.purge_zips)
-
-    # Then the others you already set up
-    fetch_retrosheet_gamelogs(force=args.force, purge_zips=args.purge_zips)
-    fetch_retrosheet_events_and_box(force=args.force, purge_zips=args.purge_zips)
-    fetch_bref_war(force=args.force)
+    sources = select_sources(build_sources(), args.only)
+    if not sources:
+        print(f"⚠️ --only {args.only!r} matched no sources (groups: {', '.join(GROUP_LABELS)})")
+        return 1
+    print(f"📦 {len(sources)} sources: " + ", ".join(sorted({GROUP_LABELS[s.group] for s in sources})))
+    tasks = build_tasks(sources, force=args.force, purge_zips=args.purge_zips,
+                        events_to_parquet=args.events_parquet, gamelogs_to_parquet=args.gamelogs_parquet,
+                        parse_procs=args.parse_procs)
+    failures: dict[str, Exception] = {}
+    results = run_graph(tasks, jobs=args.jobs, failures=failures)
+    fetched = sum(1 for k, v in results.items() if k.startswith("fetch:") and v)
+    print(f"🔁 {fetched}/{len(sources)} sources changed")
+
+    changed = write_changed_list(DATA / "changed_files.json")
+    print(f"📝 {changed} new/changed files listed in {DATA / 'changed_files.json'}")
 
     total = sum(len(files) for _, _, files in os.walk(DATA))
-    print(f"\n🎉 All done. {total} files under {DATA}")
+    if failures:
+        print(f"\n⚠️ {len(failures)} task(s) failed: {', '.join(sorted(failures))}")
+        return 1
+    print(f"\n🎉 All done. {total} files under {DATA} ({time.monotonic() - t0:.1f}s)")
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+retrosheet_parquet.py
+Converts extracted Retrosheet text files into columnar Parquet datasets.
+
+- Event files (.EVN/.EVA) → one row per `play` record, written as a
+  hive-partitioned dataset: <out>/season=YYYY/team=TTT/<file>.parquet
+- Work is spread over a process pool, one source file per task; each
+  worker writes its own Parquet file, so nothing large crosses processes.
+- Gamelogs (GLyyyy.TXT, GLWS.TXT, …) → one typed row per game using the
+  fixed 161-field Retrosheet layout: <out>/<file>.parquet
+- A file is only re-converted when its source is newer than its output.
+
+Used as optional stages by fetch_sources.py (--events-parquet,
+--gamelogs-parquet), or standalone:
+    python3 etl/retrosheet_parquet.py events [--src DIR] [--out DIR] [--procs N]
+    python3 etl/retrosheet_parquet.py gamelogs [--src DIR] [--out DIR] [--procs N]
+
+Requires pyarrow (pip install pyarrow).
+"""
+
+import argparse, csv, os, re, sys, time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / "data"
+EVENTS_DIR = DATA / "retrosheet" / "events"
+GAMELOGS_DIR = DATA / "retrosheet" / "gamelogs"
+PARQUET_DIR = DATA / "parquet"
+
+EVENT_SUFFIXES = (".evn", ".eva")
+EVENT_FILE_RE = re.compile(r"^(\d{4})([A-Z0-9]{3})\.EV[AN]$", re.IGNORECASE)
+GAMELOG_FILE_RE = re.compile(r"^GL(\d{4}|WS|AS|WC|DV|LC)\.TXT$", re.IGNORECASE)
+GAMELOG_TYPES = {"WS": "world_series", "AS": "all_star", "WC": "wild_card",
+                 "DV": "division_series", "LC": "league_championship"}
+
+def require_pyarrow():
+    if pa is None:
+        raise RuntimeError("pyarrow is required for Parquet output. Install it with: pip install pyarrow")
+
+# ---------- Event files ----------
+def play_schema():
+    return pa.schema([
+        ("game_id", pa.string()),
+        ("game_date", pa.date32()),
+        ("visiting_team", pa.string()),
+        ("home_team", pa.string()),
+        ("seq", pa.int16()),          # play number within the game
+        ("inning", pa.int8()),
+        ("batting_home", pa.bool_()),
+        ("batter", pa.string()),
+        ("balls", pa.int8()),         # NULL when the count is unknown ("??")
+        ("strikes", pa.int8()),
+        ("pitches", pa.string()),
+        ("event", pa.string()),
+    ])
+
+def _count_digit(c: str):
+    return int(c) if c.isdigit() else None
+
+def _parse_date(v: str):
+    try:
+        y, m, d = (int(x) for x in v.split("/"))
+        return date(y, m, d)
+    except ValueError:
+        return None
+
+def parse_event_file(path: Path) -> dict[str, list]:
+    """Parse one event file into column lists matching play_schema()."""
+    cols = {name: [] for name in play_schema().names}
+    game_id, game_date, vis, home, seq = None, None, None, None, 0
+    with path.open("r", encoding="latin-1", newline="") as f:
+        for rec in csv.reader(f):
+            if not rec:
+                continue
+            kind = rec[0]
+            if kind == "id":
+                game_id, game_date, vis, seq = rec[1], None, None, 0
+                home = rec[1][:3]
+            elif kind == "info" and len(rec) >= 3:
+                if rec[1] == "visteam":
+                    vis = rec[2]
+                elif rec[1] == "hometeam":
+                    home = rec[2]
+                elif rec[1] == "date":
+                    game_date = _parse_date(rec[2])
+            elif kind == "play" and len(rec) >= 7:
+                seq += 1
+                count = rec[4]
+                cols["game_id"].append(game_id)
+                cols["game_date"].append(game_date)
+                cols["visiting_team"].append(vis)
+                cols["home_team"].append(home)
+                cols["seq"].append(seq)
+                cols["inning"].append(int(rec[1]) if rec[1].isdigit() else None)
+                cols["batting_home"].append(rec[2] == "1")
+                cols["batter"].append(rec[3])
+                cols["balls"].append(_count_digit(count[0]) if len(count) == 2 else None)
+                cols["strikes"].append(_count_digit(count[1]) if len(count) == 2 else None)
+                cols["pitches"].append(rec[5])
+                cols["event"].append(rec[6])
+    return cols
+
+def event_partition(path: Path) -> tuple[str, str] | None:
+    """(season, team) from a YYYYTTT.EVx file name, else None."""
+    m = EVENT_FILE_RE.match(path.name)
+    return (m.group(1), m.group(2).upper()) if m else None
+
+def event_output_path(path: Path, out_root: Path) -> Path | None:
+    if not path.name.lower().endswith(EVENT_SUFFIXES):
+        return None
+    part = event_partition(path)
+    if part is None:
+        return None
+    season, team = part
+    return out_root / f"season={season}" / f"team={team}" / f"{path.stem.upper()}.parquet"
+
+def convert_event_file(src: str, dest: str) -> int:
+    """Process-pool worker: parse src and write its Parquet file; returns row count."""
+    cols = parse_event_file(Path(src))
+    return write_parquet(pa.Table.from_pydict(cols, schema=play_schema()), Path(dest))
+
+def events_to_parquet(src_dir: Path = EVENTS_DIR, out_root: Path = PARQUET_DIR / "plays",
+                      procs: int | None = None) -> int:
+    """Convert new/changed event files; returns how many files were written."""
+    todo = stale_files(src_dir, out_root, event_output_path)
+    return convert_parallel("plays", todo, convert_event_file, out_root, procs)
+
+# ---------- Gamelogs ----------
+# Field layout from https://www.retrosheet.org/gamelogs/glfields.txt.
+# Counting stats are small ints; everything else stays a string.
+TEAM_STATS = [
+    # offense
+    "at_bats", "hits", "doubles", "triples", "home_runs", "rbi", "sac_hits", "sac_flies",
+    "hit_by_pitch", "walks", "intentional_walks", "strikeouts", "stolen_bases",
+    "caught_stealing", "gidp", "catcher_interference", "left_on_base",
+    # pitching
+    "pitchers_used", "individual_er", "team_er", "wild_pitches", "balks",
+    # defense
+    "putouts", "assists", "errors", "passed_balls", "double_plays", "triple_plays",
+]
+
+def gamelog_fields() -> list[tuple[str, str]]:
+    """(name, kind) for all 161 fields in file order; kind is date/int8/int16/int32/str."""
+    f = [
+        ("date", "date"), ("game_num", "int8"), ("day_of_week", "str"),
+        ("visiting_team", "str"), ("visiting_league", "str"), ("visiting_game_num", "int16"),
+        ("home_team", "str"), ("home_league", "str"), ("home_game_num", "int16"),
+        ("visiting_score", "int16"), ("home_score", "int16"), ("length_outs", "int16"),
+        ("day_night", "str"), ("completion_info", "str"), ("forfeit_info", "str"),
+        ("protest_info", "str"), ("park_id", "str"), ("attendance", "int32"),
+        ("duration_minutes", "int16"), ("visiting_line_score", "str"), ("home_line_score", "str"),
+    ]
+    f += [(f"visiting_{s}", "int16") for s in TEAM_STATS]
+    f += [(f"home_{s}", "int16") for s in TEAM_STATS]
+    for ump in ("hp", "1b", "2b", "3b", "lf", "rf"):
+        f += [(f"ump_{ump}_id", "str"), (f"ump_{ump}_name", "str")]
+    for role in ("visiting_manager", "home_manager", "winning_pitcher", "losing_pitcher",
+                 "saving_pitcher", "gwrbi_batter", "visiting_starting_pitcher",
+                 "home_starting_pitcher"):
+        f += [(f"{role}_id", "str"), (f"{role}_name", "str")]
+    for side in ("visiting", "home"):
+        for i in range(1, 10):
+            f += [(f"{side}_{i}_id", "str"), (f"{side}_{i}_name", "str"), (f"{side}_{i}_pos", "int8")]
+    f += [("additional_info", "str"), ("acquisition_info", "str")]
+    assert len(f) == 161
+    return f
+
+def gamelog_schema():
+    types = {"date": pa.date32(), "int8": pa.int8(), "int16": pa.int16(),
+             "int32": pa.int32(), "str": pa.string()}
+    fields = [(name, types[kind]) for name, kind in gamelog_fields()]
+    return pa.schema(fields + [("game_type", pa.string())])
+
+def _int_or_none(v: str):
+    try:
+        return int(v)
+    except ValueError:
+        return None
+
+def _ymd_date(v: str):
+    try:
+        return date(int(v[:4]), int(v[4:6]), int(v[6:8]))
+    except ValueError:
+        return None
+
+def parse_gamelog_file(path: Path, game_type: str) -> dict[str, list]:
+    """Parse one headerless gamelog file into column lists matching gamelog_schema()."""
+    fields = gamelog_fields()
+    conv = {"date": _ymd_date, "int8": _int_or_none, "int16": _int_or_none, "int32": _int_or_none}
+    # (column list, converter or None) per field index, resolved once per file
+    plan = []
+    cols: dict[str, list] = {}
+    for name, kind in fields:
+        cols[name] = []
+        plan.append((cols[name], conv.get(kind)))
+    n = 0
+    with path.open("r", encoding="latin-1", newline="") as f:
+        for rec in csv.reader(f):
+            if len(rec) < len(plan):
+                rec += [""] * (len(plan) - len(rec))
+            for (col, fn), v in zip(plan, rec):
+                col.append((fn(v) if v else None) if fn else (v or None))
+            n += 1
+    cols["game_type"] = [game_type] * n
+    return cols
+
+def gamelog_output_path(path: Path, out_root: Path) -> Path | None:
+    if not GAMELOG_FILE_RE.match(path.name):
+        return None
+    return out_root / f"{path.stem.upper()}.parquet"
+
+def convert_gamelog_file(src: str, dest: str) -> int:
+    """Process-pool worker: parse one gamelog file and write its Parquet file; returns row count."""
+    suffix = GAMELOG_FILE_RE.match(Path(src).name).group(1).upper()
+    cols = parse_gamelog_file(Path(src), GAMELOG_TYPES.get(suffix, "regular"))
+    return write_parquet(pa.Table.from_pydict(cols, schema=gamelog_schema()), Path(dest))
+
+def gamelogs_to_parquet(src_dir: Path = GAMELOGS_DIR, out_root: Path = PARQUET_DIR / "gamelogs",
+                        procs: int | None = None) -> int:
+    """Convert new/changed gamelog files; returns how many files were written."""
+    todo = stale_files(src_dir, out_root, gamelog_output_path)
+    return convert_parallel("gamelogs", todo, convert_gamelog_file, out_root, procs)
+
+# ---------- Shared ----------
+def write_parquet(table, out: Path) -> int:
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(f".{out.name}.tmp")
+    pq.write_table(table, tmp, compression="zstd")
+    os.replace(tmp, out)
+    return table.num_rows
+
+def stale_files(src_dir: Path, out_root: Path, output_path) -> list[tuple[Path, Path]]:
+    """(src, out) pairs whose output is missing or older than the source."""
+    todo = []
+    if not src_dir.is_dir():
+        return todo
+    for p in sorted(src_dir.iterdir()):
+        out = output_path(p, out_root)
+        if out is None:
+            continue
+        if not out.exists() or out.stat().st_mtime < p.stat().st_mtime:
+            todo.append((p, out))
+    return todo
+
+def convert_parallel(label: str, todo: list[tuple[Path, Path]], worker, out_root: Path,
+                     procs: int | None) -> int:
+    """Run worker(src, dest) for each pair on a process pool; returns files written.
+
+    Every file is attempted; if any failed, raises RuntimeError afterwards so
+    callers don't treat the stage as up to date. Failed outputs are never
+    written, so the next run retries them.
+    """
+    require_pyarrow()
+    if not todo:
+        print(f"  • {label} Parquet up to date ({out_root})")
+        return 0
+    t0 = time.monotonic()
+    rows = written = 0
+    failed = []
+    with ProcessPoolExecutor(max_workers=procs or os.cpu_count()) as ex:
+        futures = {ex.submit(worker, str(src), str(out)): src for src, out in todo}
+        for fut in as_completed(futures):
+            try:
+                rows += fut.result()
+                written += 1
+            except Exception as e:
+                print(f"  ⚠️ {futures[fut].name} → Parquet failed: {e}")
+                failed.append(futures[fut].name)
+    print(f"🧱 {label} Parquet: {written}/{len(todo)} files, {rows} rows in {time.monotonic() - t0:.1f}s → {out_root}")
+    if failed:
+        raise RuntimeError(f"{len(failed)} {label} file(s) failed to convert: {', '.join(sorted(failed))}")
+    return written
+
+# ---------- Main ----------
+def main():
+    ap = argparse.ArgumentParser(description="Convert extracted Retrosheet files to Parquet")
+    sub = ap.add_subparsers(dest="kind", required=True)
+    ev = sub.add_parser("events", help="Event files → plays dataset partitioned by season/team")
+    ev.add_argument("--src", type=Path, default=EVENTS_DIR)
+    ev.add_argument("--out", type=Path, default=PARQUET_DIR / "plays")
+    ev.add_argument("--procs", type=int, default=None, help="Worker processes (default: all CPUs)")
+    gl = sub.add_parser("gamelogs", help="Gamelogs → typed per-game dataset")
+    gl.add_argument("--src", type=Path, default=GAMELOGS_DIR)
+    gl.add_argument("--out", type=Path, default=PARQUET_DIR / "gamelogs")
+    gl.add_argument("--procs", type=int, default=None, help="Worker processes (default: all CPUs)")
+    args = ap.parse_args()
+
+    try:
+        if args.kind == "events":
+            events_to_parquet(args.src, args.out, procs=args.procs)
+        elif args.kind == "gamelogs":
+            gamelogs_to_parquet(args.src, args.out, procs=args.procs)
+    except RuntimeError as e:
+        print(f"⚠️ {e}")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Compare rows/sec of the two CSV load paths in country-analysis-files-upload.py:
+batched INSERT (executemany) vs LOAD DATA LOCAL INFILE.
+
+Start a throwaway MySQL first, e.g.
+    docker run --rm -d --name mlb-bench -p 3307:3306 \
+        -e MYSQL_ROOT_PASSWORD=bench -e MYSQL_DATABASE=bench \
+        mysql:8 --local-infile=1
+then
+    python3 scripts/bench_csv_load.py --port 3307 --password bench --database bench \
+        [--csv mainfiles/plays.csv] [--rows 200000] [--repeat 3]
+
+Without --csv a synthetic plays-like file is generated.
+"""
+import argparse
+import csv
+import importlib.util
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+UPLOAD_SCRIPT = ROOT / "country-analysis-files-upload.py"
+
+
+def load_upload_module():
+    # The uploader's file name has hyphens, so it can't be imported normally.
+    spec = importlib.util.spec_from_file_location("country_analysis_files_upload", UPLOAD_SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def make_synthetic_csv(path: Path, rows: int, cols: int = 40) -> None:
+    rnd = random.Random(42)
+    with path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["gid", "event", "inning", "vis_home", "batter", "pitcher"] + [f"c{i}" for i in range(cols - 6)])
+        for n in range(rows):
+            w.writerow(
+                [f"BOS2010{n // 80:05d}", rnd.choice(["S8", "K", "HR/F7", "W", "63/G, \"x\""]), rnd.randint(1, 9),
+                 rnd.randint(0, 1), f"play{rnd.randint(1, 999):03d}", f"pitc{rnd.randint(1, 999):03d}"]
+                + [rnd.choice(["", "0", "1", str(rnd.randint(0, 500))]) for _ in range(cols - 6)]
+            )
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark INSERT vs LOAD DATA CSV loading")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=3307)
+    ap.add_argument("--user", default="root")
+    ap.add_argument("--password", default="bench")
+    ap.add_argument("--database", default="bench")
+    ap.add_argument("--csv", type=Path, default=None, help="CSV to load (default: generated)")
+    ap.add_argument("--rows", type=int, default=200_000, help="Rows in the generated CSV")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+    args.bulk_load = True  # connect_db enables local_infile from this
+
+    upload = load_upload_module()
+    tmpdir = None
+    csv_path = args.csv
+    if csv_path is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        csv_path = Path(tmpdir.name) / "bench_plays.csv"
+        print(f"[INFO] Generating {args.rows} synthetic rows → {csv_path}")
+        make_synthetic_csv(csv_path, args.rows)
+
+    conn = upload.connect_db(args)
+    table = "bench_csv_load"
+    results = {}
+    try:
+        with conn.cursor() as cur:
+            for label, bulk in (("executemany", False), ("load_data", True)):
+                best = None
+                for _ in range(args.repeat):
+                    metrics = upload.LoadMetrics(table, csv_path)
+                    t0 = time.perf_counter()
+                    rows = upload.load_csv_into_table(cur, csv_path, table, bulk=bulk, metrics=metrics)
+                    conn.commit()
+                    dt = time.perf_counter() - t0
+                    if bulk and metrics.mode != "load_data":
+                        # The loader fell back to INSERT batches; timing it would compare INSERT with INSERT.
+                        print("[ERROR] LOAD DATA was not used (see warning above); is local_infile enabled "
+                              "on the server (--local-infile=1)? Aborting.")
+                        return 1
+                    best = dt if best is None else min(best, dt)
+                results[label] = (rows, best)
+                print(f"[INFO] {label:<12} {rows} rows, best {best:.2f}s → {rows / best:,.0f} rows/s")
+            cur.execute(f"DROP TABLE IF EXISTS `{table}`")
+    finally:
+        conn.close()
+        if tmpdir is not None:
+            tmpdir.cleanup()
+
+    (r1, t1), (r2, t2) = results["executemany"], results["load_data"]
+    if r1 != r2:
+        print(f"[WARN] Row counts differ: executemany={r1}, load_data={r2}")
+    print(f"[INFO] LOAD DATA speedup: {t1 / t2:.1f}x")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
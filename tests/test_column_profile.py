@@ -0,0 +1,101 @@
+"""ColumnProfile type inference and widening in country-analysis-files-upload.py."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_path = Path(__file__).resolve().parents[1] / "country-analysis-files-upload.py"
+_spec = importlib.util.spec_from_file_location("files_upload", _path)
+up = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(up)
+
+
+def profile(*values):
+    return up.profile_columns([[v] for v in values], 1)[0]
+
+
+@pytest.mark.parametrize(
+    "values, sql_type",
+    [
+        (["1", "2", "-3"], "SMALLINT"),
+        (["1", "40000"], "INT"),
+        (["1", "3000000000"], "BIGINT"),
+        (["1", "2.25"], "DECIMAL(3,2)"),
+        (["2024-02-29", ""], "DATE"),
+        (["2023-02-29"], "CHAR(10)"),
+        (["007"], "CHAR(3)"),
+        (["BOS", "NYA"], "CHAR(3)"),
+        (["a", "abcdefghijklmnopq"], "VARCHAR(32)"),
+        (["x" * 300], "TEXT"),
+        (["", ""], "VARCHAR(64)"),
+    ],
+)
+def test_choose_type(values, sql_type):
+    assert profile(*values).sql_type == sql_type
+
+
+def test_blanks_are_null_for_typed_columns_only():
+    p = profile("1", "2")
+    assert p.typed and p.fits("")
+    values, misfits = up.coerce_row(["", "x"], 2, [(0, p)])
+    assert values == (None, "x") and misfits == []
+    assert up.coerce_row(["0"], 1, [(0, p)])[0] == ("0",)
+
+
+def test_fits():
+    p = profile("1", "2")
+    assert p.fits("32767") and not p.fits("32768")
+    assert not p.fits("1.5") and not p.fits("abc")
+    d = profile("1.25")
+    assert d.fits("9.99") and not d.fits("10.5") and not d.fits("1.255")
+
+
+def test_int_to_decimal_keeps_the_int_range():
+    # Only "1" and "2" were sampled; the SMALLINT column may already hold 500.
+    p = profile("1", "2")
+    assert p.widen_for("1.5") == "DECIMAL(6,1)"
+    assert p.fits("32767") and p.fits("-500.5")
+
+
+def test_widening_never_narrows():
+    p = profile("1", "2")
+    assert p.widen_for("40000") == "INT"
+    assert p.widen_for("x") == "VARCHAR(16)"
+    assert p.fits("-2147483648")
+
+    s = profile("ab", "abcd")
+    assert s.widen_blind() == "VARCHAR(255)"
+    assert s.widen_for("x" * 300) == "TEXT"
+    s = profile("ab", "abcd")
+    s.widen_blind()
+    assert s.widen_for("y" * 40) == "VARCHAR(255)"
+
+
+def test_char_widens_to_varchar():
+    p = profile("BOS")
+    assert not p.fits("BOST")
+    assert p.widen_for("BOST") == "VARCHAR(16)"
+
+
+def test_reprofile_columns_jumps_to_the_final_type(tmp_path):
+    csv_path = tmp_path / "t.csv"
+    csv_path.write_text("a,b\n1,x\n500,y\n1.5,z\n70000,w\n", encoding="utf-8")
+    p = profile("1")
+    up.reprofile_columns(csv_path, [(0, p)])
+    assert p.sql_type == "DECIMAL(6,1)"
+    assert all(p.fits(v) for v in ("1", "500", "1.5", "70000"))
+
+
+@pytest.mark.parametrize(
+    "column_type, sql_type",
+    [("smallint(6)", "SMALLINT"), ("int", "INT"), ("decimal(5,2)", "DECIMAL(5,2)"),
+     ("date", "DATE"), ("char(3)", "CHAR(3)"), ("varchar(64)", "VARCHAR(64)")],
+)
+def test_profile_for_column_type(column_type, sql_type):
+    assert up.profile_for_column_type(column_type).sql_type == sql_type
+
+
+def test_profile_for_column_type_unchecked():
+    assert up.profile_for_column_type("text") is None
+    assert up.profile_for_column_type("int unsigned") is None
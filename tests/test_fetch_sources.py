@@ -0,0 +1,196 @@
+"""HTTP download tests for etl/fetch_sources.py against a local stand-in server."""
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "etl"))
+import fetch_sources as fs  # noqa: E402
+
+BODY = bytes(range(256)) * 64  # 16 KiB
+ETAG = '"v1"'
+
+
+class Handler(BaseHTTPRequestHandler):
+    # Per-test knobs, reset by the `server` fixture.
+    fail_first = 0          # answer this many requests with 503 first
+    bad_range_start = None  # answer Range requests with a 206 starting here instead
+    requests = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        cls = type(self)
+        cls.requests.append(dict(self.headers))
+        if cls.fail_first:
+            cls.fail_first -= 1
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+        rng = self.headers.get("Range")
+        if rng and self.headers.get("If-Range") in (None, ETAG):
+            start = int(rng.split("=", 1)[1].rstrip("-"))
+            if start >= len(BODY):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(BODY)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if cls.bad_range_start is not None:
+                start = cls.bad_range_start
+            part = BODY[start:]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(BODY) - 1}/{len(BODY)}")
+            self.send_header("ETag", ETAG)
+            self.send_header("Content-Length", str(len(part)))
+            self.end_headers()
+            self.wfile.write(part)
+            return
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    Handler.fail_first = 0
+    Handler.bad_range_start = None
+    Handler.requests = []
+    monkeypatch.setattr(fs, "CATALOG", fs.Catalog(tmp_path / "catalog.sqlite"))
+    monkeypatch.setattr(fs, "HTTP_BACKOFF", 0.0)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    t = threading.Thread(target=httpd.serve_forever, daemon=True)
+    t.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/file.zip"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def write_partial(dest: Path, nbytes: int):
+    fs.part_path(dest).write_bytes(BODY[:nbytes])
+    fs.validators_path(fs.part_path(dest)).write_text(json.dumps({"etag": ETAG}))
+
+
+def test_200_saves_body_and_validators(server, tmp_path):
+    dest = tmp_path / "file.zip"
+    digest = fs.http_download(server, dest)
+    assert dest.read_bytes() == BODY
+    assert digest == fs.hash_file(dest)
+    assert fs.load_json(fs.validators_path(dest)) == {"etag": ETAG}
+    assert not fs.part_path(dest).exists()
+
+
+def test_304_when_unchanged(server, tmp_path):
+    dest = tmp_path / "file.zip"
+    fs.http_download(server, dest)
+    assert fs.http_download(server, dest, conditional=True) is None
+    assert Handler.requests[-1]["If-None-Match"] == ETAG
+    assert dest.read_bytes() == BODY
+
+
+def test_206_resumes_partial(server, tmp_path):
+    dest = tmp_path / "file.zip"
+    write_partial(dest, 5000)
+    digest = fs.http_download(server, dest)
+    assert Handler.requests[-1]["Range"] == "bytes=5000-"
+    assert dest.read_bytes() == BODY
+    assert digest == fs.hash_file(dest)
+
+
+def test_206_at_wrong_offset_restarts(server, tmp_path):
+    dest = tmp_path / "file.zip"
+    write_partial(dest, 5000)
+    Handler.bad_range_start = 4096
+    fs.http_download(server, dest)
+    assert "Range" not in Handler.requests[-1]
+    assert dest.read_bytes() == BODY
+
+
+def test_416_on_complete_partial_finishes_it(server, tmp_path):
+    dest = tmp_path / "file.zip"
+    write_partial(dest, len(BODY))
+    digest = fs.http_download(server, dest)
+    assert len(Handler.requests) == 1
+    assert dest.read_bytes() == BODY
+    assert digest == fs.hash_file(dest)
+    assert fs.load_json(fs.validators_path(dest)) == {"etag": ETAG}
+
+
+def test_retries_503(server, tmp_path):
+    dest = tmp_path / "file.zip"
+    Handler.fail_first = 2
+    fs.http_download(server, dest)
+    assert len(Handler.requests) == 3
+    assert dest.read_bytes() == BODY
+
+
+def test_gives_up_after_retries(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(fs, "HTTP_RETRIES", 1)
+    Handler.fail_first = 5
+    with pytest.raises(fs.RetryableStatus):
+        fs.http_download(server, tmp_path / "file.zip")
+    assert len(Handler.requests) == 2
+
+
+def make_zip(path: Path, members: dict):
+    import zipfile
+
+    with zipfile.ZipFile(path, "w") as z:
+        for name, data in members.items():
+            z.writestr(name, data)
+
+
+def test_members_dropped_from_archive_are_deleted(tmp_path, monkeypatch):
+    monkeypatch.setattr(fs, "CATALOG", fs.Catalog(tmp_path / "catalog.sqlite"))
+    out = tmp_path / "events"
+    out.mkdir()
+    zip_path = out / "a.zip"
+    src = fs.Source("events", "http://unused/a.zip", out, (".eva", "2010"))
+    make_zip(zip_path, {"2010BOS.EVA": "x", "2011BOS.EVA": "y", "TEAM2010": "t"})
+    assert fs.fetch_archive(src, force=False, purge_zips=False)  # first extraction from the local ZIP
+
+    # The remote archive changes: 2011BOS.EVA and TEAM2010 are gone, but
+    # another archive in the same folder still owns a TEAM2010.
+    (out / ".unzipped.b.zip.json").write_text(json.dumps({"members": {"TEAM2010": {}}}))
+    make_zip(zip_path, {"2010BOS.EVA": "x"})
+    fs.validators_path(zip_path).write_text(json.dumps({"etag": ETAG}))
+    monkeypatch.setattr(fs, "http_download", lambda url, dest, conditional=False: "new-hash")
+    assert fs.fetch_archive(src, force=False, purge_zips=False)
+
+    assert (out / "2010BOS.EVA").exists()
+    assert not (out / "2011BOS.EVA").exists()
+    assert (out / "TEAM2010").exists()
+
+
+def test_finish_runs_even_when_nothing_changed(monkeypatch):
+    ran = []
+    monkeypatch.setattr(fs, "fetch_archive", lambda s, force, purge: False)
+    monkeypatch.setattr(fs, "finish_group", lambda g, d, k: ran.append(g) or True)
+    src = fs.Source("events", "http://unused/2010seve.zip", Path("/nonexistent"), (".eva",))
+    results = fs.run_graph(fs.build_tasks([src], force=False, purge_zips=False), jobs=2)
+    assert ran == ["events"]
+    assert results["finish:events"] is True
+
+
+def test_failed_tasks_are_reported():
+    def boom():
+        raise RuntimeError("1 plays file(s) failed to convert")
+
+    failures = {}
+    results = fs.run_graph({"parquet:events": (boom, [], False)}, jobs=1, failures=failures)
+    assert results["parquet:events"] is False
+    assert list(failures) == ["parquet:events"]
@@ -0,0 +1,67 @@
+"""Parallel CSV parsing in country-analysis-files-upload.py must produce the serial path's rows."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+_path = Path(__file__).resolve().parents[1] / "country-analysis-files-upload.py"
+_spec = importlib.util.spec_from_file_location("files_upload", _path)
+up = importlib.util.module_from_spec(_spec)
+sys.modules["files_upload"] = up  # so worker processes can unpickle parse_chunk
+_spec.loader.exec_module(up)
+
+
+class FakeConnection:
+    pass
+
+
+class FakeCursor:
+    def __init__(self):
+        self.connection = FakeConnection()
+        self.rows = []
+        self.ddl = []
+
+    def execute(self, sql, params=None):
+        self.ddl.append(" ".join(sql.split()))
+
+    def executemany(self, sql, rows):
+        self.rows.extend(rows)
+
+
+def serial_rows(csv_path, checked, width):
+    import csv
+
+    cur = FakeCursor()
+    with csv_path.open(newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)
+        for row in reader:
+            values, misfits = up.coerce_row(row, width, checked)
+            for i, v in misfits:
+                p = dict(checked)[i]
+                if not p.fits(v):
+                    up.widen_column(cur, "t", f"c{i}", p.widen_for(v))
+            cur.rows.append(values)
+    return cur.rows, cur.ddl
+
+
+def test_parallel_matches_serial_across_a_widen(tmp_path):
+    csv_path = tmp_path / "t.csv"
+    lines = ["a,b"] + [",1", "5,", "abc,2", ",", "7,3", "1"]
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    sample = [["5", "1"], ["7", "2"]]
+
+    def checked():
+        profiles = up.profile_columns(sample, 2)
+        return [(i, p) for i, p in enumerate(profiles)]
+
+    expected, expected_ddl = serial_rows(csv_path, checked(), 2)
+    assert expected[0] == (None, "1") and expected[3] == ("", None)
+
+    cur = FakeCursor()
+    sizer = up.BatchSizer(cur)
+    insert_sql = "INSERT INTO `t` (`c0`,`c1`) VALUES (%s,%s)"
+    n = up.insert_rows_parallel(cur, csv_path, "t", ["c0", "c1"], checked(), insert_sql, 2, sizer)
+    assert n == len(expected)
+    assert cur.rows == expected
+    assert cur.ddl == expected_ddl
@@ -0,0 +1,26 @@
+"""Failure reporting of the Parquet conversion stage (etl/retrosheet_parquet.py)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "etl"))
+import retrosheet_parquet as rp  # noqa: E402
+
+
+def fake_worker(src: str, dest: str) -> int:
+    if src.endswith("BAD"):
+        raise ValueError("unparseable")
+    Path(dest).write_text("ok")
+    return 10
+
+
+def test_convert_parallel_counts_only_written_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(rp, "require_pyarrow", lambda: None)
+    todo = [(tmp_path / name, tmp_path / f"{name}.parquet") for name in ("A", "B", "BAD")]
+    with pytest.raises(RuntimeError, match="1 plays file"):
+        rp.convert_parallel("plays", todo, fake_worker, tmp_path, procs=2)
+    assert (tmp_path / "A.parquet").exists() and not (tmp_path / "BAD.parquet").exists()
+
+    assert rp.convert_parallel("plays", todo[:2], fake_worker, tmp_path, procs=2) == 2